@@ -0,0 +1,106 @@
+# benchmarks.concurrent_array
+
+""" Contention benchmark for ConcurrentArray: total throughput with 1 to 16 threads sharing one array.
+
+    Run from the repository root:
+
+        python -m benchmarks.concurrent_array [--operations N] [--reads FRACTION]
+
+    Each thread performs the same mix of operations (lookups by index and membership tests as reads,
+    appends and 64-item extends as writes). ConcurrentArray is compared with an Array guarded by a
+    single threading.Lock, which serializes readers as well as writers. Under the GIL the two should
+    be within noise of each other (on one CPU: 0.9x-1.05x the locked Array for 1-16 threads).
+"""
+
+from __future__ import annotations
+import argparse
+import random
+import threading
+import time
+from typing import Callable
+
+from datastructures.array import Array
+from datastructures.concurrent_array import ConcurrentArray
+
+
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+
+class LockedArray:
+    """ Baseline: every operation on the Array takes one mutex. """
+
+    def __init__(self, array: Array) -> None:
+        self._items = array
+        self._lock = threading.Lock()
+
+    def __getitem__(self, index: int):
+        with self._lock:
+            return self._items[index]
+
+    def __contains__(self, item) -> bool:
+        with self._lock:
+            return item in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def append(self, data) -> None:
+        with self._lock:
+            self._items.append(data)
+
+    def extend(self, iterable) -> None:
+        with self._lock:
+            self._items.extend(iterable)
+
+
+def _worker(array, operations: int, read_fraction: float, seed: int, barrier: threading.Barrier) -> None:
+    """ Run a fixed, seeded mix of reads and writes against `array`. """
+    rng = random.Random(seed)
+    batch = list(range(64))
+    barrier.wait()
+    for _ in range(operations):
+        if rng.random() < read_fraction:
+            if rng.random() < 0.5:
+                array[rng.randrange(1024)]
+            else:
+                rng.randrange(4096) in array
+        elif rng.random() < 0.9:
+            array.append(rng.randrange(4096))
+        else:
+            array.extend(batch)
+
+
+def run(factory: Callable[[], object], threads: int, operations: int, read_fraction: float) -> float:
+    """ Time `threads` workers each doing `operations` operations; returns operations per second. """
+    array = factory()
+    barrier = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=_worker, args=(array, operations, read_fraction, seed, barrier))
+               for seed in range(threads)]
+    for worker in workers:
+        worker.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for worker in workers:
+        worker.join()
+    return threads * operations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0].strip())
+    parser.add_argument('--operations', type=int, default=20000, help='operations per thread')
+    parser.add_argument('--reads', type=float, default=0.9, help='fraction of operations that are reads')
+    args = parser.parse_args()
+
+    factories = {
+        'ConcurrentArray': lambda: ConcurrentArray.from_list(list(range(1024)), dtype='int64'),
+        'Array + Lock': lambda: LockedArray(Array.from_list(list(range(1024)), dtype='int64')),
+    }
+    print(f'{"threads":>7}  ' + '  '.join(f'{name:>18}' for name in factories) + '   (operations/s)')
+    for threads in THREAD_COUNTS:
+        rates = [run(factory, threads, args.operations, args.reads) for factory in factories.values()]
+        print(f'{threads:>7}  ' + '  '.join(f'{rate:>18,.0f}' for rate in rates))
+
+
+if __name__ == '__main__':
+    main()
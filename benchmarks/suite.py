@@ -0,0 +1,389 @@
+# benchmarks.suite
+
+""" Benchmark suite for the datastructures package, with JSON results and regression tracking.
+
+    Run from the repository root:
+
+        python -m benchmarks.suite run [--sizes 10 1000 ...] [--structures Array list ...]
+                                       [--operations N] [--repeat R] [--output results.json]
+                                       [--baseline old.json] [--threshold 0.10]
+        python -m benchmarks.suite compare old.json new.json [--threshold 0.10]
+
+    Every structure is timed on the same operations (append, random get/set, delete, contains,
+    iteration, resize and from_list) at each size, next to list, collections.deque and raw numpy.
+    Results are reported as seconds per operation (per item for iteration and from_list, per call
+    for resize), taking the best of --repeat runs on a freshly built structure.
+    Operations a structure does not support, or that raise NotImplementedError, are reported as skipped.
+    compare (or run --baseline) lists every case that got slower by more than the threshold, and every
+    baseline case that is missing from the new results (it raised, became unimplemented or was renamed),
+    and exits with status 1 if there is any, so it can gate a CI job.
+"""
+
+from __future__ import annotations
+import argparse
+from collections import deque
+import json
+import platform
+import random
+import sys
+import time
+from typing import Any, Callable
+
+import numpy as np
+
+from datastructures.array import Array
+from datastructures.array2d import Array2D
+from datastructures.linked_list import LinkedList
+
+
+SIZES = (10, 1_000, 100_000, 10_000_000)
+OPERATIONS = ('append', 'get', 'set', 'delete', 'contains', 'iterate', 'resize', 'from_list')
+# per-operation cases whose cost grows with the size run fewer operations on large structures
+LINEAR_BUDGET = 10_000_000
+GRID_COLUMNS = 10
+
+
+class Subject:
+    """ A structure under test: how to build it from a list and how to run each operation on it. """
+
+    def __init__(self, name: str, build: Callable[[list], Any], operations: dict[str, Callable],
+                 linear: tuple[str, ...] = ('delete', 'contains')) -> None:
+        self.name = name
+        self.build = build
+        self.operations = operations
+        self.linear = linear
+
+
+def _append(structure: Any, values: list) -> None:
+    for value in values:
+        structure.append(value)
+
+
+def _get(structure: Any, indices: list) -> None:
+    for index in indices:
+        structure[index]
+
+
+def _set(structure: Any, indices: list) -> None:
+    for index in indices:
+        structure[index] = index
+
+
+def _delete(structure: Any, indices: list) -> None:
+    for index in indices:
+        del structure[index]
+
+
+def _contains(structure: Any, probes: list) -> None:
+    for probe in probes:
+        probe in structure
+
+
+def _iterate(structure: Any, _: list) -> None:
+    for _ in structure:
+        pass
+
+
+def _resize_list(structure: list, _: list) -> None:
+    size = len(structure)
+    structure.extend([None] * size)
+    del structure[size:]
+
+
+def _resize_array(structure: Array, _: list) -> None:
+    size = len(structure)
+    structure.resize(2 * size)
+    structure.resize(size)
+
+
+def _numpy_append(structure: list, values: list) -> None:
+    # numpy arrays are immutable in size: np.append copies, so the result is kept in a one-item box
+    for value in values:
+        structure[0] = np.append(structure[0], value)
+
+
+def _numpy_delete(structure: list, indices: list) -> None:
+    for index in indices:
+        structure[0] = np.delete(structure[0], index)
+
+
+def _numpy_resize(structure: list, _: list) -> None:
+    size = len(structure[0])
+    structure[0] = np.resize(structure[0], 2 * size)[:size].copy()
+
+
+def _numpy_operation(operation: Callable) -> Callable:
+    """ Run a regular operation on the ndarray held in a one-item box. """
+    return lambda structure, arguments: operation(structure[0], arguments)
+
+
+def _grid(values: list) -> Array2D:
+    grid = Array2D(rows=-(-len(values) // GRID_COLUMNS), columns=GRID_COLUMNS)
+    for index, value in enumerate(values):
+        grid[index // GRID_COLUMNS][index % GRID_COLUMNS] = value
+    return grid
+
+
+def _grid_get(grid: Array2D, indices: list) -> None:
+    for index in indices:
+        grid[index // GRID_COLUMNS][index % GRID_COLUMNS]
+
+
+def _grid_set(grid: Array2D, indices: list) -> None:
+    for index in indices:
+        grid[index // GRID_COLUMNS][index % GRID_COLUMNS] = index
+
+
+def _grid_append(grid: Array2D, values: list) -> None:
+    # a grid grows a row at a time
+    rows, _ = grid.dimensions
+    for _ in range(len(values) // GRID_COLUMNS + 1):
+        rows += 1
+        grid.resize_rows(rows)
+
+
+def _grid_resize(grid: Array2D, _: list) -> None:
+    rows, _ = grid.dimensions
+    grid.resize_rows(2 * rows)
+    grid.resize_rows(rows)
+
+
+def _linked_list_delete(linked_list: LinkedList, values: list) -> None:
+    for value in values:
+        linked_list.extract(value)
+
+
+SUBJECTS = (
+    Subject('Array', lambda values: Array.from_list(values), {
+        'append': _append, 'get': _get, 'set': _set, 'delete': _delete, 'contains': _contains,
+        'iterate': _iterate, 'resize': _resize_array, 'from_list': Array.from_list}),
+    Subject('Array[int64]', lambda values: Array.from_list(values, dtype='int64'), {
+        'append': _append, 'get': _get, 'set': _set, 'delete': _delete, 'contains': _contains,
+        'iterate': _iterate, 'resize': _resize_array,
+        'from_list': lambda values: Array.from_list(values, dtype='int64')}),
+    Subject('Array2D', _grid, {
+        'append': _grid_append, 'get': _grid_get, 'set': _grid_set, 'contains': _contains,
+        'resize': _grid_resize, 'from_list': _grid}),
+    Subject('LinkedList', LinkedList.from_list, {
+        'append': _append, 'delete': _linked_list_delete, 'contains': _contains, 'iterate': _iterate,
+        'from_list': LinkedList.from_list}, linear=('get', 'set', 'delete', 'contains')),
+    Subject('list', list, {
+        'append': _append, 'get': _get, 'set': _set, 'delete': _delete, 'contains': _contains,
+        'iterate': _iterate, 'resize': _resize_list, 'from_list': list}),
+    Subject('deque', deque, {
+        'append': _append, 'get': _get, 'set': _set, 'delete': _delete, 'contains': _contains,
+        'iterate': _iterate, 'from_list': deque}, linear=('get', 'set', 'delete', 'contains')),
+    Subject('numpy', lambda values: [np.array(values)], {
+        'append': _numpy_append, 'get': _numpy_operation(_get), 'set': _numpy_operation(_set),
+        'delete': _numpy_delete, 'contains': _numpy_operation(_contains),
+        'iterate': _numpy_operation(_iterate), 'resize': _numpy_resize,
+        'from_list': np.array}, linear=('append', 'delete', 'contains')),
+)
+
+
+def _arguments(operation: str, size: int, count: int, rng: random.Random) -> list:
+    """ The values, indices or probes an operation is run with. """
+    if operation == 'append':
+        return list(range(size, size + count))
+    if operation in ('get', 'set'):
+        return [rng.randrange(size) for _ in range(count)]
+    if operation == 'delete':
+        # indices stay valid while the structure shrinks by one per delete
+        return [rng.randrange(size - offset) for offset in range(count)]
+    if operation == 'contains':
+        # half of the probes are present, half are not
+        return [rng.randrange(size) if offset % 2 else -1 - offset for offset in range(count)]
+    return []
+
+
+def _operation_count(subject: Subject, operation: str, size: int, operations: int) -> int:
+    """ How many operations to time: `size` items for the bulk operations, one call for resize. """
+    if operation in ('iterate', 'from_list'):
+        return size
+    if operation == 'resize':
+        return 1
+    if operation in subject.linear:
+        operations = min(operations, max(1, LINEAR_BUDGET // size))
+    return min(operations, size) if operation == 'delete' else operations
+
+
+def time_case(subject: Subject, operation: str, size: int, operations: int, repeat: int,
+              seed: int = 0) -> tuple[int, float]:
+    """ Time one operation on one structure; returns the number of operations and the best time in seconds.
+
+    Raises:
+        NotImplementedError: if the structure does not implement something the case needs.
+    """
+    count = _operation_count(subject, operation, size, operations)
+    run = subject.operations[operation]
+    values = list(range(size))
+    best = float('inf')
+    for attempt in range(repeat):
+        arguments = _arguments(operation, size, count, random.Random(seed + attempt))
+        if operation == 'from_list':
+            start = time.perf_counter()
+            run(values)
+        else:
+            structure = subject.build(values)
+            start = time.perf_counter()
+            run(structure, arguments)
+        best = min(best, time.perf_counter() - start)
+    return count, best
+
+
+def run_suite(sizes: tuple[int, ...] = SIZES, structures: tuple[str, ...] | None = None,
+              operations: int = 1_000, repeat: int = 3, progress: Callable[[str], None] | None = None) -> dict:
+    """ Run every case and collect the results in the JSON layout used by compare().
+
+    Args:
+        sizes (tuple[int, ...]): the structure sizes (default is 10 to 10M).
+        structures (tuple[str, ...] | None): the subject names to run (default is None, all of them).
+        operations (int): the number of per-item operations timed per case (default is 1000).
+        repeat (int): the number of runs per case; the best one is kept (default is 3).
+        progress (Callable | None): called with a line of text after each case (default is None).
+
+    Returns:
+        report (dict): 'meta', 'results' (one entry per case), 'skipped' (unsupported or unimplemented
+            cases) and 'errors' (cases that raised any other exception).
+    """
+    results, skipped, errors = [], [], []
+    for subject in SUBJECTS:
+        if structures is not None and subject.name not in structures:
+            continue
+        for size in sizes:
+            for operation in OPERATIONS:
+                if operation not in subject.operations:
+                    skipped.append({'structure': subject.name, 'operation': operation, 'size': size,
+                                    'reason': 'not supported'})
+                    continue
+                try:
+                    count, seconds = time_case(subject, operation, size, operations, repeat)
+                except NotImplementedError as error:
+                    skipped.append({'structure': subject.name, 'operation': operation, 'size': size,
+                                    'reason': f'NotImplementedError: {error}'})
+                    continue
+                except Exception as error:
+                    # a broken structure must not stop the rest of the suite; it is reported instead
+                    errors.append({'structure': subject.name, 'operation': operation, 'size': size,
+                                   'error': f'{type(error).__name__}: {error}'})
+                    continue
+                result = {'structure': subject.name, 'operation': operation, 'size': size,
+                          'operations': count, 'seconds': seconds, 'seconds_per_op': seconds / max(count, 1)}
+                results.append(result)
+                if progress is not None:
+                    progress(f'{subject.name:>12} {operation:>9} {size:>10,} {result["seconds_per_op"] * 1e9:>14,.1f} ns/op')
+    meta = {'python': sys.version.split()[0], 'numpy': np.__version__, 'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'repeat': repeat, 'operations': operations,
+            'sizes': list(sizes), 'structures': list(structures) if structures is not None else None}
+    return {'meta': meta, 'results': results, 'skipped': skipped, 'errors': errors}
+
+
+def _in_scope(result: dict, meta: dict) -> bool:
+    """ True if the run described by `meta` covered the structure and size of `result`. Reports without
+        the 'sizes'/'structures' meta entries are treated as covering every case.
+    """
+    sizes, structures = meta.get('sizes'), meta.get('structures')
+    return (sizes is None or result['size'] in sizes) and (structures is None or result['structure'] in structures)
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> list[dict]:
+    """ Find the cases that got slower by more than `threshold` (0.10 = 10%), and the baseline cases that
+        have no result in the current report although it covered their structure and size (the case
+        raised, became unimplemented or was renamed). Cases that are new in the current report are ignored.
+
+    Args:
+        baseline (dict): an earlier report from run_suite().
+        current (dict): the report to check.
+        threshold (float): the allowed slowdown as a fraction (default is 0.10).
+
+    Returns:
+        problems (list[dict]): structure, operation, size, status ('missing' or 'regression'), baseline
+            and current seconds_per_op (current is None when missing), the slowdown ratio (None when
+            missing) and, for missing cases, the reason; missing cases first, then the worst regressions.
+    """
+    def key(result: dict) -> tuple:
+        return result['structure'], result['operation'], result['size']
+
+    now = {key(result): result['seconds_per_op'] for result in current['results']}
+    reasons = {key(case): case['error'] for case in current.get('errors', [])}
+    reasons.update({key(case): case['reason'] for case in current.get('skipped', [])})
+    missing, regressions = [], []
+    for result in baseline['results']:
+        old = result['seconds_per_op']
+        new = now.get(key(result))
+        if new is None:
+            if _in_scope(result, current.get('meta', {})):
+                missing.append({'structure': result['structure'], 'operation': result['operation'],
+                                'size': result['size'], 'status': 'missing', 'baseline': old, 'current': None,
+                                'ratio': None, 'reason': reasons.get(key(result), 'not in the current results')})
+            continue
+        if old <= 0:
+            continue
+        ratio = new / old
+        if ratio > 1 + threshold:
+            regressions.append({'structure': result['structure'], 'operation': result['operation'],
+                                'size': result['size'], 'status': 'regression', 'baseline': old, 'current': new,
+                                'ratio': ratio})
+    return missing + sorted(regressions, key=lambda regression: regression['ratio'], reverse=True)
+
+
+def _report_regressions(problems: list[dict], threshold: float) -> int:
+    """ Print the regressions and missing cases; returns the process exit status. """
+    if not problems:
+        print(f'no regressions above {threshold:.0%} and no missing cases')
+        return 0
+    regressions = sum(problem['status'] == 'regression' for problem in problems)
+    print(f'{regressions} regression(s) above {threshold:.0%}, {len(problems) - regressions} missing case(s):')
+    for problem in problems:
+        case = f'{problem["structure"]:>12} {problem["operation"]:>9} {problem["size"]:>10,}'
+        if problem['status'] == 'missing':
+            print(f'{case} {problem["baseline"] * 1e9:>12,.1f} ns/op -> missing ({problem["reason"]})')
+        else:
+            print(f'{case} {problem["baseline"] * 1e9:>12,.1f} -> {problem["current"] * 1e9:>12,.1f} ns/op'
+                  f' ({problem["ratio"] - 1:+.0%})')
+    return 1
+
+
+def _load(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0].strip())
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    run_parser.add_argument('--structures', nargs='+', choices=[subject.name for subject in SUBJECTS])
+    run_parser.add_argument('--operations', type=int, default=1_000, help='operations timed per case')
+    run_parser.add_argument('--repeat', type=int, default=3, help='runs per case (the best is kept)')
+    run_parser.add_argument('--output', help='write the results to this JSON file')
+    run_parser.add_argument('--baseline', help='compare against this earlier JSON file')
+    run_parser.add_argument('--threshold', type=float, default=0.10, help='allowed slowdown (0.10 = 10%%)')
+
+    compare_parser = commands.add_parser('compare', help='compare two JSON result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10, help='allowed slowdown (0.10 = 10%%)')
+
+    args = parser.parse_args(argv)
+    if args.command == 'compare':
+        return _report_regressions(compare(_load(args.baseline), _load(args.current), args.threshold), args.threshold)
+
+    report = run_suite(tuple(args.sizes), tuple(args.structures) if args.structures else None,
+                       args.operations, args.repeat, progress=print)
+    if report['skipped']:
+        print(f'skipped {len(report["skipped"])} unsupported or unimplemented case(s)')
+    for error in report['errors']:
+        print(f'error: {error["structure"]} {error["operation"]} {error["size"]:,}: {error["error"]}')
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    if args.baseline:
+        return _report_regressions(compare(_load(args.baseline), report, args.threshold), args.threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,9 +7,146 @@
 """
 
 
-from typing import Any
+from itertools import islice
+import os
+import copy
+from enum import Enum
+import pickle
+from typing import Any, Callable, Iterable
+import weakref
 import numpy as np
 
+from datastructures.array_file import HEADER_SIZE, encode_header, read_header
+from datastructures import buffer_pool
+from datastructures.buffer_pool import BufferPool
+from datastructures.growth_policy import GrowthPolicy, DoublingGrowth
+from datastructures.hash_index import HashIndex
+from datastructures import parallel
+
+
+# numpy dtypes an Array can store natively (without boxing every item as a Python object).
+_TYPED_DTYPES = tuple(np.dtype(name) for name in (
+    'bool',
+    'int8', 'int16', 'int32', 'int64',
+    'uint8', 'uint16', 'uint32', 'uint64',
+    'float16', 'float32', 'float64',
+))
+
+# number of items pulled from an unsized iterable (e.g. a generator) per block copy.
+_EXTEND_CHUNK_SIZE = 65536
+
+# number of items a vectorized LazyArray pipeline processes per block.
+_LAZY_BLOCK_SIZE = 4096
+
+
+def _match_items(values: np.ndarray, item: Any) -> np.ndarray:
+    """ Compare every element of `values` to `item` in one numpy pass, returning a boolean mask. """
+    if values.dtype.kind == 'O':
+        # wrap the item in a 0-d array so numpy compares it as one object, even if it is a list or tuple
+        probe = np.empty((), dtype=object)
+        probe[()] = item
+        return np.asarray(values == probe, dtype=bool)
+
+    if np.ndim(item) != 0:
+        return np.zeros(len(values), dtype=bool)
+    try:
+        mask = values == item
+    except (TypeError, ValueError):
+        return np.zeros(len(values), dtype=bool)
+    return mask if isinstance(mask, np.ndarray) else np.zeros(len(values), dtype=bool)
+
+
+# the instance dicts of Arrays whose buffer must be given up when they are collected, keyed by id() of
+# the weak reference whose callback does it (see Array._track_buffer). The dict holds that reference.
+_buffer_hooks: dict[int, dict] = {}
+
+
+def _release_buffer(reference: weakref.ref) -> None:
+    """ Weak reference callback of a collected Array: release its share of a buffer used by snapshots,
+        so the others can write without copying, and give the buffer back to the pool if the Array was
+        its last user.
+    """
+    state = _buffer_hooks.pop(id(reference))
+    owners = state['_owners']
+    if state['_pool'] is not None and (owners is None or owners[0] <= 1):
+        state['_pool'].release(state['_items'])
+    if owners is not None:
+        owners[0] -= 1
+        state['_owners'] = None
+
+
+# Python scalar types whose values numpy can sort natively once converted (e.g. str -> '<U').
+_NATIVE_KEY_TYPES = (bool, int, float, str, bytes)
+
+
+def _sort_keys(values: np.ndarray, key: Any = None) -> np.ndarray:
+    """ Build the array `values` are sorted by. Keys are extracted once per item (or in one call for
+        a numpy ufunc) and, when they are all of one plain scalar type, converted to a typed array
+        so the sort runs in C instead of calling Python comparisons.
+    """
+    if key is None:
+        keys = values
+    elif isinstance(key, np.ufunc):
+        keys = key(values)
+    else:
+        keys = np.fromiter((key(item) for item in values), dtype=object, count=len(values))
+
+    if keys.dtype.kind != 'O' or len(keys) == 0:
+        return keys
+    key_types = set(map(type, keys))
+    key_type = key_types.pop() if len(key_types) == 1 else None
+    if key_type is None or not issubclass(key_type, _NATIVE_KEY_TYPES):
+        return keys
+    if issubclass(key_type, (str, bytes)):
+        # numpy strips trailing NULs from '<U'/'S' items, which would make 'a\x00' sort equal to 'a'
+        nul = '\x00' if issubclass(key_type, str) else b'\x00'
+        if any(item.endswith(nul) for item in keys.tolist()):
+            return keys
+    try:
+        typed = np.array(keys.tolist())
+    except (OverflowError, ValueError):
+        return keys
+    return typed if typed.shape == keys.shape and typed.dtype.kind != 'O' else keys
+
+
+def _argsort(keys: np.ndarray, reverse: bool = False, stable: bool = True) -> np.ndarray:
+    """ Argsort `keys`. A stable reverse sort keeps equal keys in their original order, like sorted(). """
+    kind = 'stable' if stable else 'quicksort'
+    if not reverse:
+        return np.argsort(keys, kind=kind)
+    if not stable:
+        return np.argsort(keys, kind=kind)[::-1]
+    # reverse, stable sort, reverse: equal keys end up back in their original order
+    return len(keys) - 1 - np.argsort(keys[::-1], kind=kind)[::-1]
+
+
+def _typed_values(values: np.ndarray) -> np.ndarray:
+    """ Convert an object array to a typed one when every item is a numeric or bool scalar of one type. """
+    item_types = set(map(type, values))
+    if len(item_types) != 1:
+        return values
+    item_type = item_types.pop()
+    if issubclass(item_type, np.generic):
+        return values.astype(item_type) if np.dtype(item_type) in _TYPED_DTYPES else values
+    if item_type in (bool, int, float):
+        try:
+            typed = np.array(values.tolist())
+        except OverflowError:
+            return values
+        return typed if typed.dtype in _TYPED_DTYPES else values
+    return values
+
+
+# exact types whose instances deepcopy returns unchanged; Enum members and numpy scalars are checked separately.
+_IMMUTABLE_TYPES = frozenset((type(None), bool, int, float, complex, str, bytes))
+
+
+def _all_immutable(values: np.ndarray) -> bool:
+    """ Check whether every item is of a type that copy.deepcopy would return unchanged. """
+    return all(item_type in _IMMUTABLE_TYPES or issubclass(item_type, (Enum, np.generic))
+               for item_type in set(map(type, values)))
+
+
 class Array:
     """Array class - representing a one-dimensional array.
         Stipulations:
@@ -18,8 +155,12 @@ class Array:
                raising appropriate exceptions where indicated.
     """
 
-    def __init__(self, size: int = 0, default_item_value: Any = None) -> None:
+    def __init__(self, size: int = 0, default_item_value: Any = None, dtype: Any = object,
+                 growth_policy: GrowthPolicy | None = None, indexed: bool = False,
+                 pool: BufferPool | None = None) -> None:
         """ Array Constructor. Initializes the Array with a default capacity and default value.
+            By default items are stored as Python objects. Passing a numeric or bool dtype stores
+            the items in a native numpy buffer instead, so they are not boxed one by one.
 
         Examples:
             >>> array_one = Array()
@@ -31,21 +172,351 @@ class Array:
             >>> array_three = Array(size=10, default_item_value=0)
             >>> print(array_three)
             [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+            >>> array_four = Array(size=3, dtype='int64')
+            >>> print(array_four)
+            [0 0 0]
 
         Args:
             size (int): the desired capacity of the Array (default is 0)
-            default_item_value (Any): the desired default value of the Array (default is None)
+            default_item_value (Any): the desired default value of the Array (default is None,
+                which becomes zero/False for typed dtypes)
+            dtype (Any): object (default), bool, int8-int64, uint8-uint64 or float16-float64.
+            growth_policy (GrowthPolicy): decides how the capacity grows and shrinks 
+                (default is DoublingGrowth()).
+            indexed (bool): keep a HashIndex of the items for O(1) membership tests (default is False).
+            pool (BufferPool | None): recycle buffers through this pool (default is None, the pool set
+                with buffer_pool.set_default_pool(), if any).
 
         Returns:
             None
+        
+        Raises:
+            TypeError: if dtype is not supported, or if indexed and default_item_value is not hashable.
         """
-        self._items = np.array([default_item_value] * size, dtype=object)
+        self._dtype = Array._validate_dtype(dtype)
+        if self._dtype.kind != 'O' and default_item_value is None:
+            default_item_value = self._dtype.type(0)
         self._default_item_value = default_item_value
+        self._growth_policy = growth_policy if growth_policy is not None else DoublingGrowth()
+        self._pool = pool if pool is not None else buffer_pool.default_pool()
+        self._items = self._allocate(size)
         self._logical_size = size
         self._physical_size = size
+        self._owners: list[int] | None = None
+        self._buffer_hook: weakref.ref | None = None
+        self._index: HashIndex | None = None
+        if self._pool is not None:
+            self._track_buffer()
+        if indexed:
+            self.build_index()
+
+    @staticmethod
+    def _validate_dtype(dtype: Any) -> np.dtype:
+        """ Normalize dtype to a numpy dtype, raising TypeError if the Array cannot store it. """
+        try:
+            dtype = np.dtype(dtype)
+        except TypeError:
+            raise TypeError(f'Unsupported dtype {dtype!r}')
+        if dtype.kind != 'O' and dtype not in _TYPED_DTYPES:
+            raise TypeError(f'Unsupported dtype {dtype!r}')
+        return dtype
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        """ Allocate a new backing buffer of the given capacity filled with the default value.
+            A typed buffer whose default is all zero bytes is allocated zeroed instead of being
+            filled, so the operating system only provides its pages once they are written.
+        """
+        if self._pool is not None:
+            items = self._pool.acquire(capacity, self._dtype)
+        elif self._dtype.kind != 'O' and not np.asarray(self._default_item_value, dtype=self._dtype).tobytes().strip(b'\0'):
+            return np.zeros(capacity, dtype=self._dtype)
+        else:
+            items = np.empty(capacity, dtype=self._dtype)
+        items.fill(self._default_item_value)
+        return items
+
+    def _release(self) -> None:
+        """ Give the buffer back to the pool before it is replaced, unless a snapshot still shares it. """
+        if self._pool is not None and (self._owners is None or self._owners[0] <= 1):
+            self._pool.release(self._items)
+
+    def _track_buffer(self) -> None:
+        """ Register a hook that gives up this Array's buffer when the Array is collected. Only pooled
+            Arrays and Arrays sharing a buffer with a snapshot need one, so plain Arrays are created and
+            collected without any finalization cost.
+        """
+        if self._buffer_hook is None:
+            # the hook reads the instance dict, so it sees the current buffer without keeping self alive
+            self._buffer_hook = weakref.ref(self, _release_buffer)
+            _buffer_hooks[id(self._buffer_hook)] = self.__dict__
+
+    def _reallocate(self, new_capacity: int) -> None:
+        """ Move the logical items into a new buffer of the given capacity with one block copy. """
+        new_items = self._allocate(new_capacity)
+        copy_size = min(self._logical_size, new_capacity)
+        new_items[:copy_size] = self._items[:copy_size]
+        self._release()
+        self._detach()
+        self._items = new_items
+        self._physical_size = new_capacity
+
+    def _grow_to(self, required: int) -> None:
+        """ Grow the buffer per the growth policy so it holds at least `required` items. """
+        if required > self._physical_size:
+            self._reallocate(max(required, self._growth_policy.grow(self._physical_size, required)))
+
+    def _to_block(self, items: Iterable) -> np.ndarray:
+        """ Convert a sized iterable into a 1-D numpy array of this Array's dtype (no copy when possible). """
+        if isinstance(items, Array):
+            block = items._items[:items._logical_size]
+        elif isinstance(items, np.ndarray):
+            block = items
+        else:
+            return np.fromiter(items, dtype=self._dtype, count=len(items))
+        if block.ndim != 1:
+            raise ValueError('Input must be one-dimensional')
+        return block.astype(self._dtype, copy=False)
+
+    def _adopt(self, items: np.ndarray) -> None:
+        """ Use `items` as the backing buffer, with every element of it being a logical item. """
+        self._release()
+        self._detach()
+        self._items = items
+        self._logical_size = self._physical_size = len(items)
+
+    def _detach(self) -> None:
+        """ Stop sharing the buffer with snapshots, e.g. because it is about to be replaced. """
+        if self._owners is not None:
+            self._owners[0] -= 1
+            self._owners = None
+
+    def _ensure_writable(self) -> None:
+        """ Copy the buffer before the first in-place write if it is still shared with a snapshot. """
+        if self._owners is not None:
+            if self._owners[0] > 1:
+                self._items = self._items.copy()
+            self._detach()
+
+    def _guard_export(self, values: np.ndarray) -> np.ndarray:
+        """ Return `values` for use outside the Array: read-only while the buffer is shared with a snapshot. """
+        if self._owners is not None and self._owners[0] > 1:
+            values = values.view()
+            values.flags.writeable = False
+        return values
+
+    def _shrink_if_sparse(self) -> None:
+        """ Shrink the buffer if the growth policy says too much of it is unused. """
+        new_capacity = self._growth_policy.shrink(self._physical_size, self._logical_size)
+        if new_capacity is not None and self._logical_size <= new_capacity < self._physical_size:
+            self._reallocate(new_capacity)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Property for getting the numpy dtype the Array stores its items as.
+
+        Examples:
+            >>> print(Array().dtype)
+            object
+            >>> print(Array(dtype='float32').dtype)
+            float32
+
+        Returns:
+            dtype (np.dtype): the dtype of the internal numpy array.
+        """
+        return self._dtype
+
+    @property
+    def capacity(self) -> int:
+        """ Property for getting the physical capacity of the Array (items it can hold without reallocating).
+
+        Examples:
+            >>> array = Array(size=3)
+            >>> array.reserve(10)
+            >>> print(array.capacity)
+            10
+            >>> print(len(array))
+            3
+
+        Returns:
+            capacity (int): the size of the internal buffer.
+        """
+        return self._physical_size
+
+    @property
+    def growth_policy(self) -> GrowthPolicy:
+        """ Property for getting or setting the GrowthPolicy of the Array.
+
+        Examples:
+            >>> from datastructures.growth_policy import ChunkGrowth
+            >>> array = Array()
+            >>> array.growth_policy = ChunkGrowth(chunk_size=100)
+            >>> array.append(1)
+            >>> print(array.capacity)
+            100
+
+        Returns:
+            growth_policy (GrowthPolicy): the policy used when the Array grows or shrinks.
+        """
+        return self._growth_policy
+
+    @growth_policy.setter
+    def growth_policy(self, growth_policy: GrowthPolicy) -> None:
+        if not isinstance(growth_policy, GrowthPolicy):
+            raise TypeError('growth_policy must be a GrowthPolicy')
+        self._growth_policy = growth_policy
+
+    def reserve(self, capacity: int) -> None:
+        """ Make sure the Array can hold at least `capacity` items without reallocating.
+            Does nothing if the capacity is already large enough. Never changes the length.
+
+        Examples:
+            >>> array = Array()
+            >>> array.reserve(1000)
+            >>> print(array.capacity, len(array))
+            1000 0
+
+        Args:
+            capacity (int): the minimum capacity.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if capacity is less than 0.
+        """
+        if capacity < 0:
+            raise ValueError('capacity must not be negative')
+        if capacity > self._physical_size:
+            self._reallocate(capacity)
+
+    @property
+    def indexed(self) -> bool:
+        """ Property for checking whether the Array keeps a HashIndex of its items.
+
+        Examples:
+            >>> array = Array.from_list(['a', 'b'])
+            >>> print(array.indexed)
+            False
+            >>> array.build_index()
+            >>> print(array.indexed)
+            True
+
+        Returns:
+            indexed (bool): true if membership tests use the index.
+        """
+        return self._index is not None
+
+    def build_index(self) -> None:
+        """ Build a HashIndex that maps every item to its positions. While the index exists, `in`,
+            index(), count() and find_all() are dictionary lookups, and __setitem__, append,
+            extend, __delitem__ and resize keep it up to date. Bulk rearrangements
+            (delete_many, remove_where, slice writes) mark it stale; it is rebuilt on the next lookup.
+            Items that are mutated in place cannot be tracked: call invalidate_index() afterwards.
+
+        Examples:
+            >>> array = Array.from_list(['a', 'b', 'a'])
+            >>> array.build_index()
+            >>> print(array.count('a'))
+            2
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if any item is not hashable.
+        """
+        self._index = HashIndex(self._items[:self._logical_size])
+
+    def drop_index(self) -> None:
+        """ Remove the HashIndex, going back to scanning for lookups.
+
+        Returns:
+            None
+        """
+        self._index = None
+
+    def invalidate_index(self) -> None:
+        """ Mark the HashIndex stale so it is rebuilt on the next lookup. Call this after mutating
+            items in place in a way that changes their hash or equality (e.g. changing a Car's vin).
+            Does nothing if the Array is not indexed.
+
+        Examples:
+            >>> from tests.car import Car, Color, Make, Model
+            >>> car = Car(vin='1', color=Color.RED, make=Make.FORD, model=Model.FOCUS)
+            >>> array = Array.from_list([car])
+            >>> array.build_index()
+            >>> car.vin = '2'
+            >>> array.invalidate_index()
+            >>> print(Car(vin='2', color=Color.RED, make=Make.FORD, model=Model.FOCUS) in array)
+            True
+
+        Returns:
+            None
+        """
+        if self._index is not None:
+            self._index.invalidate()
+
+    def index_memory_usage(self) -> int:
+        """ Estimate the memory used by the HashIndex in bytes (0 if the Array is not indexed).
+
+        Examples:
+            >>> array = Array.from_list(list(range(100)))
+            >>> print(array.index_memory_usage())
+            0
+            >>> array.build_index()
+            >>> print(array.index_memory_usage() > 0)
+            True
+
+        Returns:
+            nbytes (int): the approximate size of the index, not counting the items themselves.
+        """
+        return 0 if self._index is None else self._index.memory_usage()
+
+    def _live_index(self) -> HashIndex | None:
+        """ Return the index if it must be kept up to date (it exists and is not already stale). """
+        if self._index is None or self._index.stale:
+            return None
+        return self._index
+
+    def _lookup_index(self, item: Any) -> HashIndex | None:
+        """ Return an up-to-date index to look `item` up in, or None if a scan is needed. """
+        if self._index is None:
+            return None
+        try:
+            hash(item)
+        except TypeError:
+            return None
+        if self._index.stale:
+            self.build_index()
+        return self._index
+
+    def _store_indexed(self, index: int, data: Any) -> None:
+        """ Store `data` at `index`, updating the live index. """
+        hash(data)
+        self._ensure_writable()
+        old_item = self._items[index]
+        self._items[index] = data
+        self._index.discard(old_item, index)
+        self._index.add(self._items[index], index)
+
+    def shrink_to_fit(self) -> None:
+        """ Release unused capacity so the capacity equals the length of the Array.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 3])
+            >>> array.reserve(100)
+            >>> array.shrink_to_fit()
+            >>> print(array.capacity)
+            3
+
+        Returns:
+            None
+        """
+        if self._physical_size != self._logical_size:
+            self._reallocate(self._logical_size)
 
     @staticmethod
-    def from_list(list_items: list) -> 'Array':
+    def from_list(list_items: list, dtype: Any = object) -> 'Array':
         """
         Create an Array from a Python list.
         
@@ -56,6 +527,7 @@ class Array:
         
         Args:
             list_items (list): the list to create the Array from.
+            dtype (Any): the dtype to store the items as (default is object).
             
         Returns:
             array (Array): A new Array instance containing the items from `list_items`
@@ -67,56 +539,195 @@ class Array:
         if not isinstance(list_items, list):
             raise TypeError("Input must be a list")
         
-        new_array = Array(size=len(list_items))
-        for i, item in enumerate(list_items):
-            new_array[i] = item
+        new_array = Array(dtype=dtype)
+        new_array._adopt(new_array._to_block(list_items))
         
         return new_array
+
+    @staticmethod
+    def from_iterable(iterable: Iterable, size_hint: int | None = None, dtype: Any = object) -> 'Array':
+        """ Create an Array from any iterable. Sized inputs are copied in one step, generators
+            and other unsized iterables are consumed in chunks.
+
+        Examples:
+            >>> array = Array.from_iterable(range(5), dtype='int64')
+            >>> print(array)
+            [0 1 2 3 4]
+            >>> array = Array.from_iterable((word.upper() for word in ['a', 'b']), size_hint=2)
+            >>> print(len(array))
+            2
+
+        Args:
+            iterable (Iterable): the items to create the Array from.
+            size_hint (int): expected number of items, reserved up front for unsized inputs (default is None).
+            dtype (Any): the dtype to store the items as (default is object).
+
+        Returns:
+            array (Array): A new Array instance containing the items from `iterable`.
+        """
+        new_array = Array(dtype=dtype)
+        if size_hint:
+            new_array.reserve(size_hint)
+        new_array.extend(iterable)
+        return new_array
+
+    @staticmethod
+    def from_numpy(ndarray: np.ndarray, copy: bool = False, default_item_value: Any = None) -> 'Array':
+        """ Create an Array from a one-dimensional numpy array. Without copy the Array uses
+            `ndarray` as its buffer, so changes through either one are visible in the other
+            until the Array reallocates.
+
+        Examples:
+            >>> data = np.arange(3)
+            >>> array = Array.from_numpy(data)
+            >>> array[0] = 10
+            >>> print(data[0])
+            10
+
+        Args:
+            ndarray (np.ndarray): the numpy array to create the Array from.
+            copy (bool): copy the data instead of sharing it (default is False).
+            default_item_value (Any): the default value of the new Array (default is None).
+
+        Returns:
+            array (Array): A new Array instance backed by `ndarray` (or a copy of it).
+
+        Raises:
+            TypeError: if ndarray is not a numpy array or its dtype is not supported.
+            ValueError: if ndarray is not one-dimensional.
+        """
+        if not isinstance(ndarray, np.ndarray):
+            raise TypeError("Input must be a numpy array")
+        if ndarray.ndim != 1:
+            raise ValueError("Input must be one-dimensional")
+
+        new_array = Array(default_item_value=default_item_value, dtype=ndarray.dtype)
+        new_array._adopt(ndarray.copy() if copy else ndarray)
+        return new_array
     
-    def __getitem__(self, index: int) -> Any:
-        """ Bracket operator for getting an item from an Array.
+    def _batch_positions(self, index: Any) -> np.ndarray | None:
+        """ Convert an index array or boolean mask to positions, bounds-checked once for the whole batch.
+            Returns None if `index` is a single index or a slice.
+        """
+        if not isinstance(index, (list, tuple, np.ndarray, Array, ArrayView)):
+            return None
+        positions = np.asarray(index)
+        if positions.ndim != 1:
+            raise ValueError('Index arrays must be one-dimensional')
+        if positions.size == 0:
+            return np.empty(0, dtype=np.intp)
+        if positions.dtype == np.bool_:
+            if len(positions) != self._logical_size:
+                raise IndexError(f'Boolean mask has {len(positions)} flags for {self._logical_size} items')
+            return np.flatnonzero(positions)
+        if positions.dtype.kind not in 'iu':
+            raise TypeError(f'Index arrays must hold integers or bools, not {positions.dtype}')
+        if positions.min() < 0 or positions.max() >= self._logical_size:
+            raise IndexError('Must be in range of array.')
+        return positions.astype(np.intp, copy=False)
+
+    def __getitem__(self, index: int | slice | Iterable) -> Any:
+        """ Bracket operator for getting an item from an Array. A slice returns an ArrayView
+            that shares the Array's buffer instead of copying the items. An array of indices gathers
+            the items at those positions, and a boolean mask (one flag per item) selects the items whose
+            flag is true; both return a new Array and are bounds-checked once for the whole batch.
 
         Examples:
             >>> array = Array.from_list(['zero', 'one', 'two', 'three', 'four'])
             >>> print(array[0]) # invokes __getitem__ using the [] operator
             zero
+            >>> print(array[1:4:2])
+            ['one' 'three']
+            >>> numbers = Array.from_list([10, 20, 30, 40], dtype='int64')
+            >>> print(numbers[[3, 0, 3]], numbers[np.asarray(numbers) > 15])
+            [40 10 40] [20 30 40]
 
         Args:
-            index (int): the desired index.
+            index (int | slice | Iterable): the desired index, a slice of indices, an index array or a boolean mask.
         
         Returns:
-            Any: the item at the index.
+            Any: the item at the index, an ArrayView for a slice, or a new Array for an index array or mask.
         
         Raises:
-            IndexError: if the index is out of bounds.
+            IndexError: if an index is out of bounds, or a mask does not have one flag per item.
+            TypeError: if an index array holds neither integers nor bools.
+            ValueError: if an index array is not one-dimensional.
         """
-        if index < 0 or index >= len(self._items):
+        if isinstance(index, slice):
+            return ArrayView(self, range(self._logical_size)[index])
+
+        positions = self._batch_positions(index)
+        if positions is not None:
+            return Array.from_numpy(self._items[positions], default_item_value=self._default_item_value)
+
+        if index < 0 or index >= self._logical_size:
             raise IndexError('Must be in range of array.')
         
         return self._items[index]
 
-    def __setitem__(self, index: int, data: Any) -> None:
-        """ Bracket operator for setting an item in an Array.
+    def __setitem__(self, index: int | slice | Iterable, data: Any) -> None:
+        """ Bracket operator for setting an item in an Array. Assigning to a slice copies `data` (a sized
+            iterable with one item per covered index) into the Array in one block. With an index array or boolean mask the
+            items at all of the selected positions are set at once (scatter), after one bounds check for
+            the whole batch; if a position is repeated, the last value for it wins.
 
         Examples:
             >>> array = Array.from_list(['zero', 'one', 'two', 'three', 'four'])
             >>> array[0] = 'new zero' # invokes __setitem__
             >>> print(array[0])
             new zero
+            >>> numbers = Array.from_list([1, 2, 3, 4], dtype='int64')
+            >>> numbers[[0, 2]] = [10, 30]
+            >>> numbers[[False, True, False, True]] = 0
+            >>> numbers[1:3] = [20, 30]
+            >>> print(numbers)
+            [10 20 30  0]
 
         Args:
-            index (int): the desired index to set.
-            data (Any): the desired data to set at index.
+            index (int | slice | Iterable): the desired index to set, a slice, an index array or a boolean mask.
+            data (Any): the desired data to set at index. For an index array or mask, either one value for
+                every selected position, or a sequence with one value per selected position.
         
         Returns:
             None
         
         Raises: 
-            IndexError: if the index is out of bounds.
+            IndexError: if an index is out of bounds, or a mask does not have one flag per item.
+            TypeError: if an index array holds neither integers nor bools.
+            ValueError: if the number of values does not match the number of selected positions.
         """
+        if isinstance(index, slice):
+            ArrayView(self, range(self._logical_size)[index])[:] = data
+            return
+
+        positions = self._batch_positions(index)
+        if positions is not None:
+            self._scatter(positions, data)
+            return
         if index < 0 or index > self._logical_size - 1:
             raise IndexError(f'Index {index} out of bounds') 
-        self._items[index] = data
+        if self._live_index() is None:
+            self._ensure_writable()
+            self._items[index] = data
+        else:
+            self._store_indexed(index, data)
+
+    def _scatter(self, positions: np.ndarray, data: Any) -> None:
+        """ Set the items at `positions` (already bounds-checked) in one numpy assignment. """
+        is_sequence = isinstance(data, (list, tuple, np.ndarray, Array, ArrayView))
+        if is_sequence:
+            values = self._to_block(data)
+            if len(values) != len(positions):
+                raise ValueError(f'{len(values)} values for {len(positions)} positions')
+        else:
+            values = data
+        if self._index is not None:
+            for value in (values if is_sequence else (values,)):
+                hash(value)
+        self._ensure_writable()
+        self._items[positions] = values
+        # like other bulk writes, the index is rebuilt on the next lookup instead of being patched per item
+        self.invalidate_index()
 
     def append(self, data: Any) -> None:
         """ Append an item to the end of the Array
@@ -134,16 +745,56 @@ class Array:
             None
         """
         if self._physical_size == self._logical_size:
-            new_size = 1 if self._physical_size == 0 else self._physical_size*2
-            new_items = np.array([self._default_item_value] * new_size, dtype=object)
-
-            self._physical_size = new_size
-            for i in range(self._logical_size):
-                new_items[i] = self._items[i]
-            self._items = new_items
+            self._grow_to(self._logical_size + 1)
 
-        self._items[self._logical_size] = data
+        if self._live_index() is None:
+            self._ensure_writable()
+            self._items[self._logical_size] = data
+        else:
+            self._store_indexed(self._logical_size, data)
         self._logical_size += 1
+
+    def extend(self, iterable: Iterable) -> None:
+        """ Append every item of an iterable to the end of the Array. Arrays, numpy arrays and
+            other sized inputs are copied in one block; unsized iterables (generators) in chunks.
+
+        Examples:
+            >>> array = Array.from_list([1, 2])
+            >>> array.extend([3, 4])
+            >>> array.extend(n * n for n in range(3))
+            >>> print(array)
+            [1 2 3 4 0 1 4]
+
+        Args:
+            iterable (Iterable): the items to append.
+
+        Returns:
+            None
+        """
+        if not hasattr(iterable, '__len__'):
+            iterator = iter(iterable)
+            while chunk := list(islice(iterator, _EXTEND_CHUNK_SIZE)):
+                self.extend(chunk)
+            return
+
+        block = self._to_block(iterable)
+        old_size = self._logical_size
+        new_size = old_size + len(block)
+        self._grow_to(new_size)
+        self._ensure_writable()
+        self._items[old_size:new_size] = block
+        self._logical_size = new_size
+
+        index = self._live_index()
+        if index is not None:
+            try:
+                for position in range(old_size, new_size):
+                    index.add(self._items[position], position)
+            except TypeError:
+                # an unhashable item: undo the extend and let the index be rebuilt from the old items
+                index.invalidate()
+                self.resize(old_size)
+                raise
         
     def __len__(self) -> int:
         """ Length operator for getting the logical length of the Array (number of items in the Array).
@@ -160,6 +811,8 @@ class Array:
 
     def resize(self, new_size: int, default_value: Any = None) -> None:
         """ Resize an Array. Resizing to a size smaller than the current size will truncate the Array. Resizing to a larger size will append None to the end of the Array.
+            The capacity follows the growth policy: growing may over-allocate, truncating keeps the 
+            buffer unless the policy decides it is mostly empty.
 
         Examples:
             >>> array = Array.from_list(['zero', 'one', 'two', 'three', 'four'])
@@ -174,7 +827,7 @@ class Array:
 
         Args:
             new_size (int): the desired new size of the Array.
-            default_value (Any): the desired default value to append to the Array if the new size is larger than the current size. Only makes sense if the new_size is larger than the current size. (default is None).
+            default_value (Any): the desired default value to append to the Array if the new size is larger than the current size. Only makes sense if the new_size is larger than the current size. (default is None, which uses the default value of the Array).
         
         Returns:
             None
@@ -185,13 +838,26 @@ class Array:
         if new_size < 0:
             raise ValueError()
         
-        copy_size = new_size if new_size < self._physical_size else self._physical_size
-        new_items = np.array([self._default_item_value] * new_size, dtype=object)
-        for i in range(copy_size):
-            new_items[i] = self._items[i]
-        self._items = new_items
-
-        self._physical_size = self._logical_size = new_size
+        index = self._live_index()
+        if new_size > self._logical_size:
+            self._grow_to(new_size)
+            fill_value = self._default_item_value if default_value is None else default_value
+            if index is not None:
+                hash(fill_value)
+            self._ensure_writable()
+            self._items[self._logical_size:new_size].fill(fill_value)
+            if index is not None:
+                for position in range(self._logical_size, new_size):
+                    index.add(self._items[position], position)
+            self._logical_size = new_size
+        else:
+            if index is not None:
+                for position in range(new_size, self._logical_size):
+                    index.discard(self._items[position], position)
+            self._ensure_writable()
+            self._items[new_size:self._logical_size].fill(self._default_item_value)
+            self._logical_size = new_size
+            self._shrink_if_sparse()
 
     def __eq__(self, other: object) -> bool:
         """ Equality operator == to check if two Arrays are equal (deep check).
@@ -211,13 +877,10 @@ class Array:
         if not isinstance(other, Array):
             raise TypeError("Input must be an array.")
         
-        if len(self._items) != len(other._items):
+        if self._logical_size != other._logical_size:
             return False
-        
-        for i in range(self._logical_size):
-            if self._items[i] != other._items[i]:
-                return False
-        return True
+
+        return bool(np.array_equal(self._items[:self._logical_size], other._items[:other._logical_size]))
 
 
     def __ne__(self, other: object) -> bool:
@@ -235,16 +898,7 @@ class Array:
         Returns:
             is_not_equal (bool): true if the arrays are NOT equal (deep check).
         """
-        if not isinstance(other, Array):
-            raise TypeError("Input must be an array.")
-        
-        if len(self._items) != len(other._items):
-            return True
-        
-        for i in range(self._logical_size):
-            if self._items[i] != other._items[i]:
-                return True
-        return False
+        return not self.__eq__(other)
 
     def __iter__(self) -> Any:
         """ Iterator operator. Allows for iteration over the Array.
@@ -256,6 +910,9 @@ class Array:
         Yields:
             item (Any): yields the item at index
         """
+        if self._dtype.kind != 'O':
+            yield from self._items[:self._logical_size]
+            return
         for i in range(self._logical_size):
             yield self._items[i]
 
@@ -270,12 +927,98 @@ class Array:
         Yields:
             item (Any): yields the item at index starting at the end
         """
+        if self._dtype.kind != 'O':
+            yield from self._items[:self._logical_size][::-1]
+            return
         for i in range(self._logical_size - 1, -1, -1):
             yield self._items[i]
 
+    def iter_fast(self) -> Any:
+        """ Iterate over the items with the numpy buffer's own iterator, without running Python code per item.
+            The items are the same as those yielded by iter(), but the Array must not be resized
+            during the iteration.
+
+        Examples:
+            >>> array = Array.from_list(['zero', 'one', 'two'])
+            >>> print(list(array.iter_fast()))
+            ['zero', 'one', 'two']
+
+        Returns:
+            iterator (Iterator): an iterator over the items.
+        """
+        return iter(self._guard_export(self._items[:self._logical_size]))
+
+    def iter_chunks(self, size: int) -> Any:
+        """ Iterate over the items in blocks: zero-copy numpy views of up to `size` consecutive items,
+            so whole blocks can be processed with numpy operations. The views are read-only while the
+            buffer is shared with a snapshot, and refer to the old buffer if the Array reallocates.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 3, 4, 5], dtype='int64')
+            >>> for chunk in array.iter_chunks(2): print(chunk, chunk.sum())
+            [1 2] 3
+            [3 4] 7
+            [5] 5
+
+        Args:
+            size (int): the maximum number of items per block.
+
+        Yields:
+            chunk (np.ndarray): the next block of items; only the last one may be shorter than size.
+
+        Raises:
+            ValueError: if size is less than 1.
+        """
+        if size < 1:
+            raise ValueError('Chunk size must be at least 1')
+        length = self._logical_size
+        for start in range(0, length, size):
+            yield self._guard_export(self._items[start:min(start + size, length)])
+
+    def iter_chunks_reversed(self, size: int) -> Any:
+        """ Iterate over the items in blocks from the end: zero-copy, reversed numpy views of up to
+            `size` items, so that the blocks in order hold the items in reverse. The first block is
+            the one that may be shorter than size.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 3, 4, 5], dtype='int64')
+            >>> for chunk in array.iter_chunks_reversed(2): print(chunk)
+            [5 4]
+            [3 2]
+            [1]
+
+        Args:
+            size (int): the maximum number of items per block.
+
+        Yields:
+            chunk (np.ndarray): the next block of items, last item first.
+
+        Raises:
+            ValueError: if size is less than 1.
+        """
+        if size < 1:
+            raise ValueError('Chunk size must be at least 1')
+        for stop in range(self._logical_size, 0, -size):
+            yield self._guard_export(self._items[max(stop - size, 0):stop][::-1])
+
+    def lazy(self) -> 'LazyArray':
+        """ Start a lazy pipeline of map, filter and take steps over the Array. The steps run in one
+            streaming pass when the results are requested, without building an Array per step.
+
+        Examples:
+            >>> array = Array.from_list(list(range(10)), dtype='int64')
+            >>> print(array.lazy().map(np.square).filter(lambda n: n % 2 == 1).take(3).collect())
+            [ 1  9 25]
+
+        Returns:
+            pipeline (LazyArray): a pipeline with no steps.
+        """
+        return LazyArray(self)
+
     def __delitem__(self, index: int) -> None:
         """ Delete an item in the array. Copies the array contents from index + 1 down
             to fill the gap caused by deleting the item and shrinks the array size down by one.
+            The items are shifted in place; the capacity only shrinks when the growth policy says so.
 
         Examples:
 
@@ -295,17 +1038,91 @@ class Array:
         if index < 0 or index >= self._logical_size:
             raise IndexError("Index out of range")
         
-        new_items = np.array([self._default_item_value] * (self._logical_size - 1), dtype=object)
-        
-        for i in range(0, index):
-            new_items[i] = self._items[i]
+        live_index = self._live_index()
+        if live_index is not None:
+            live_index.discard(self._items[index], index)
+            for position in range(index + 1, self._logical_size):
+                live_index.move(self._items[position], position, position - 1)
 
-        for i in range(index, self._logical_size - 1):
-            new_items[i] = self._items[i + 1]
-        self._items = new_items
+        self._ensure_writable()
+        self._items[index:self._logical_size - 1] = self._items[index + 1:self._logical_size]
+        self._items[self._logical_size - 1] = self._default_item_value
 
         self._logical_size -= 1
-        self._physical_size = self._logical_size
+        self._shrink_if_sparse()
+
+    def delete_many(self, indices: Iterable[int]) -> int:
+        """ Delete the items at all of the given indices at once. The remaining items are 
+            compacted in a single pass, so deleting k items costs O(n) instead of O(n * k).
+            Duplicate indices are deleted once.
+
+        Examples:
+            >>> array = Array.from_list(['zero', 'one', 'two', 'three', 'four'])
+            >>> print(array.delete_many([3, 0]))
+            2
+            >>> print(array)
+            ['one' 'two' 'four']
+
+        Args:
+            indices (Iterable[int]): the indices to delete.
+
+        Returns:
+            deleted (int): the number of items deleted.
+
+        Raises:
+            IndexError: if any index is out of bounds.
+        """
+        indices = np.asarray(indices if hasattr(indices, '__len__') else list(indices), dtype=np.intp)
+        if indices.size == 0:
+            return 0
+        if indices.min() < 0 or indices.max() >= self._logical_size:
+            raise IndexError("Index out of range")
+
+        keep = np.ones(self._logical_size, dtype=bool)
+        keep[indices] = False
+        return self._compact(keep)
+
+    def remove_where(self, mask: Iterable[bool]) -> int:
+        """ Remove every item whose entry in `mask` is true, compacting the Array in a single pass.
+
+        Examples:
+            >>> array = Array.from_list([5, 1, 7, 2, 9], dtype='int64')
+            >>> print(array.remove_where([item > 4 for item in array]))
+            3
+            >>> print(array)
+            [1 2]
+
+        Args:
+            mask (Iterable[bool]): one flag per item, true for the items to remove.
+
+        Returns:
+            removed (int): the number of items removed.
+
+        Raises:
+            ValueError: if the mask length does not match the length of the Array.
+        """
+        mask = np.asarray(mask if hasattr(mask, '__len__') else list(mask), dtype=bool)
+        if mask.shape != (self._logical_size,):
+            raise ValueError(f'Mask must have {self._logical_size} items')
+        return self._compact(~mask)
+
+    def _compact(self, keep: np.ndarray) -> int:
+        """ Keep only the items flagged in `keep`, moving just the part after the first removed item. """
+        first_removed = int(np.argmin(keep))
+        if keep[first_removed]:
+            return 0
+
+        self._ensure_writable()
+        kept_tail = self._items[first_removed:self._logical_size][keep[first_removed:]]
+        new_size = first_removed + len(kept_tail)
+        self._items[first_removed:new_size] = kept_tail
+        self._items[new_size:self._logical_size].fill(self._default_item_value)
+
+        removed = self._logical_size - new_size
+        self._logical_size = new_size
+        self.invalidate_index()
+        self._shrink_if_sparse()
+        return removed
 
     def __contains__(self, item: Any) -> bool:
         """ Contains operator (in). Checks if the array contains the item.
@@ -322,10 +1139,10 @@ class Array:
         Returns:
             contains_item (bool): true if the array contains the item.
         """
-        for i in range(self._logical_size):
-            if self._items[i] == item:
-                return True
-        return False
+        index = self._lookup_index(item)
+        if index is not None:
+            return bool(index.positions(item))
+        return bool(self._match(item).any())
     
     def __does_not_contain__(self, item: Any) -> bool:
         """ Does not contain operator (not in)
@@ -342,16 +1159,239 @@ class Array:
         Returns:
             does_not_contains_item (bool): true if the array does not contain the item.
         """ 
-        for i in range(self._logical_size):
-            if self._items[i] == item:
-                return False
-        return True
+        return not self.__contains__(item)
+
+    def _match(self, item: Any) -> np.ndarray:
+        """ Compare every logical item to `item` in one numpy pass, returning a boolean mask. """
+        return _match_items(self._items[:self._logical_size], item)
+
+    def index(self, item: Any) -> int:
+        """ Find the index of the first occurrence of an item.
 
-    def clear(self) -> None:
-        """ Clear the Array
-        
         Examples:
-        
+            >>> array = Array.from_list(['zero', 'one', 'two', 'one'])
+            >>> print(array.index('one'))
+            1
+
+        Args:
+            item (Any): the item to search for.
+
+        Returns:
+            index (int): the index of the first item equal to `item`.
+
+        Raises:
+            ValueError: if the item is not in the Array.
+        """
+        hash_index = self._lookup_index(item)
+        if hash_index is not None:
+            positions = hash_index.positions(item)
+            if not positions:
+                raise ValueError(f'{item!r} is not in array')
+            return min(positions)
+
+        mask = self._match(item)
+        index = int(np.argmax(mask)) if len(mask) else 0
+        if not len(mask) or not mask[index]:
+            raise ValueError(f'{item!r} is not in array')
+        return index
+
+    def count(self, item: Any) -> int:
+        """ Count the occurrences of an item.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 1, 1], dtype='int64')
+            >>> print(array.count(1))
+            3
+
+        Args:
+            item (Any): the item to count.
+
+        Returns:
+            count (int): the number of items equal to `item`.
+        """
+        index = self._lookup_index(item)
+        if index is not None:
+            return len(index.positions(item))
+        return int(np.count_nonzero(self._match(item)))
+
+    def find_all(self, item: Any) -> np.ndarray:
+        """ Find the indices of every occurrence of an item.
+
+        Examples:
+            >>> array = Array.from_list(['a', 'b', 'a'])
+            >>> print(array.find_all('a'))
+            [0 2]
+
+        Args:
+            item (Any): the item to search for.
+
+        Returns:
+            indices (np.ndarray): the indices of the items equal to `item`, in increasing order.
+        """
+        index = self._lookup_index(item)
+        if index is not None:
+            return np.array(sorted(index.positions(item)), dtype=np.intp)
+        return np.flatnonzero(self._match(item))
+
+    def argsort(self, key: Any = None, reverse: bool = False, stable: bool = True) -> np.ndarray:
+        """ Get the indices that would sort the Array, without changing it.
+
+        Examples:
+            >>> array = Array.from_list([30, 10, 20], dtype='int64')
+            >>> print(array.argsort())
+            [1 2 0]
+
+        Args:
+            key (Any): a function of one item giving its sort key, or a numpy ufunc applied to all items
+                at once (default is None, the items themselves).
+            reverse (bool): sort in descending order (default is False).
+            stable (bool): keep items with equal keys in their original order (default is True).
+
+        Returns:
+            order (np.ndarray): the indices of the items in sorted order.
+
+        Raises:
+            TypeError: if the keys cannot be compared with each other.
+        """
+        return _argsort(_sort_keys(self._items[:self._logical_size], key), reverse, stable)
+
+    def sort(self, key: Any = None, reverse: bool = False, stable: bool = True) -> None:
+        """ Sort the Array in place. Typed dtypes are sorted by numpy directly; for object dtype the
+            keys are extracted once, converted to a typed array when possible, and the items are
+            rearranged by the resulting order in a single gather.
+
+        Examples:
+            >>> array = Array.from_list(['pear', 'fig', 'apple'])
+            >>> array.sort(key=len)
+            >>> print(array)
+            ['fig' 'pear' 'apple']
+            >>> array.sort(reverse=True)
+            >>> print(array)
+            ['pear' 'fig' 'apple']
+
+        Args:
+            key (Any): a function of one item giving its sort key, or a numpy ufunc applied to all items
+                at once (default is None, the items themselves).
+            reverse (bool): sort in descending order (default is False).
+            stable (bool): keep items with equal keys in their original order (default is True).
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if the keys cannot be compared with each other.
+        """
+        self._ensure_writable()
+        values = self._items[:self._logical_size]
+        if key is None and not reverse and values.dtype.kind != 'O':
+            values.sort(kind='stable' if stable else 'quicksort')
+        else:
+            values[:] = values[self.argsort(key, reverse, stable)]
+        self.invalidate_index()
+
+    def bisect_left(self, item: Any, lo: int = 0, hi: int | None = None) -> int:
+        """ Find where to insert `item` to keep a sorted Array sorted, before any equal items.
+            Uses a binary search, so the Array must already be sorted in ascending order.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 2, 3], dtype='int64')
+            >>> print(array.bisect_left(2), array.bisect_right(2))
+            1 3
+
+        Args:
+            item (Any): the item to search for.
+            lo (int): the first index to consider (default is 0).
+            hi (int | None): one past the last index to consider (default is None, the length of the Array).
+
+        Returns:
+            index (int): the insertion point.
+
+        Raises:
+            ValueError: if lo or hi is out of range.
+        """
+        return self._bisect(item, lo, hi, 'left')
+
+    def bisect_right(self, item: Any, lo: int = 0, hi: int | None = None) -> int:
+        """ Find where to insert `item` to keep a sorted Array sorted, after any equal items.
+            Uses a binary search, so the Array must already be sorted in ascending order.
+
+        Args:
+            item (Any): the item to search for.
+            lo (int): the first index to consider (default is 0).
+            hi (int | None): one past the last index to consider (default is None, the length of the Array).
+
+        Returns:
+            index (int): the insertion point.
+
+        Raises:
+            ValueError: if lo or hi is out of range.
+        """
+        return self._bisect(item, lo, hi, 'right')
+
+    def _bisect(self, item: Any, lo: int, hi: int | None, side: str) -> int:
+        """ Binary search over items [lo, hi) with numpy.searchsorted. """
+        if hi is None:
+            hi = self._logical_size
+        if lo < 0 or hi > self._logical_size or lo > hi:
+            raise ValueError(f'lo and hi must satisfy 0 <= lo <= hi <= {self._logical_size}')
+        if self._dtype.kind == 'O':
+            # a 0-d probe keeps numpy from treating a list or tuple item as several needles
+            probe = np.empty((), dtype=object)
+            probe[()] = item
+            item = probe
+        return lo + int(np.searchsorted(self._items[lo:hi], item, side=side))
+
+    def parallel_map(self, fn: Callable, workers: int | None = None, dtype: Any = None) -> 'Array':
+        """ Apply `fn` to the items in worker processes and return the results as a new Array.
+            The items are split into one contiguous chunk per worker and `fn` is called once per chunk
+            with a numpy array, so it should be vectorized (e.g. a ufunc). Typed items are shared with
+            the workers through shared memory, so each worker reads its chunk without a copy; object
+            items are pickled to the workers chunk by chunk.
+
+        Examples:
+            >>> array = Array.from_list([1.0, 4.0, 9.0], dtype='float64')
+            >>> print(array.parallel_map(np.sqrt, workers=2))
+            [1. 2. 3.]
+
+        Args:
+            fn (Callable): takes a chunk (np.ndarray) and returns an array of the same length; it must be
+                picklable (a ufunc or a module-level function, not a lambda).
+            workers (int | None): the number of processes (default is None, one per CPU).
+            dtype (Any): the dtype of the result (default is None, the dtype of this Array).
+
+        Returns:
+            array (Array): a new Array holding the mapped items.
+
+        Raises:
+            ValueError: if fn returns a chunk of the wrong length.
+        """
+        return Array.from_numpy(parallel.parallel_map(self._items[:self._logical_size], fn, workers, dtype))
+
+    def parallel_reduce(self, fn: Callable, init: Any, workers: int | None = None) -> Any:
+        """ Fold an associative binary function over the items in worker processes. Each worker reduces its
+            own chunk (with ufunc.reduce when `fn` is a numpy ufunc) and the partial results are combined,
+            starting from `init`, in this process.
+
+        Examples:
+            >>> array = Array.from_list(list(range(1, 11)), dtype='int64')
+            >>> print(array.parallel_reduce(np.add, 0, workers=2))
+            55
+
+        Args:
+            fn (Callable): an associative function of two items, or a binary ufunc; it must be picklable.
+            init (Any): the starting value, returned unchanged for an empty Array.
+            workers (int | None): the number of processes (default is None, one per CPU).
+
+        Returns:
+            result (Any): fn folded over init and every item.
+        """
+        return parallel.parallel_reduce(self._items[:self._logical_size], fn, init, workers)
+
+    def clear(self) -> None:
+        """ Clear the Array
+        
+        Examples:
+        
             >>> array = Array.from_list(['zero', 'one', 'two', 'three', 'four'])
             >>> array.clear()
             >>> print(array)
@@ -362,9 +1402,304 @@ class Array:
         Returns:
             None
         """
-        self._items = []
+        self._release()
+        self._detach()
+        self._items = self._allocate(0)
         self._physical_size = 0
         self._logical_size = 0 
+        if self._index is not None:
+            self._index = HashIndex()
+
+    def save(self, path: str | os.PathLike) -> None:
+        """ Save the items to a binary file: a 64 byte header (see datastructures.array_file)
+            followed by the raw items. Unused capacity is not written.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), 'array.bin')
+            >>> Array.from_list([1, 2, 3], dtype='int16').save(path)
+            >>> print(os.path.getsize(path))
+            70
+
+        Args:
+            path (str | os.PathLike): the file to write (overwritten if it exists).
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if the Array stores Python objects (use pickle for those).
+        """
+        header = encode_header(self._dtype, self._default_item_value, self._logical_size, self._logical_size)
+        with open(path, 'wb') as file:
+            header.tofile(file)
+            self._items[:self._logical_size].tofile(file)
+
+    @staticmethod
+    def load(path: str | os.PathLike, mmap: bool = True) -> 'Array':
+        """ Load an Array saved with save() (or a MappedArray file). With mmap the file is mapped
+            copy-on-write: loading is O(1), items are read on first access, and changes to the
+            Array are never written back to the file.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), 'array.bin')
+            >>> Array.from_list([1.5, 2.5], dtype='float32').save(path)
+            >>> array = Array.load(path)
+            >>> print(array, array.dtype)
+            [1.5 2.5] float32
+
+        Args:
+            path (str | os.PathLike): the file to read.
+            mmap (bool): map the file instead of reading it into memory (default is True).
+
+        Returns:
+            array (Array): a new Array holding the saved items.
+
+        Raises:
+            ValueError: if the file is not an array file.
+        """
+        header = read_header(path)
+        if header.size == 0:
+            items = np.empty(0, dtype=header.dtype)
+        elif mmap:
+            items = np.memmap(path, dtype=header.dtype, mode='c', offset=HEADER_SIZE, shape=(header.size,))
+        else:
+            items = np.fromfile(path, dtype=header.dtype, count=header.size, offset=HEADER_SIZE)
+        return Array.from_numpy(items, default_item_value=header.default_item_value)
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """ Support for pickle and copy. Only the logical items are pickled, never the unused capacity.
+            With pickle protocol 5 the items of a typed Array are handed over as a PickleBuffer,
+            so they can be transferred out-of-band (e.g. by multiprocessing) without extra copies.
+
+        Examples:
+            >>> buffers = []
+            >>> data = pickle.dumps(Array.from_list([1, 2], dtype='int64'), protocol=5, buffer_callback=buffers.append)
+            >>> print(len(buffers), pickle.loads(data, buffers=buffers))
+            1 [1 2]
+
+        Args:
+            protocol (int): the pickle protocol in use.
+
+        Returns:
+            reduce_value (tuple): a callable and its arguments that rebuild the Array.
+        """
+        items = self._items[:self._logical_size]
+        if protocol >= 5 and self._dtype.kind != 'O':
+            items = pickle.PickleBuffer(np.ascontiguousarray(items))
+        state = (self._dtype.str, self._default_item_value, self._growth_policy, self._index is not None)
+        return (Array._from_pickle, (items,) + state)
+
+    @staticmethod
+    def _from_pickle(items: Any, dtype: str, default_item_value: Any, growth_policy: GrowthPolicy,
+                     indexed: bool) -> 'Array':
+        """ Rebuild an Array from the values produced by __reduce_ex__. """
+        if not isinstance(items, np.ndarray):
+            items = np.frombuffer(items, dtype=dtype)
+            if not items.flags.writeable:
+                items = items.copy()
+        new_array = Array.from_numpy(items, default_item_value=default_item_value)
+        new_array._growth_policy = growth_policy
+        if indexed:
+            new_array.build_index()
+        return new_array
+
+    def __copy__(self) -> 'Array':
+        """ Shallow copy (copy.copy): a new Array with its own buffer holding the same items.
+
+        Examples:
+            >>> import copy
+            >>> array = Array.from_list([[1], [2]])
+            >>> copied = copy.copy(array)
+            >>> copied.append([3])
+            >>> print(len(array), copied[0] is array[0])
+            2 True
+
+        Returns:
+            array (Array): the copy.
+        """
+        return Array._from_pickle(self._items[:self._logical_size].copy(), self._dtype.str,
+                                  self._default_item_value, self._growth_policy, self._index is not None)
+
+    def __deepcopy__(self, memo: dict) -> 'Array':
+        """ Deep copy (copy.deepcopy). When the dtype is typed, or every item is of an immutable type
+            (None, bool, int, float, complex, str, bytes, Enum members, numpy scalars), the items are
+            copied with a single ndarray.copy() instead of deep-copying them one by one.
+
+        Examples:
+            >>> import copy
+            >>> array = Array.from_list([[1], [2]])
+            >>> copied = copy.deepcopy(array)
+            >>> copied[0].append(10)
+            >>> print(array[0], copied[0])
+            [1] [1, 10]
+
+        Args:
+            memo (dict): the deepcopy memo.
+
+        Returns:
+            array (Array): the copy, sharing no mutable state with this Array.
+        """
+        items = self._items[:self._logical_size]
+        if self._dtype.kind == 'O' and not _all_immutable(items):
+            items = copy.deepcopy(items, memo)
+        else:
+            items = items.copy()
+        new_array = Array._from_pickle(items, self._dtype.str, copy.deepcopy(self._default_item_value, memo),
+                                       copy.deepcopy(self._growth_policy, memo), self._index is not None)
+        memo[id(self)] = new_array
+        return new_array
+
+    def snapshot(self) -> 'Array':
+        """ Copy-on-write copy in O(1): the snapshot shares this Array's buffer until either of them is
+            changed, and whichever is written to first copies the buffer at that point. numpy views
+            taken from either side while the buffer is shared are read-only.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 3], dtype='int64')
+            >>> frozen = array.snapshot()
+            >>> array[0] = 100
+            >>> print(array, frozen)
+            [100   2   3] [1 2 3]
+
+        Returns:
+            array (Array): an independent Array with the same items.
+        """
+        if self._owners is None:
+            self._owners = [1]
+        self._owners[0] += 1
+        self._track_buffer()
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._buffer_hook = None
+        clone._track_buffer()
+        if self._index is not None:
+            # rebuilt on the snapshot's first lookup, so taking the snapshot stays O(1)
+            clone._index = HashIndex()
+            clone._index.invalidate()
+        return clone
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """ numpy conversion (np.asarray(array)). Returns a view of the logical items, not a copy,
+            unless a different dtype or copy=True is requested. The view refers to the current
+            buffer: after the Array reallocates (e.g. when an append grows it) the two are independent.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 3], dtype='int64')
+            >>> values = np.asarray(array)
+            >>> values[0] = 10
+            >>> print(array[0], values.sum())
+            10 15
+
+        Args:
+            dtype (Any): the dtype of the result (default is None, the Array's dtype).
+            copy (bool | None): True to always copy, False to never copy, None to copy only if needed.
+
+        Returns:
+            values (np.ndarray): the logical items.
+
+        Raises:
+            ValueError: if copy is False but a copy is needed to convert the dtype.
+        """
+        values = self._guard_export(self._items[:self._logical_size])
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            if copy is False:
+                raise ValueError(f'Cannot convert {values.dtype} to {np.dtype(dtype)} without a copy')
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    @property
+    def __array_interface__(self) -> dict:
+        """ numpy array interface for typed Arrays, describing the logical items in place (no copy).
+            The data entry holds a view of the buffer, so the memory stays valid as long as the
+            consumer keeps it. Not available for object dtype, which falls back to __array__.
+
+        Examples:
+            >>> array = Array.from_list([1.0, 2.0], dtype='float32')
+            >>> print(array.__array_interface__['shape'], array.__array_interface__['typestr'])
+            (2,) <f4
+
+        Returns:
+            interface (dict): the numpy array interface.
+
+        Raises:
+            AttributeError: if the Array stores Python objects.
+        """
+        if self._dtype.kind == 'O':
+            raise AttributeError('Arrays of Python objects do not expose __array_interface__')
+        values = self._guard_export(self._items[:self._logical_size])
+        interface = dict(values.__array_interface__)
+        interface['data'] = values
+        return interface
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """ Buffer protocol (PEP 688, Python 3.12+): memoryview(array) exposes the logical items of a
+            typed Array without copying. On older Pythons call this method directly.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 3], dtype='uint8')
+            >>> print(bytes(array.__buffer__(0)))
+            b'\\x01\\x02\\x03'
+
+        Args:
+            flags (int): the buffer request flags.
+
+        Returns:
+            buffer (memoryview): a memoryview of the logical items.
+
+        Raises:
+            TypeError: if the Array stores Python objects.
+        """
+        if self._dtype.kind == 'O':
+            raise TypeError('Arrays of Python objects do not support the buffer protocol')
+        return memoryview(self._guard_export(self._items[:self._logical_size]))
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        """ numpy ufunc support: np.add(array, 1), np.sqrt(array), np.multiply.reduce(array), ...
+            Arrays in the inputs (and in out=) are replaced with views of their logical items, and
+            one-dimensional results come back as new Arrays.
+
+        Examples:
+            >>> array = Array.from_list([1, 4, 9], dtype='float64')
+            >>> result = np.sqrt(array)
+            >>> print(type(result).__name__, result)
+            Array [1. 2. 3.]
+            >>> print(np.add.reduce(array))
+            14.0
+
+        Args:
+            ufunc (np.ufunc): the ufunc being called.
+            method (str): the ufunc method ('__call__', 'reduce', 'accumulate', ...).
+            inputs (Any): the ufunc inputs.
+            kwargs (Any): the ufunc keyword arguments.
+
+        Returns:
+            result (Any): an Array for one-dimensional results, otherwise what numpy returns.
+        """
+        inputs = tuple(np.asarray(x) if isinstance(x, (Array, ArrayView)) else x for x in inputs)
+        out = kwargs.get('out')
+        if out is not None:
+            for x in out:
+                if isinstance(x, (Array, ArrayView)):
+                    (x if isinstance(x, Array) else x._array)._ensure_writable()
+            kwargs['out'] = tuple(np.asarray(x) if isinstance(x, (Array, ArrayView)) else x for x in out)
+
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+        if isinstance(result, tuple):
+            return tuple(Array._wrap_ufunc_result(item) for item in result)
+        return Array._wrap_ufunc_result(result)
+
+    @staticmethod
+    def _wrap_ufunc_result(result: Any) -> Any:
+        """ Wrap a one-dimensional ndarray of a supported dtype in an Array; return anything else as is. """
+        if isinstance(result, np.ndarray) and result.ndim == 1 and (
+                result.dtype.kind == 'O' or result.dtype in _TYPED_DTYPES):
+            return Array.from_numpy(result)
+        return result
 
     def __str__(self) -> str:
         """ Return a string representation of the data and structure. 
@@ -394,3 +1729,480 @@ class Array:
         """
         return self.__str__()
 
+
+class ArrayView:
+    """ Class ArrayView - a window onto a range of an Array, created by slicing it (array[a:b:step]).
+            The view does not copy any items: reads and writes go straight to the Array's buffer.
+            It always refers to the Array's current buffer, so it stays valid when the Array
+            reallocates. It covers a fixed set of indices, clamped to the Array's current length:
+            indices past the end of the Array (e.g. after items were deleted) are left out.
+    """
+
+    def __init__(self, array: Array, indices: range) -> None:
+        """ ArrayView Constructor. Use slicing on an Array (array[a:b]) instead of calling this directly.
+
+        Examples:
+            >>> array = Array.from_list([0, 1, 2, 3, 4, 5])
+            >>> view = array[::2]
+            >>> print(view)
+            [0 2 4]
+
+        Args:
+            array (Array): the Array the view refers to.
+            indices (range): the indices of the Array that the view covers.
+
+        Returns:
+            None
+        """
+        self._array = array
+        self._indices = indices
+
+    def _live_indices(self) -> range:
+        """ The covered indices that are still within the Array's current length. """
+        indices, size = self._indices, self._array._logical_size
+        if indices.step > 0:
+            return indices[:len(range(indices.start, min(indices.stop, size), indices.step))]
+        # a reversed view starts at its highest index: drop the leading indices past the end
+        return indices[len(range(indices.start, max(size - 1, indices.stop), indices.step)):]
+
+    def _values(self) -> np.ndarray:
+        """ Return a numpy view of the covered items (never a copy). """
+        indices = self._live_indices()
+        if not indices:
+            return self._array._items[:0]
+        start, stop, step = indices.start, indices.stop, indices.step
+        return self._array._items[start:stop if stop >= 0 else None:step]
+
+    def __len__(self) -> int:
+        """ Length operator for getting the number of items in the view.
+
+        Examples:
+            >>> array = Array.from_list([0, 1, 2, 3, 4, 5])
+            >>> print(len(array[1:5]))
+            4
+
+        Returns:
+            length (int): the number of items in the view.
+        """
+        return len(self._live_indices())
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """ Bracket operator for getting an item from the view. Index 0 is the first item of the view.
+            A slice returns a narrower ArrayView of the same Array.
+
+        Examples:
+            >>> array = Array.from_list([0, 1, 2, 3, 4, 5])
+            >>> view = array[2:]
+            >>> print(view[0])
+            2
+            >>> print(view[1:3])
+            [3 4]
+
+        Args:
+            index (int | slice): the desired index into the view, or a slice of indices.
+
+        Returns:
+            Any: the item at the index, or an ArrayView for a slice.
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        indices = self._live_indices()
+        if isinstance(index, slice):
+            return ArrayView(self._array, indices[index])
+
+        if index < 0 or index >= len(indices):
+            raise IndexError('Must be in range of view.')
+        return self._array[indices[index]]
+
+    def __setitem__(self, index: int | slice, data: Any) -> None:
+        """ Bracket operator for setting an item through the view. The Array sees the change.
+            Assigning to a slice of the view copies `data` (a sized iterable of matching length) in.
+
+        Examples:
+            >>> array = Array.from_list([0, 1, 2, 3, 4, 5])
+            >>> view = array[3:]
+            >>> view[0] = 30
+            >>> view[1:] = [40, 50]
+            >>> print(array)
+            [0 1 2 30 40 50]
+
+        Args:
+            index (int | slice): the desired index into the view, or a slice of indices.
+            data (Any): the item to set, or the items to set for a slice.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+            ValueError: if a slice is assigned the wrong number of items.
+        """
+        indices = self._live_indices()
+        if isinstance(index, slice):
+            target = ArrayView(self._array, indices[index])
+            block = self._array._to_block(data)
+            if len(block) != len(target):
+                raise ValueError(f'Expected {len(target)} items, got {len(block)}')
+            self._array._ensure_writable()
+            target._values()[:] = block
+            self._array.invalidate_index()
+            return
+
+        if index < 0 or index >= len(indices):
+            raise IndexError('Must be in range of view.')
+        self._array[indices[index]] = data
+
+    def __iter__(self) -> Any:
+        """ Iterator operator. Allows for iteration over the view.
+
+        Examples:
+            >>> array = Array.from_list(['zero', 'one', 'two', 'three'])
+            >>> for item in array[1:3]: print(item, end=' ')
+            one two 
+
+        Yields:
+            item (Any): yields the item at index
+        """
+        yield from self._values()
+
+    def __reversed__(self) -> Any:
+        """ Reversed iterator operator. Allows for iteration over the view in reverse.
+
+        Examples:
+            >>> array = Array.from_list(['zero', 'one', 'two', 'three'])
+            >>> for item in reversed(array[1:3]): print(item, end=' ')
+            two one 
+
+        Yields:
+            item (Any): yields the item at index starting at the end
+        """
+        yield from self._values()[::-1]
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in). Checks if the view contains the item.
+
+        Examples:
+            >>> array = Array.from_list(['zero', 'one', 'two', 'three'])
+            >>> print('zero' in array[1:])
+            False
+
+        Args:
+            item (Any): the desired item to check whether it's in the view.
+
+        Returns:
+            contains_item (bool): true if the view contains the item.
+        """
+        return bool(_match_items(self._values(), item).any())
+
+    def __eq__(self, other: object) -> bool:
+        """ Equality operator ==. A view is equal to another view or Array with the same items.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 1, 2])
+            >>> print(array[:2] == array[2:])
+            True
+
+        Args:
+            other (object): the ArrayView or Array to compare to.
+
+        Returns:
+            is_equal (bool): true if both hold equal items in the same order.
+
+        Raises:
+            TypeError: if other is not an ArrayView or Array.
+        """
+        if isinstance(other, Array):
+            other = other[:]
+        if not isinstance(other, ArrayView):
+            raise TypeError("Input must be an array or array view.")
+        values, other_values = self._values(), other._values()
+        return len(values) == len(other_values) and bool(np.array_equal(values, other_values))
+
+    def __ne__(self, other: object) -> bool:
+        """ Non-Equality operator !=.
+
+        Args:
+            other (object): the ArrayView or Array to compare to.
+
+        Returns:
+            is_not_equal (bool): true if the items differ.
+        """
+        return not self.__eq__(other)
+
+    def copy(self) -> Array:
+        """ Copy the items of the view into a new, independent Array.
+
+        Examples:
+            >>> array = Array.from_list([0, 1, 2, 3])
+            >>> copied = array[1:3].copy()
+            >>> copied[0] = 100
+            >>> print(array[1], copied)
+            1 [100 2]
+
+        Returns:
+            array (Array): a new Array with the same dtype and default value holding the view's items.
+        """
+        return Array.from_numpy(self._values().copy(), default_item_value=self._array._default_item_value)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """ numpy conversion (np.asarray(view)). Returns a numpy view of the covered items, not a copy,
+            unless a different dtype or copy=True is requested.
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 3, 4], dtype='int64')
+            >>> print(np.asarray(array[1:3]).sum())
+            5
+
+        Args:
+            dtype (Any): the dtype of the result (default is None, the Array's dtype).
+            copy (bool | None): True to always copy, False to never copy, None to copy only if needed.
+
+        Returns:
+            values (np.ndarray): the covered items.
+        """
+        values = self._array._guard_export(self._values())
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            if copy is False:
+                raise ValueError(f'Cannot convert {values.dtype} to {np.dtype(dtype)} without a copy')
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    def __str__(self) -> str:
+        """ Return a string representation of the items in the view. """
+        return str(self._values())
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the items in the view. """
+        return self.__str__()
+
+
+class LazyArray:
+    """ Class LazyArray - a recorded chain of map, filter and take steps over an Array.
+            Stipulations:
+            1. Nothing runs until a terminal operation: iteration, collect(), sum(), count(), any() or all().
+               Every step returns a new LazyArray, so a pipeline can be reused or branched.
+            2. When every map and filter step is vectorized (a numpy ufunc, or vectorized=True), the Array
+               is processed in blocks of numpy views and each step runs once per block. Otherwise the
+               steps run item by item as one chain of iterators. Either way no intermediate Array is built.
+            3. take() and any()/all() stop reading the Array as soon as the result is known.
+            4. The Array must not be changed while a terminal operation runs.
+    """
+
+    def __init__(self, source: Array, steps: tuple = ()) -> None:
+        """ LazyArray Constructor. Use Array.lazy() instead of calling it directly.
+
+        Args:
+            source (Array): the Array the steps read from.
+            steps (tuple): (kind, function or count, vectorized) for each recorded step.
+
+        Returns:
+            None
+        """
+        self._source = source
+        self._steps = steps
+
+    def _then(self, kind: str, argument: Any, vectorized: bool = False) -> 'LazyArray':
+        """ A new LazyArray with one more step. """
+        return LazyArray(self._source, self._steps + ((kind, argument, vectorized),))
+
+    def map(self, fn: Callable, vectorized: bool = False) -> 'LazyArray':
+        """ Record a step that replaces each item with fn(item).
+
+        Examples:
+            >>> array = Array.from_list([1, 2, 3], dtype='int64')
+            >>> print(array.lazy().map(np.square).collect())
+            [1 4 9]
+
+        Args:
+            fn (Callable): the function; a numpy ufunc is applied to whole blocks.
+            vectorized (bool): fn takes a numpy block and returns a block of the same length, so it is
+                applied to whole blocks like a ufunc (default is False).
+
+        Returns:
+            pipeline (LazyArray): a new LazyArray with the step added.
+        """
+        return self._then('map', fn, vectorized or isinstance(fn, np.ufunc))
+
+    def filter(self, predicate: Callable, vectorized: bool = False) -> 'LazyArray':
+        """ Record a step that keeps only the items for which predicate(item) is true.
+
+        Examples:
+            >>> array = Array.from_list([1, -2, 3, -4], dtype='int64')
+            >>> print(array.lazy().filter(lambda block: block > 0, vectorized=True).collect())
+            [1 3]
+
+        Args:
+            predicate (Callable): the test; a numpy ufunc is applied to whole blocks.
+            vectorized (bool): predicate takes a numpy block and returns one flag per item, so it is
+                applied to whole blocks like a ufunc (default is False).
+
+        Returns:
+            pipeline (LazyArray): a new LazyArray with the step added.
+        """
+        return self._then('filter', predicate, vectorized or isinstance(predicate, np.ufunc))
+
+    def take(self, count: int) -> 'LazyArray':
+        """ Record a step that keeps only the first `count` items; no more items are read after that.
+
+        Examples:
+            >>> array = Array.from_list(['a', 'bb', 'ccc', 'dddd'])
+            >>> print(list(array.lazy().map(len).filter(lambda n: n % 2 == 0).take(1)))
+            [2]
+
+        Args:
+            count (int): the maximum number of items.
+
+        Returns:
+            pipeline (LazyArray): a new LazyArray with the step added.
+
+        Raises:
+            ValueError: if count is negative.
+        """
+        if count < 0:
+            raise ValueError('count must not be negative')
+        return self._then('take', count, True)
+
+    @property
+    def vectorized(self) -> bool:
+        """ Property for checking whether the pipeline runs block by block (every step vectorized).
+
+        Returns:
+            vectorized (bool): true if every map and filter step is vectorized.
+        """
+        return all(vectorized for _, _, vectorized in self._steps)
+
+    def _blocks(self) -> Any:
+        """ Run a vectorized pipeline, yielding the non-empty result blocks. """
+        remaining = {position: count for position, (kind, count, _) in enumerate(self._steps) if kind == 'take'}
+        if 0 in remaining.values():
+            return
+        for block in self._source.iter_chunks(_LAZY_BLOCK_SIZE):
+            for position, (kind, fn, _) in enumerate(self._steps):
+                if kind == 'map':
+                    result = np.asarray(fn(block))
+                    if result.shape != block.shape:
+                        raise ValueError(f'map returned {result.shape} items for a block of {len(block)}')
+                    block = result
+                elif kind == 'filter':
+                    mask = np.asarray(fn(block), dtype=bool)
+                    if mask.shape != block.shape:
+                        raise ValueError(f'filter returned {mask.shape} flags for a block of {len(block)}')
+                    block = block[mask]
+                else:
+                    block = block[:remaining[position]]
+                    remaining[position] -= len(block)
+            if len(block):
+                yield block
+            if 0 in remaining.values():
+                return
+
+    def __iter__(self) -> Any:
+        """ Iterator operator. Runs the pipeline, yielding the resulting items one at a time.
+
+        Yields:
+            item (Any): the next item that passes every step.
+        """
+        if self.vectorized:
+            for block in self._blocks():
+                yield from block
+            return
+        items = self._source.iter_fast()
+        for kind, argument, _ in self._steps:
+            if kind == 'map':
+                items = map(argument, items)
+            elif kind == 'filter':
+                items = filter(argument, items)
+            else:
+                items = islice(items, argument)
+        yield from items
+
+    def collect(self, dtype: Any = None) -> Array:
+        """ Run the pipeline and store the results in a new Array.
+
+        Examples:
+            >>> array = Array.from_list(list(range(10)), dtype='int64')
+            >>> print(array.lazy().filter(lambda n: n % 3 == 0).map(str).collect())
+            ['0' '3' '6' '9']
+
+        Args:
+            dtype (Any): the dtype of the new Array (default is None: the numeric or bool dtype the results
+                have in common, object otherwise).
+
+        Returns:
+            array (Array): the results.
+        """
+        if self.vectorized:
+            blocks = list(self._blocks())
+            values = np.concatenate(blocks) if blocks else np.empty(0, dtype=self._source.dtype)
+            if dtype is None:
+                dtype = values.dtype if values.dtype in _TYPED_DTYPES else object
+            # concatenate always copies, so the new Array can adopt the result
+            return Array.from_numpy(values.astype(dtype, copy=False))
+        values = np.fromiter(iter(self), dtype=object)
+        values = _typed_values(values) if dtype is None else values.astype(dtype)
+        return Array.from_numpy(values)
+
+    def sum(self, start: Any = 0) -> Any:
+        """ Run the pipeline and add up the results (a numpy reduction per block when vectorized).
+
+        Examples:
+            >>> array = Array.from_list(list(range(1, 101)), dtype='int64')
+            >>> print(array.lazy().map(np.square).take(3).sum())
+            14
+
+        Args:
+            start (Any): the value added to (default is 0).
+
+        Returns:
+            total (Any): start plus every resulting item.
+        """
+        if self.vectorized:
+            for block in self._blocks():
+                start = start + block.sum()
+            return start
+        return sum(self, start)
+
+    def count(self) -> int:
+        """ Run the pipeline and count the results.
+
+        Returns:
+            count (int): the number of resulting items.
+        """
+        if self.vectorized:
+            return sum(len(block) for block in self._blocks())
+        return sum(1 for _ in self)
+
+    def any(self) -> bool:
+        """ Check whether any result is truthy, stopping at the first one.
+
+        Examples:
+            >>> array = Array.from_list([0, 0, 5, 0], dtype='int64')
+            >>> print(array.lazy().map(np.negative).any())
+            True
+
+        Returns:
+            any (bool): true if at least one resulting item is truthy.
+        """
+        if self.vectorized:
+            return any(bool(block.any()) for block in self._blocks())
+        return any(self)
+
+    def all(self) -> bool:
+        """ Check whether every result is truthy, stopping at the first one that is not.
+
+        Returns:
+            all (bool): true if no resulting item is falsy (true when there are no results).
+        """
+        if self.vectorized:
+            return all(bool(block.all()) for block in self._blocks())
+        return all(self)
+
+    def __str__(self) -> str:
+        """ Return a string describing the recorded steps (the pipeline is not run). """
+        steps = ''.join(f'.{kind}({getattr(argument, "__name__", argument)})' for kind, argument, _ in self._steps)
+        return f'{self._source.__class__.__name__}({len(self._source)} items).lazy(){steps}'
+
+    def __repr__(self) -> str:
+        """ Return a string describing the recorded steps (the pipeline is not run). """
+        return self.__str__()
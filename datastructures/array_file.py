@@ -0,0 +1,112 @@
+# datastructures.array_file
+
+""" This module defines the on-disk format shared by MappedArray and Array.save()/Array.load().
+    A file is a 64 byte header followed by the raw items (capacity * itemsize bytes):
+
+        magic     8 bytes   b'DSARRAYF'
+        version   uint32    format version (currently 1)
+        reserved  4 bytes
+        dtype     16 bytes  numpy dtype string, e.g. b'<f8'
+        size      uint64    logical size (number of items)
+        capacity  uint64    number of item slots in the file
+        default   8 bytes   raw bytes of the default item value
+        reserved  8 bytes
+
+    All header fields are little-endian. Only typed (non-object) dtypes can be stored.
+"""
+
+from __future__ import annotations
+import os
+from typing import Any, NamedTuple
+import numpy as np
+
+
+MAGIC = b'DSARRAYF'
+VERSION = 1
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('reserved', 'V4'),
+    ('dtype', 'S16'),
+    ('size', '<u8'),
+    ('capacity', '<u8'),
+    ('default', 'V8'),
+    ('padding', 'V8'),
+])
+HEADER_SIZE = HEADER_DTYPE.itemsize
+
+
+class ArrayFileHeader(NamedTuple):
+    """ The decoded header of an array file. """
+    dtype: np.dtype
+    default_item_value: Any
+    size: int
+    capacity: int
+
+
+def encode_header(dtype: np.dtype, default_item_value: Any, size: int, capacity: int) -> np.ndarray:
+    """ Build the header record for an array file.
+
+    Examples:
+        >>> header = encode_header(np.dtype('int32'), 7, size=2, capacity=4)
+        >>> print(decode_header(header))
+        ArrayFileHeader(dtype=dtype('int32'), default_item_value=np.int32(7), size=2, capacity=4)
+
+    Args:
+        dtype (np.dtype): the dtype of the items.
+        default_item_value (Any): the default value of the Array.
+        size (int): the logical size.
+        capacity (int): the number of item slots that follow the header.
+
+    Returns:
+        header (np.ndarray): a one-element array of HEADER_DTYPE.
+
+    Raises:
+        TypeError: if dtype is the object dtype.
+    """
+    if dtype.kind == 'O':
+        raise TypeError('Arrays of Python objects cannot be stored in an array file')
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header['magic'] = MAGIC
+    header['version'] = VERSION
+    header['dtype'] = dtype.str.encode('ascii')
+    header['size'] = size
+    header['capacity'] = capacity
+    header['default'] = np.array([default_item_value], dtype=dtype).tobytes().ljust(8, b'\x00')
+    return header
+
+
+def decode_header(header: np.ndarray) -> ArrayFileHeader:
+    """ Decode a header record, checking the magic bytes and version.
+
+    Args:
+        header (np.ndarray): a one-element array of HEADER_DTYPE.
+
+    Returns:
+        header (ArrayFileHeader): the decoded fields.
+
+    Raises:
+        ValueError: if the record is not a supported array file header.
+    """
+    if len(header) != 1 or header['magic'][0] != MAGIC:
+        raise ValueError('Not an array file')
+    if header['version'][0] != VERSION:
+        raise ValueError(f'Unsupported array file version {header["version"][0]}')
+    dtype = np.dtype(header['dtype'][0].decode('ascii'))
+    default_item_value = np.frombuffer(header['default'][0].tobytes()[:dtype.itemsize], dtype=dtype)[0]
+    return ArrayFileHeader(dtype, default_item_value, int(header['size'][0]), int(header['capacity'][0]))
+
+
+def read_header(path: str | os.PathLike) -> ArrayFileHeader:
+    """ Read and decode the header of an array file without touching the items.
+
+    Args:
+        path (str | os.PathLike): the file to read.
+
+    Returns:
+        header (ArrayFileHeader): the decoded fields.
+
+    Raises:
+        ValueError: if the file is not a supported array file.
+    """
+    return decode_header(np.fromfile(path, dtype=HEADER_DTYPE, count=1))
@@ -0,0 +1,620 @@
+# datastructures.bool_array.BoolArray
+
+""" This module defines a BoolArray class: a one-dimensional array of flags packed 64 to a uint64 word.
+    Flag i lives in word i // 64 at bit i % 64 (least significant bit first), so a BoolArray uses
+    one bit per flag instead of one object reference. Counting and the bitwise operators work a
+    whole word at a time, and bulk updates unpack and repack only the words they touch.
+"""
+
+from __future__ import annotations
+from typing import Any, Iterable, Iterator
+import numpy as np
+
+from datastructures.array import Array
+from datastructures.growth_policy import GrowthPolicy, DoublingGrowth
+
+
+_WORD_BITS = 64
+_ALL_SET = np.uint64(0xFFFFFFFFFFFFFFFF)
+# number of flags unpacked at a time while iterating.
+_ITER_CHUNK_BITS = 1 << 16
+
+
+def _popcount(words: np.ndarray) -> int:
+    """ Count the set bits in `words`, with numpy's popcount where available (numpy 2.0+). """
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+
+class BoolArray:
+    """ Class BoolArray - an Array of bools that stores 64 flags per uint64 word.
+            Stipulations:
+            1. Every item is a bool; assigned values are converted with bool().
+            2. Bits past the logical size are always zero, so counts and comparisons can work on whole words.
+            3. Negative indices are not supported, as in Array.
+    """
+
+    def __init__(self, size: int = 0, default_item_value: bool = False,
+                 growth_policy: GrowthPolicy | None = None) -> None:
+        """ BoolArray Constructor. Initializes `size` flags to the default value.
+
+        Examples:
+            >>> flags = BoolArray(size=3, default_item_value=True)
+            >>> print(flags)
+            [ True  True  True]
+
+        Args:
+            size (int): the initial number of flags (default is 0).
+            default_item_value (bool): the value of new flags (default is False).
+            growth_policy (GrowthPolicy): how the number of words grows and shrinks (default is DoublingGrowth()).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if size is negative.
+        """
+        if size < 0:
+            raise ValueError('size must not be negative')
+        self._default_item_value = bool(default_item_value)
+        self._growth_policy = growth_policy if growth_policy is not None else DoublingGrowth()
+        self._words = np.zeros(self._words_for(size), dtype=np.uint64)
+        self._logical_size = 0
+        self.resize(size)
+
+    @staticmethod
+    def _words_for(bits: int) -> int:
+        """ Number of words needed to hold `bits` flags. """
+        return -(-bits // _WORD_BITS)
+
+    @staticmethod
+    def from_list(list_items: list) -> 'BoolArray':
+        """ Create a BoolArray from a Python list.
+
+        Examples:
+            >>> print(BoolArray.from_list([True, False, 1, 0]))
+            [ True False  True False]
+
+        Args:
+            list_items (list): the flags (any values, converted with bool()).
+
+        Returns:
+            flags (BoolArray): a new BoolArray holding the flags.
+
+        Raises:
+            TypeError: if list_items is not a list.
+        """
+        if not isinstance(list_items, list):
+            raise TypeError("Input must be a list")
+        flags = BoolArray()
+        flags.extend(list_items)
+        return flags
+
+    @staticmethod
+    def from_numpy(ndarray: np.ndarray) -> 'BoolArray':
+        """ Create a BoolArray from a one-dimensional numpy array (non-zero items become True).
+
+        Args:
+            ndarray (np.ndarray): the flags.
+
+        Returns:
+            flags (BoolArray): a new BoolArray holding the flags.
+
+        Raises:
+            ValueError: if ndarray is not one-dimensional.
+        """
+        if np.ndim(ndarray) != 1:
+            raise ValueError("Input must be one-dimensional")
+        flags = BoolArray()
+        flags.extend(np.asarray(ndarray, dtype=bool))
+        return flags
+
+    @property
+    def nbytes(self) -> int:
+        """ Property for getting the number of bytes used by the words (including spare capacity).
+
+        Examples:
+            >>> print(BoolArray(size=1000).nbytes)
+            128
+
+        Returns:
+            nbytes (int): the size of the packed storage in bytes.
+        """
+        return self._words.nbytes
+
+    def _unpack(self, first_word: int, last_word: int) -> np.ndarray:
+        """ Unpack words [first_word, last_word) into a bool array of 64 flags per word. """
+        raw = self._words[first_word:last_word].astype('<u8', copy=False).view(np.uint8)
+        return np.unpackbits(raw, bitorder='little').view(bool)
+
+    @staticmethod
+    def _pack(bits: np.ndarray) -> np.ndarray:
+        """ Pack a bool array whose length is a multiple of 64 into words. """
+        return np.packbits(bits, bitorder='little').view('<u8').astype(np.uint64, copy=False)
+
+    def _write_bits(self, start: int, bits: np.ndarray) -> None:
+        """ Write the flags `bits` at positions start, start + 1, ..., repacking only the words they touch. """
+        if len(bits) == 0:
+            return
+        first_word = start // _WORD_BITS
+        last_word = self._words_for(start + len(bits))
+        region = self._unpack(first_word, last_word).copy()
+        offset = start - first_word * _WORD_BITS
+        region[offset:offset + len(bits)] = bits
+        self._words[first_word:last_word] = self._pack(region)
+
+    def _bits(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """ The flags [start, stop) as a bool array (a copy). """
+        stop = self._logical_size if stop is None else stop
+        first_word = start // _WORD_BITS
+        offset = start - first_word * _WORD_BITS
+        return self._unpack(first_word, self._words_for(stop))[offset:offset + stop - start]
+
+    def _grow_to(self, bits: int) -> None:
+        """ Make room for `bits` flags, growing the words per the growth policy. """
+        required = self._words_for(bits)
+        if required > len(self._words):
+            capacity = max(required, self._growth_policy.grow(len(self._words), required))
+            words = np.zeros(capacity, dtype=np.uint64)
+            words[:len(self._words)] = self._words
+            self._words = words
+
+    def _shrink_if_sparse(self) -> None:
+        """ Release words the growth policy says are unused. """
+        used = self._words_for(self._logical_size)
+        capacity = self._growth_policy.shrink(len(self._words), used)
+        if capacity is not None and used <= capacity < len(self._words):
+            self._words = self._words[:capacity].copy()
+
+    def __getitem__(self, index: int) -> bool:
+        """ Bracket operator for getting a flag.
+
+        Examples:
+            >>> flags = BoolArray.from_list([False, True])
+            >>> print(flags[1])
+            True
+
+        Args:
+            index (int): the desired index.
+
+        Returns:
+            flag (bool): the flag at the index.
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self._logical_size:
+            raise IndexError('Must be in range of array.')
+        word, bit = divmod(index, _WORD_BITS)
+        return bool((int(self._words[word]) >> bit) & 1)
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        """ Bracket operator for setting a flag.
+
+        Examples:
+            >>> flags = BoolArray(size=70)
+            >>> flags[65] = True
+            >>> print(flags.count(), flags[65])
+            1 True
+
+        Args:
+            index (int): the desired index to set.
+            data (Any): the flag (converted with bool()).
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self._logical_size:
+            raise IndexError(f'Index {index} out of bounds')
+        word, bit = divmod(index, _WORD_BITS)
+        if data:
+            self._words[word] = int(self._words[word]) | (1 << bit)
+        else:
+            self._words[word] = int(self._words[word]) & ~(1 << bit)
+
+    def append(self, data: Any) -> None:
+        """ Append a flag to the end.
+
+        Args:
+            data (Any): the flag (converted with bool()).
+
+        Returns:
+            None
+        """
+        self._grow_to(self._logical_size + 1)
+        self._logical_size += 1
+        self[self._logical_size - 1] = data
+
+    def extend(self, iterable: Iterable) -> None:
+        """ Append many flags at once; they are packed into words in one pass.
+
+        Examples:
+            >>> flags = BoolArray.from_list([True])
+            >>> flags.extend([False, True])
+            >>> print(flags)
+            [ True False  True]
+
+        Args:
+            iterable (Iterable): the flags (converted with bool()).
+
+        Returns:
+            None
+        """
+        if isinstance(iterable, BoolArray):
+            bits = iterable._bits()
+        elif isinstance(iterable, np.ndarray):
+            bits = iterable.astype(bool, copy=False)
+        else:
+            bits = np.fromiter((bool(item) for item in iterable), dtype=bool)
+        self._grow_to(self._logical_size + len(bits))
+        self._write_bits(self._logical_size, bits)
+        self._logical_size += len(bits)
+
+    def __len__(self) -> int:
+        """ Length operator for getting the number of flags.
+
+        Returns:
+            length (int): the number of flags.
+        """
+        return self._logical_size
+
+    def resize(self, new_size: int, default_value: bool | None = None) -> None:
+        """ Resize the BoolArray. Shrinking truncates (and clears the dropped bits); growing appends
+            default values.
+
+        Examples:
+            >>> flags = BoolArray.from_list([True, True])
+            >>> flags.resize(4, default_value=False)
+            >>> flags.resize(3)
+            >>> print(flags)
+            [ True  True False]
+
+        Args:
+            new_size (int): the desired new size.
+            default_value (bool | None): the value for new flags (default is None, the default value of the array).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the new size is less than 0.
+        """
+        if new_size < 0:
+            raise ValueError()
+        if new_size > self._logical_size:
+            fill = self._default_item_value if default_value is None else bool(default_value)
+            self._grow_to(new_size)
+            if fill:
+                self._write_bits(self._logical_size, np.ones(new_size - self._logical_size, dtype=bool))
+        else:
+            self._write_bits(new_size, np.zeros(self._logical_size - new_size, dtype=bool))
+        self._logical_size = new_size
+        self._shrink_if_sparse()
+
+    def __delitem__(self, index: int) -> None:
+        """ Delete a flag, moving the flags after it down by one (a word at a time).
+
+        Examples:
+            >>> flags = BoolArray.from_list([True, False, True])
+            >>> del flags[1]
+            >>> print(flags)
+            [ True  True]
+
+        Args:
+            index (int): the desired index to delete.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self._logical_size:
+            raise IndexError("Index out of range")
+        tail = self._bits(index + 1)
+        self._write_bits(index, np.append(tail, False))
+        self._logical_size -= 1
+        self._shrink_if_sparse()
+
+    def count(self, item: Any = True) -> int:
+        """ Count the flags equal to `item` with a popcount over the words.
+
+        Examples:
+            >>> flags = BoolArray.from_list([True, False, True])
+            >>> print(flags.count(), flags.count(False))
+            2 1
+
+        Args:
+            item (Any): the value to count (default is True).
+
+        Returns:
+            count (int): the number of matching flags (0 if item is not a bool value).
+        """
+        set_bits = _popcount(self._words)
+        flag = self._as_flag(item)
+        if flag is None:
+            return 0
+        return set_bits if flag else self._logical_size - set_bits
+
+    def any(self) -> bool:
+        """ Check whether any flag is set.
+
+        Returns:
+            any (bool): true if at least one flag is True.
+        """
+        return bool(self._words.any())
+
+    def all(self) -> bool:
+        """ Check whether every flag is set (true for an empty BoolArray).
+
+        Examples:
+            >>> print(BoolArray(size=100, default_item_value=True).all())
+            True
+
+        Returns:
+            all (bool): true if no flag is False.
+        """
+        full_words, tail_bits = divmod(self._logical_size, _WORD_BITS)
+        if not (self._words[:full_words] == _ALL_SET).all():
+            return False
+        return not tail_bits or int(self._words[full_words]) == (1 << tail_bits) - 1
+
+    def set_bits(self) -> np.ndarray:
+        """ Get the indices of every set flag. Only words with a bit set are unpacked.
+
+        Examples:
+            >>> flags = BoolArray(size=1000)
+            >>> flags[3] = flags[700] = True
+            >>> print(flags.set_bits())
+            [  3 700]
+
+        Returns:
+            indices (np.ndarray): the indices of the True flags, in increasing order.
+        """
+        words = np.flatnonzero(self._words)
+        if len(words) == 0:
+            return np.empty(0, dtype=np.intp)
+        raw = self._words[words].astype('<u8', copy=False).view(np.uint8)
+        bits = np.unpackbits(raw, bitorder='little').reshape(len(words), _WORD_BITS)
+        word_index, bit = np.nonzero(bits)
+        return (words[word_index] * _WORD_BITS + bit).astype(np.intp)
+
+    def _as_flag(self, item: Any) -> bool | None:
+        """ Convert `item` to the flag it equals, or None if it equals neither True nor False. """
+        try:
+            if item is True or item is False or item in (0, 1):
+                return bool(item)
+        except (TypeError, ValueError):
+            pass
+        return None
+
+    def index(self, item: Any) -> int:
+        """ Find the index of the first flag equal to `item`.
+
+        Args:
+            item (Any): the value to search for.
+
+        Returns:
+            index (int): the index of the first matching flag.
+
+        Raises:
+            ValueError: if no flag equals the item.
+        """
+        indices = self.find_all(item)
+        if len(indices) == 0:
+            raise ValueError(f'{item!r} is not in array')
+        return int(indices[0])
+
+    def find_all(self, item: Any) -> np.ndarray:
+        """ Find the indices of every flag equal to `item`.
+
+        Args:
+            item (Any): the value to search for.
+
+        Returns:
+            indices (np.ndarray): the matching indices, in increasing order.
+        """
+        flag = self._as_flag(item)
+        if flag is None:
+            return np.empty(0, dtype=np.intp)
+        if flag:
+            return self.set_bits()
+        return np.flatnonzero(~self._bits())
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in), answered from the words without unpacking them.
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            contains_item (bool): true if the array contains the item.
+        """
+        flag = self._as_flag(item)
+        if flag is None or self._logical_size == 0:
+            return False
+        return self.any() if flag else not self.all()
+
+    def __does_not_contain__(self, item: Any) -> bool:
+        """ Does not contain operator (not in).
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            does_not_contains_item (bool): true if the array does not contain the item.
+        """
+        return not self.__contains__(item)
+
+    def _combine(self, other: object, ufunc: np.ufunc) -> 'BoolArray':
+        """ Apply a bitwise ufunc word by word to two BoolArrays of the same length. """
+        if not isinstance(other, BoolArray):
+            return NotImplemented
+        if len(other) != self._logical_size:
+            raise ValueError(f'BoolArrays must have the same length ({self._logical_size} != {len(other)})')
+        used = self._words_for(self._logical_size)
+        result = BoolArray(default_item_value=self._default_item_value, growth_policy=self._growth_policy)
+        result._words = ufunc(self._words[:used], other._words[:used])
+        result._logical_size = self._logical_size
+        return result
+
+    def __and__(self, other: object) -> 'BoolArray':
+        """ Bitwise and (&) of two BoolArrays of the same length.
+
+        Examples:
+            >>> print(BoolArray.from_list([True, True, False]) & BoolArray.from_list([True, False, False]))
+            [ True False False]
+
+        Args:
+            other (object): the other BoolArray.
+
+        Returns:
+            flags (BoolArray): a new BoolArray.
+
+        Raises:
+            ValueError: if the lengths differ.
+        """
+        return self._combine(other, np.bitwise_and)
+
+    def __or__(self, other: object) -> 'BoolArray':
+        """ Bitwise or (|) of two BoolArrays of the same length.
+
+        Args:
+            other (object): the other BoolArray.
+
+        Returns:
+            flags (BoolArray): a new BoolArray.
+
+        Raises:
+            ValueError: if the lengths differ.
+        """
+        return self._combine(other, np.bitwise_or)
+
+    def __xor__(self, other: object) -> 'BoolArray':
+        """ Bitwise exclusive or (^) of two BoolArrays of the same length.
+
+        Args:
+            other (object): the other BoolArray.
+
+        Returns:
+            flags (BoolArray): a new BoolArray.
+
+        Raises:
+            ValueError: if the lengths differ.
+        """
+        return self._combine(other, np.bitwise_xor)
+
+    def __invert__(self) -> 'BoolArray':
+        """ Bitwise not (~): flip every flag. The bits past the end stay zero.
+
+        Examples:
+            >>> print(~BoolArray.from_list([True, False]))
+            [False  True]
+
+        Returns:
+            flags (BoolArray): a new BoolArray.
+        """
+        used = self._words_for(self._logical_size)
+        result = BoolArray(default_item_value=self._default_item_value, growth_policy=self._growth_policy)
+        result._words = ~self._words[:used]
+        result._logical_size = self._logical_size
+        tail_bits = self._logical_size % _WORD_BITS
+        if tail_bits:
+            result._words[-1] &= np.uint64((1 << tail_bits) - 1)
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        """ Equality operator ==. Two BoolArrays are compared word by word.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_equal (bool): true if both hold equal flags in the same order.
+
+        Raises:
+            TypeError: if other is not a BoolArray or Array.
+        """
+        if isinstance(other, BoolArray):
+            used = self._words_for(self._logical_size)
+            return (self._logical_size == other._logical_size
+                    and bool(np.array_equal(self._words[:used], other._words[:used])))
+        if not isinstance(other, Array):
+            raise TypeError("Input must be an array.")
+        return len(other) == self._logical_size and bool(np.array_equal(self._bits(), np.asarray(other)))
+
+    def __ne__(self, other: object) -> bool:
+        """ Non-Equality operator !=.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_not_equal (bool): true if the arrays are NOT equal.
+        """
+        return not self.__eq__(other)
+
+    def __iter__(self) -> Iterator[bool]:
+        """ Iterator operator. Unpacks the words a block at a time.
+
+        Yields:
+            flag (bool): yields the flag at index
+        """
+        for start in range(0, self._logical_size, _ITER_CHUNK_BITS):
+            yield from self._bits(start, min(start + _ITER_CHUNK_BITS, self._logical_size)).tolist()
+
+    def __reversed__(self) -> Iterator[bool]:
+        """ Reversed iterator operator.
+
+        Yields:
+            flag (bool): yields the flag at index starting at the end
+        """
+        for stop in range(self._logical_size, 0, -_ITER_CHUNK_BITS):
+            yield from self._bits(max(stop - _ITER_CHUNK_BITS, 0), stop)[::-1].tolist()
+
+    def clear(self) -> None:
+        """ Clear the BoolArray.
+
+        Returns:
+            None
+        """
+        self._words = np.zeros(0, dtype=np.uint64)
+        self._logical_size = 0
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """ numpy conversion (np.asarray(flags)): the flags unpacked into a bool array (always a copy).
+
+        Args:
+            dtype (Any): the dtype of the result (default is None, bool).
+            copy (bool | None): False is rejected because the flags must be unpacked.
+
+        Returns:
+            values (np.ndarray): the flags.
+
+        Raises:
+            ValueError: if copy is False.
+        """
+        if copy is False:
+            raise ValueError('A BoolArray cannot be converted to numpy without a copy')
+        values = self._bits()
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return str(self._bits())
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return self.__str__()
@@ -0,0 +1,222 @@
+# datastructures.buffer_pool.BufferPool
+
+""" This module defines a BufferPool class that recycles the numpy buffers behind Arrays.
+    Buffers are grouped in size classes (powers of two) per dtype. An Array that uses a pool takes
+    its buffers from it when it is constructed or grows, and gives the old buffer back when it
+    reallocates, is cleared or is garbage collected. The pool keeps at most max_bytes of idle
+    buffers and evicts the least recently released ones first.
+    Arrays only use a pool when one is passed to them (pool=...) or set with set_default_pool().
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+import sys
+import threading
+from typing import Any
+import weakref
+import numpy as np
+
+
+# references to a released base buffer that the pool itself accounts for: the released view's .base,
+# the local variable in release() and the argument of sys.getrefcount().
+_EXPECTED_REFERENCES = 3
+
+
+def size_class(capacity: int) -> int:
+    """ The size class of a buffer holding `capacity` items: the next power of two.
+
+    Examples:
+        >>> print(size_class(1), size_class(5), size_class(1024))
+        1 8 1024
+
+    Args:
+        capacity (int): the number of items needed (at least 1).
+
+    Returns:
+        size (int): the capacity of the pooled buffer.
+    """
+    return 1 << (capacity - 1).bit_length()
+
+
+class BufferPool:
+    """ Class BufferPool - a thread-safe, size-classed cache of idle numpy buffers.
+            Stipulations:
+            1. Only buffers that came from acquire() are taken back by release(); others are ignored.
+            2. A buffer is only pooled if nothing else still refers to it (e.g. a numpy view handed
+               out by the Array); otherwise it is left to the garbage collector.
+            3. Released object buffers are cleared, so the pool never keeps items alive.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """ BufferPool Constructor.
+
+        Examples:
+            >>> pool = BufferPool(max_bytes=1024)
+            >>> print(pool.max_bytes, pool.pooled_bytes)
+            1024 0
+
+        Args:
+            max_bytes (int): the most memory idle buffers may use (default is 64 MiB).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if max_bytes is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError('max_bytes must not be negative')
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # idle buffers in release order (least recently released first), keyed by id()
+        self._idle: OrderedDict[int, tuple[tuple[str, int], np.ndarray]] = OrderedDict()
+        # the ids of the idle buffers per (dtype, size class), most recently released last
+        self._classes: dict[tuple[str, int], dict[int, None]] = {}
+        # every buffer handed out and still alive, to recognize them when they come back
+        self._issued: weakref.WeakValueDictionary[int, np.ndarray] = weakref.WeakValueDictionary()
+        self._pooled_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejected = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """ Property for getting the memory cap for idle buffers.
+
+        Returns:
+            max_bytes (int): the cap in bytes.
+        """
+        return self._max_bytes
+
+    @property
+    def pooled_bytes(self) -> int:
+        """ Property for getting the memory used by idle buffers.
+
+        Returns:
+            pooled_bytes (int): the total size of the idle buffers in bytes.
+        """
+        return self._pooled_bytes
+
+    def acquire(self, capacity: int, dtype: Any) -> np.ndarray:
+        """ Get an uninitialized buffer of `capacity` items, reusing an idle one of the same dtype and
+            size class if there is one.
+
+        Examples:
+            >>> pool = BufferPool()
+            >>> buffer = pool.acquire(5, 'int64')
+            >>> pool.release(buffer)
+            True
+            >>> reused = pool.acquire(7, 'int64')
+            >>> print(len(reused), reused.base is buffer.base, pool.stats()['hits'])
+            7 True 1
+
+        Args:
+            capacity (int): the number of items.
+            dtype (Any): the numpy dtype of the items.
+
+        Returns:
+            buffer (np.ndarray): a view of exactly `capacity` items into a buffer of the size class.
+        """
+        dtype = np.dtype(dtype)
+        if capacity == 0:
+            return np.empty(0, dtype=dtype)
+        key = (dtype.str, size_class(capacity))
+        with self._lock:
+            ids = self._classes.get(key)
+            if ids:
+                buffer_id, _ = ids.popitem()
+                _, buffer = self._idle.pop(buffer_id)
+                self._pooled_bytes -= buffer.nbytes
+                self._hits += 1
+            else:
+                buffer = np.empty(key[1], dtype=dtype)
+                self._issued[id(buffer)] = buffer
+                self._misses += 1
+        return buffer[:capacity]
+
+    def release(self, buffer: np.ndarray) -> bool:
+        """ Give a buffer from acquire() back to the pool, evicting the least recently released idle
+            buffers if the pool goes over its memory cap.
+
+        Args:
+            buffer (np.ndarray): the buffer (or any view of it) that is no longer used.
+
+        Returns:
+            pooled (bool): true if the buffer is now idle in the pool; false if it did not come from
+                this pool, is still referenced elsewhere, or is larger than the cap.
+        """
+        base = buffer.base if isinstance(buffer.base, np.ndarray) else buffer
+        if self._issued.get(id(base)) is not base:
+            return False
+        with self._lock:
+            if id(base) in self._idle:
+                return True
+            if sys.getrefcount(base) > _EXPECTED_REFERENCES or base.nbytes > self._max_bytes:
+                self._rejected += 1
+                return False
+            if base.dtype.kind == 'O':
+                base.fill(None)
+            key = (base.dtype.str, len(base))
+            self._idle[id(base)] = (key, base)
+            self._classes.setdefault(key, {})[id(base)] = None
+            self._pooled_bytes += base.nbytes
+            while self._pooled_bytes > self._max_bytes:
+                self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """ Drop the least recently released idle buffer. """
+        buffer_id, (key, buffer) = self._idle.popitem(last=False)
+        del self._classes[key][buffer_id]
+        self._pooled_bytes -= buffer.nbytes
+        self._evictions += 1
+
+    def clear(self) -> None:
+        """ Drop every idle buffer. The statistics are kept.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._idle.clear()
+            self._classes.clear()
+            self._pooled_bytes = 0
+
+    def stats(self) -> dict:
+        """ Get the pool statistics.
+
+        Returns:
+            stats (dict): hits and misses of acquire(), evictions, rejected releases (buffers still
+                referenced elsewhere or over the cap), hit_rate, idle_buffers and pooled_bytes.
+        """
+        with self._lock:
+            requests = self._hits + self._misses
+            return {'hits': self._hits, 'misses': self._misses, 'evictions': self._evictions,
+                    'rejected': self._rejected, 'hit_rate': self._hits / requests if requests else 0.0,
+                    'idle_buffers': len(self._idle), 'pooled_bytes': self._pooled_bytes}
+
+
+_default_pool: BufferPool | None = None
+
+
+def default_pool() -> BufferPool | None:
+    """ The pool used by Arrays constructed without pool=.
+
+    Returns:
+        pool (BufferPool | None): the default pool, or None (the default) if Arrays allocate directly.
+    """
+    return _default_pool
+
+
+def set_default_pool(pool: BufferPool | None) -> None:
+    """ Set the pool used by Arrays constructed from now on without pool=.
+
+    Args:
+        pool (BufferPool | None): the pool, or None to allocate directly again.
+
+    Returns:
+        None
+    """
+    global _default_pool
+    _default_pool = pool
@@ -0,0 +1,723 @@
+# datastructures.chunked_array.ChunkedArray
+
+""" This module defines a ChunkedArray class: a one-dimensional array stored in fixed-size numpy blocks.
+    A directory (a Python list) holds the blocks in order. Growing at either end only allocates
+    one new block, so the whole buffer is never copied and memory never briefly triples the
+    way it does when a contiguous Array doubles. Random access stays O(1): index i lives in
+    block (i + head) // block_size at offset (i + head) % block_size.
+    The directory keeps empty slots (None) in front of the first block, so prepend fills a slot
+    instead of shifting the list; when they run out the front is doubled, which keeps prepend
+    amortized O(1) like append.
+    ChunkedArray follows the Array API with two differences: a slice is a copy (a new ChunkedArray),
+    not a zero-copy ArrayView, and there is no reserve(), since growing never copies anything.
+"""
+
+from __future__ import annotations
+from itertools import islice
+from typing import Any, Iterable, Iterator
+import numpy as np
+
+from datastructures.array import Array, _argsort, _match_items, _sort_keys
+
+
+class ChunkedArray:
+    """ Class ChunkedArray - a segmented array with the Array API plus O(1) prepend.
+            Stipulations:
+            1. Items are stored in numpy blocks of block_size items (object or typed dtype).
+            2. Slots outside the logical range always hold the default value.
+            3. At most one unused block is kept past the end, so deleting and appending at a block
+               boundary does not allocate every time. For the same reason there is no reserve():
+               spare blocks would be trimmed, and growing never copies existing blocks anyway.
+            4. Slicing returns a copy in a new ChunkedArray. Array returns an ArrayView sharing its
+               buffer, but a slice of a ChunkedArray may span several blocks, so it cannot be one view.
+    """
+
+    def __init__(self, size: int = 0, default_item_value: Any = None, dtype: Any = object,
+                 block_size: int = 4096) -> None:
+        """ ChunkedArray Constructor. Initializes the ChunkedArray with a size and default value.
+
+        Examples:
+            >>> array = ChunkedArray(size=3, default_item_value=0, block_size=2)
+            >>> print(array)
+            [0 0 0]
+
+        Args:
+            size (int): the initial number of items (default is 0).
+            default_item_value (Any): the default value (default is None, zero/False for typed dtypes).
+            dtype (Any): object (default), bool, int8-int64, uint8-uint64 or float16-float64.
+            block_size (int): the number of items per block (default is 4096).
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if dtype is not supported.
+            ValueError: if size is negative or block_size is less than 1.
+        """
+        if block_size < 1:
+            raise ValueError('block_size must be at least 1')
+        if size < 0:
+            raise ValueError('size must not be negative')
+        self._dtype = Array._validate_dtype(dtype)
+        if self._dtype.kind != 'O' and default_item_value is None:
+            default_item_value = self._dtype.type(0)
+        self._default_item_value = default_item_value
+        self._block_size = block_size
+        # slots before self._head // block_size are None, reserved for blocks added by prepend
+        self._blocks: list[np.ndarray | None] = []
+        self._head = 0
+        self._logical_size = 0
+        self.resize(size)
+
+    @staticmethod
+    def from_list(list_items: list, dtype: Any = object, block_size: int = 4096) -> 'ChunkedArray':
+        """ Create a ChunkedArray from a Python list.
+
+        Examples:
+            >>> array = ChunkedArray.from_list([1, 2, 3], block_size=2)
+            >>> print(array)
+            [1 2 3]
+
+        Args:
+            list_items (list): the list to create the ChunkedArray from.
+            dtype (Any): the dtype to store the items as (default is object).
+            block_size (int): the number of items per block (default is 4096).
+
+        Returns:
+            array (ChunkedArray): a new ChunkedArray containing the items from `list_items`.
+
+        Raises:
+            TypeError: if list_items is not a list.
+        """
+        if not isinstance(list_items, list):
+            raise TypeError("Input must be a list")
+        new_array = ChunkedArray(dtype=dtype, block_size=block_size)
+        new_array.extend(list_items)
+        return new_array
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Property for getting the numpy dtype of the blocks.
+
+        Returns:
+            dtype (np.dtype): the dtype of the items.
+        """
+        return self._dtype
+
+    @property
+    def block_size(self) -> int:
+        """ Property for getting the number of items per block.
+
+        Returns:
+            block_size (int): the block size.
+        """
+        return self._block_size
+
+    @property
+    def block_count(self) -> int:
+        """ Property for getting the number of allocated blocks.
+
+        Examples:
+            >>> array = ChunkedArray(size=5, block_size=2)
+            >>> print(array.block_count)
+            3
+
+        Returns:
+            block_count (int): the number of blocks in the directory.
+        """
+        return len(self._blocks) - self._head // self._block_size
+
+    @property
+    def capacity(self) -> int:
+        """ Property for getting the number of item slots in the allocated blocks.
+
+        Examples:
+            >>> array = ChunkedArray(size=5, block_size=4)
+            >>> print(array.capacity, len(array))
+            8 5
+
+        Returns:
+            capacity (int): block_count * block_size.
+        """
+        return self.block_count * self._block_size
+
+    def _new_block(self) -> np.ndarray:
+        """ Allocate one block filled with the default value. """
+        block = np.empty(self._block_size, dtype=self._dtype)
+        block.fill(self._default_item_value)
+        return block
+
+    def _locate(self, index: int) -> tuple[np.ndarray, int]:
+        """ Return the block holding logical `index` and the offset within it. """
+        block_index, offset = divmod(index + self._head, self._block_size)
+        return self._blocks[block_index], offset
+
+    def _segments(self, start: int, stop: int) -> Iterator[np.ndarray]:
+        """ Yield numpy views that together cover logical indices [start, stop), in order. """
+        position = start + self._head
+        end = stop + self._head
+        while position < end:
+            block_index, offset = divmod(position, self._block_size)
+            length = min(self._block_size - offset, end - position)
+            yield self._blocks[block_index][offset:offset + length]
+            position += length
+
+    def _trim(self) -> None:
+        """ Drop blocks past the end, keeping at most one spare block. """
+        if self._logical_size == 0:
+            del self._blocks[:self._head // self._block_size]
+            self._head = 0
+        needed = -(-(self._head + self._logical_size) // self._block_size)
+        del self._blocks[needed + 1:]
+
+    def _gather(self, start: int, stop: int) -> np.ndarray:
+        """ Copy logical indices [start, stop) into one contiguous numpy array. """
+        values = np.empty(stop - start, dtype=self._dtype)
+        position = 0
+        for segment in self._segments(start, stop):
+            values[position:position + len(segment)] = segment
+            position += len(segment)
+        return values
+
+    def _write(self, start: int, values: np.ndarray) -> None:
+        """ Copy `values` into logical indices [start, start + len(values)), block by block. """
+        position = 0
+        for segment in self._segments(start, start + len(values)):
+            segment[:] = values[position:position + len(segment)]
+            position += len(segment)
+
+    def _matches(self, item: Any) -> Iterator[tuple[int, np.ndarray]]:
+        """ Yield (logical index of the segment's first item, match mask) for every segment, in order. """
+        position = 0
+        for segment in self._segments(0, self._logical_size):
+            yield position, _match_items(segment, item)
+            position += len(segment)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """ Bracket operator for getting an item. A slice returns a new ChunkedArray holding a copy
+            of the covered items; only the blocks the slice spans are read.
+
+        Examples:
+            >>> array = ChunkedArray.from_list(['zero', 'one', 'two'], block_size=2)
+            >>> print(array[2])
+            two
+            >>> print(array[::-2])
+            ['two' 'zero']
+
+        Args:
+            index (int | slice): the desired index or slice of indices.
+
+        Returns:
+            Any: the item at the index, or a new ChunkedArray for a slice.
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if isinstance(index, slice):
+            return self._slice(range(self._logical_size)[index])
+        if index < 0 or index >= self._logical_size:
+            raise IndexError('Must be in range of array.')
+        block, offset = self._locate(index)
+        return block[offset]
+
+    def _slice(self, indices: range) -> 'ChunkedArray':
+        """ Copy the items at `indices` into a new ChunkedArray with the same dtype, default and block size. """
+        result = ChunkedArray(default_item_value=self._default_item_value, dtype=self._dtype,
+                              block_size=self._block_size)
+        if not indices:
+            return result
+        low, high = min(indices[0], indices[-1]), max(indices[0], indices[-1])
+        values = self._gather(low, high + 1)[indices[0] - low::indices.step]
+        for start in range(0, len(values), self._block_size):
+            block = result._new_block()
+            piece = values[start:start + self._block_size]
+            block[:len(piece)] = piece
+            result._blocks.append(block)
+        result._logical_size = len(values)
+        return result
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        """ Bracket operator for setting an item.
+
+        Examples:
+            >>> array = ChunkedArray.from_list(['zero', 'one', 'two'], block_size=2)
+            >>> array[2] = 'new two'
+            >>> print(array[2])
+            new two
+
+        Args:
+            index (int): the desired index to set.
+            data (Any): the desired data to set at index.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self._logical_size:
+            raise IndexError(f'Index {index} out of bounds')
+        block, offset = self._locate(index)
+        block[offset] = data
+
+    def append(self, data: Any) -> None:
+        """ Append an item to the end. Allocates at most one new block; nothing is copied.
+
+        Examples:
+            >>> array = ChunkedArray(block_size=2)
+            >>> for word in ['a', 'b', 'c']: array.append(word)
+            >>> print(array, array.block_count)
+            ['a' 'b' 'c'] 2
+
+        Args:
+            data (Any): the desired data to append.
+
+        Returns:
+            None
+        """
+        block_index, offset = divmod(self._head + self._logical_size, self._block_size)
+        if block_index == len(self._blocks):
+            self._blocks.append(self._new_block())
+        self._blocks[block_index][offset] = data
+        self._logical_size += 1
+
+    def prepend(self, data: Any) -> None:
+        """ Insert an item at the front. Allocates at most one new block; nothing is copied.
+
+        Examples:
+            >>> array = ChunkedArray.from_list(['b', 'c'], block_size=2)
+            >>> array.prepend('a')
+            >>> print(array)
+            ['a' 'b' 'c']
+
+        Args:
+            data (Any): the desired data to prepend.
+
+        Returns:
+            None
+        """
+        if self._head == 0:
+            # double the empty slots in front of the first block (at least one)
+            reserved = max(1, len(self._blocks))
+            self._blocks[:0] = [None] * reserved
+            self._head = reserved * self._block_size
+        self._head -= 1
+        block_index, offset = divmod(self._head, self._block_size)
+        if self._blocks[block_index] is None:
+            self._blocks[block_index] = self._new_block()
+        self._blocks[block_index][offset] = data
+        self._logical_size += 1
+
+    def extend(self, iterable: Iterable) -> None:
+        """ Append every item of an iterable, copying block-sized pieces at a time.
+
+        Examples:
+            >>> array = ChunkedArray(dtype='int64', block_size=4)
+            >>> array.extend(range(6))
+            >>> print(array)
+            [0 1 2 3 4 5]
+
+        Args:
+            iterable (Iterable): the items to append.
+
+        Returns:
+            None
+        """
+        iterator = iter(iterable)
+        while True:
+            block, offset = divmod(self._head + self._logical_size, self._block_size)
+            if block == len(self._blocks):
+                self._blocks.append(self._new_block())
+            chunk = np.fromiter(islice(iterator, self._block_size - offset), dtype=self._dtype)
+            if len(chunk) == 0:
+                break
+            self._blocks[block][offset:offset + len(chunk)] = chunk
+            self._logical_size += len(chunk)
+        self._trim()
+
+    def __len__(self) -> int:
+        """ Length operator for getting the number of items.
+
+        Returns:
+            length (int): the number of items.
+        """
+        return self._logical_size
+
+    def resize(self, new_size: int, default_value: Any = None) -> None:
+        """ Resize the ChunkedArray. Shrinking truncates, growing appends default values.
+            Only whole blocks are added or dropped; existing blocks are never copied.
+
+        Examples:
+            >>> array = ChunkedArray.from_list([1, 2, 3], block_size=2)
+            >>> array.resize(5, default_value=0)
+            >>> print(array)
+            [1 2 3 0 0]
+            >>> array.resize(1)
+            >>> print(array)
+            [1]
+
+        Args:
+            new_size (int): the desired new size.
+            default_value (Any): the value for new items (default is None, the default value of the array).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the new size is less than 0.
+        """
+        if new_size < 0:
+            raise ValueError()
+        if new_size > self._logical_size:
+            needed = -(-(self._head + new_size) // self._block_size)
+            while len(self._blocks) < needed:
+                self._blocks.append(self._new_block())
+            fill_value = self._default_item_value if default_value is None else default_value
+            for segment in self._segments(self._logical_size, new_size):
+                segment.fill(fill_value)
+        else:
+            for segment in self._segments(new_size, self._logical_size):
+                segment.fill(self._default_item_value)
+        self._logical_size = new_size
+        self._trim()
+
+    def __delitem__(self, index: int) -> None:
+        """ Delete an item. The shorter side (front or back) is shifted by one, so deleting
+            near either end is cheap.
+
+        Examples:
+            >>> array = ChunkedArray.from_list(['zero', 'one', 'two', 'three'], block_size=2)
+            >>> del array[1]
+            >>> print(array)
+            ['zero' 'two' 'three']
+
+        Args:
+            index (int): the desired index to delete.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self._logical_size:
+            raise IndexError("Index out of range")
+
+        size = self._block_size
+        if index < self._logical_size // 2:
+            # shift the items before index one slot towards the back
+            first_block, first_offset = divmod(self._head, size)
+            last_block, last_offset = divmod(self._head + index, size)
+            for block_index in range(last_block, first_block - 1, -1):
+                block = self._blocks[block_index]
+                start = first_offset if block_index == first_block else 0
+                end = last_offset if block_index == last_block else size - 1
+                block[start + 1:end + 1] = block[start:end]
+                if block_index > first_block:
+                    block[0] = self._blocks[block_index - 1][size - 1]
+            self._blocks[first_block][first_offset] = self._default_item_value
+            self._head += 1
+            if self._head % size == 0:
+                self._blocks[first_block] = None
+                if 2 * (first_block + 1) > len(self._blocks):
+                    # most of the directory is empty front slots: drop them
+                    del self._blocks[:first_block + 1]
+                    self._head = 0
+        else:
+            # shift the items after index one slot towards the front
+            first_block, first_offset = divmod(self._head + index, size)
+            last_block, last_offset = divmod(self._head + self._logical_size - 1, size)
+            for block_index in range(first_block, last_block + 1):
+                block = self._blocks[block_index]
+                start = first_offset if block_index == first_block else 0
+                end = last_offset if block_index == last_block else size - 1
+                block[start:end] = block[start + 1:end + 1]
+                if block_index < last_block:
+                    block[size - 1] = self._blocks[block_index + 1][0]
+            self._blocks[last_block][last_offset] = self._default_item_value
+        self._logical_size -= 1
+        self._trim()
+
+    def delete_many(self, indices: Iterable[int]) -> int:
+        """ Delete the items at all of the given indices at once. Only the items after the first deleted
+            one are moved, in a single pass. Duplicate indices are deleted once.
+
+        Examples:
+            >>> array = ChunkedArray.from_list(['zero', 'one', 'two', 'three', 'four'], block_size=2)
+            >>> print(array.delete_many([3, 0]))
+            2
+            >>> print(array)
+            ['one' 'two' 'four']
+
+        Args:
+            indices (Iterable[int]): the indices to delete.
+
+        Returns:
+            deleted (int): the number of items deleted.
+
+        Raises:
+            IndexError: if any index is out of bounds.
+        """
+        indices = np.asarray(indices if hasattr(indices, '__len__') else list(indices), dtype=np.intp)
+        if indices.size == 0:
+            return 0
+        if indices.min() < 0 or indices.max() >= self._logical_size:
+            raise IndexError("Index out of range")
+
+        keep = np.ones(self._logical_size, dtype=bool)
+        keep[indices] = False
+        return self._compact(keep)
+
+    def remove_where(self, mask: Iterable[bool]) -> int:
+        """ Remove every item whose entry in `mask` is true, compacting the ChunkedArray in a single pass.
+
+        Examples:
+            >>> array = ChunkedArray.from_list([5, 1, 7, 2, 9], dtype='int64', block_size=2)
+            >>> print(array.remove_where([item > 4 for item in array]))
+            3
+            >>> print(array)
+            [1 2]
+
+        Args:
+            mask (Iterable[bool]): one flag per item, true for the items to remove.
+
+        Returns:
+            removed (int): the number of items removed.
+
+        Raises:
+            ValueError: if the mask length does not match the length of the ChunkedArray.
+        """
+        mask = np.asarray(mask if hasattr(mask, '__len__') else list(mask), dtype=bool)
+        if mask.shape != (self._logical_size,):
+            raise ValueError(f'Mask must have {self._logical_size} items')
+        return self._compact(~mask)
+
+    def _compact(self, keep: np.ndarray) -> int:
+        """ Keep only the items flagged in `keep`, moving just the part after the first removed item. """
+        first_removed = int(np.argmin(keep))
+        if keep[first_removed]:
+            return 0
+
+        kept_tail = self._gather(first_removed, self._logical_size)[keep[first_removed:]]
+        new_size = first_removed + len(kept_tail)
+        self._write(first_removed, kept_tail)
+        for segment in self._segments(new_size, self._logical_size):
+            segment.fill(self._default_item_value)
+
+        removed = self._logical_size - new_size
+        self._logical_size = new_size
+        self._trim()
+        return removed
+
+    def sort(self, key: Any = None, reverse: bool = False, stable: bool = True) -> None:
+        """ Sort the ChunkedArray in place. The items are gathered into one numpy array, sorted the same
+            way Array.sort() sorts them, and written back into the existing blocks.
+
+        Examples:
+            >>> array = ChunkedArray.from_list(['pear', 'fig', 'apple'], block_size=2)
+            >>> array.sort(key=len)
+            >>> print(array)
+            ['fig' 'pear' 'apple']
+
+        Args:
+            key (Any): a function of one item giving its sort key, or a numpy ufunc applied to all items
+                at once (default is None, the items themselves).
+            reverse (bool): sort in descending order (default is False).
+            stable (bool): keep items with equal keys in their original order (default is True).
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if the keys cannot be compared with each other.
+        """
+        values = self._gather(0, self._logical_size)
+        if key is None and not reverse and values.dtype.kind != 'O':
+            values.sort(kind='stable' if stable else 'quicksort')
+        else:
+            values = values[_argsort(_sort_keys(values, key), reverse, stable)]
+        self._write(0, values)
+
+    def __eq__(self, other: object) -> bool:
+        """ Equality operator ==. Compares against another ChunkedArray or an Array.
+
+        Examples:
+            >>> print(ChunkedArray.from_list([1, 2], block_size=1) == ChunkedArray.from_list([1, 2]))
+            True
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_equal (bool): true if both hold equal items in the same order.
+
+        Raises:
+            TypeError: if other is not a ChunkedArray or Array.
+        """
+        if not isinstance(other, (ChunkedArray, Array)):
+            raise TypeError("Input must be an array.")
+        if len(self) != len(other):
+            return False
+        return bool(np.array_equal(np.asarray(self), np.asarray(other)))
+
+    def __ne__(self, other: object) -> bool:
+        """ Non-Equality operator !=.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_not_equal (bool): true if the arrays are NOT equal.
+        """
+        return not self.__eq__(other)
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Iterator operator. Iterates block by block.
+
+        Examples:
+            >>> print(list(ChunkedArray.from_list(['a', 'b', 'c'], block_size=2)))
+            ['a', 'b', 'c']
+
+        Yields:
+            item (Any): yields the item at index
+        """
+        for segment in self._segments(0, self._logical_size):
+            yield from segment
+
+    def __reversed__(self) -> Iterator[Any]:
+        """ Reversed iterator operator.
+
+        Examples:
+            >>> print(list(reversed(ChunkedArray.from_list(['a', 'b', 'c'], block_size=2))))
+            ['c', 'b', 'a']
+
+        Yields:
+            item (Any): yields the item at index starting at the end
+        """
+        for segment in reversed(list(self._segments(0, self._logical_size))):
+            yield from segment[::-1]
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in). Each block is compared in one numpy pass.
+
+        Examples:
+            >>> print('b' in ChunkedArray.from_list(['a', 'b'], block_size=1))
+            True
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            contains_item (bool): true if the array contains the item.
+        """
+        return any(_match_items(segment, item).any() for segment in self._segments(0, self._logical_size))
+
+    def __does_not_contain__(self, item: Any) -> bool:
+        """ Does not contain operator (not in).
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            does_not_contains_item (bool): true if the array does not contain the item.
+        """
+        return not self.__contains__(item)
+
+    def index(self, item: Any) -> int:
+        """ Find the index of the first occurrence of an item. The scan stops at the first block with a match.
+
+        Examples:
+            >>> array = ChunkedArray.from_list(['zero', 'one', 'two', 'one'], block_size=2)
+            >>> print(array.index('one'))
+            1
+
+        Args:
+            item (Any): the item to search for.
+
+        Returns:
+            index (int): the index of the first item equal to `item`.
+
+        Raises:
+            ValueError: if the item is not in the ChunkedArray.
+        """
+        for position, mask in self._matches(item):
+            if mask.any():
+                return position + int(np.argmax(mask))
+        raise ValueError(f'{item!r} is not in array')
+
+    def count(self, item: Any) -> int:
+        """ Count the occurrences of an item.
+
+        Examples:
+            >>> array = ChunkedArray.from_list([1, 2, 1, 1], dtype='int64', block_size=3)
+            >>> print(array.count(1))
+            3
+
+        Args:
+            item (Any): the item to count.
+
+        Returns:
+            count (int): the number of items equal to `item`.
+        """
+        return sum(int(np.count_nonzero(mask)) for _, mask in self._matches(item))
+
+    def find_all(self, item: Any) -> np.ndarray:
+        """ Find the indices of every occurrence of an item.
+
+        Examples:
+            >>> array = ChunkedArray.from_list(['a', 'b', 'a'], block_size=2)
+            >>> print(array.find_all('a'))
+            [0 2]
+
+        Args:
+            item (Any): the item to search for.
+
+        Returns:
+            indices (np.ndarray): the indices of the items equal to `item`, in increasing order.
+        """
+        found = [np.flatnonzero(mask) + position for position, mask in self._matches(item)]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+    def clear(self) -> None:
+        """ Clear the ChunkedArray, releasing all blocks.
+
+        Returns:
+            None
+        """
+        self._blocks = []
+        self._head = 0
+        self._logical_size = 0
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """ numpy conversion (np.asarray(array)). The blocks are not contiguous, so this is always a copy.
+
+        Args:
+            dtype (Any): the dtype of the result (default is None, the array's dtype).
+            copy (bool | None): False is rejected because a copy is always needed.
+
+        Returns:
+            values (np.ndarray): the items in one contiguous array.
+
+        Raises:
+            ValueError: if copy is False.
+        """
+        if copy is False:
+            raise ValueError('A ChunkedArray cannot be converted to numpy without a copy')
+        values = self._gather(0, self._logical_size)
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return str(np.asarray(self))
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return self.__str__()
@@ -0,0 +1,443 @@
+# datastructures.concurrent_array.ConcurrentArray
+
+""" This module defines a ConcurrentArray class: a thread-safe wrapper around an Array.
+    Writes hold a ReadWriteLock for writing, so a growth copy never overlaps another thread's write
+    and no appended item is lost. Short reads (indexing, len, membership, search) hold the lock's
+    internal mutex for one acquisition, which keeps them as cheap as an Array behind a plain
+    threading.Lock; under the GIL, letting them overlap would gain nothing. Reads that copy
+    (slices, iteration, copy(), str) hold the lock for reading and run concurrently with each other.
+    The ConcurrentArray uses a datastructures.Array object as the internal data structure.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
+import numpy as np
+
+from datastructures.array import Array
+from datastructures.growth_policy import GrowthPolicy
+from datastructures.read_write_lock import ReadWriteLock
+
+
+class ConcurrentArray:
+    """ Class ConcurrentArray - an Array that can be shared between threads.
+            Stipulations:
+            1. Every operation is atomic with respect to every other operation.
+            2. Slicing and iteration work on a copy taken under the lock, never on a live view.
+            3. To run several operations atomically, use read() or batch(); the lock is not reentrant,
+               so do not call the ConcurrentArray itself inside those blocks.
+    """
+
+    def __init__(self, size: int = 0, default_item_value: Any = None, dtype: Any = object,
+                 growth_policy: GrowthPolicy | None = None) -> None:
+        """ ConcurrentArray Constructor. Takes the same arguments as Array.
+
+        Examples:
+            >>> array = ConcurrentArray(size=2, default_item_value=0)
+            >>> array.append(5)
+            >>> print(array)
+            [0 0 5]
+
+        Args:
+            size (int): the initial size (default is 0).
+            default_item_value (Any): the default value (default is None, zero/False for typed dtypes).
+            dtype (Any): object (default), bool, int8-int64, uint8-uint64 or float16-float64.
+            growth_policy (GrowthPolicy): how capacity grows and shrinks (default is DoublingGrowth).
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if dtype is not supported.
+            ValueError: if size is negative.
+        """
+        self._items = Array(size, default_item_value, dtype, growth_policy)
+        self._lock = ReadWriteLock()
+        self._mutex = self._lock.mutex
+
+    @staticmethod
+    def wrap(array: Array) -> 'ConcurrentArray':
+        """ Share an existing Array between threads. The Array must not be used directly afterwards.
+
+        Examples:
+            >>> array = ConcurrentArray.wrap(Array.from_list([1, 2]))
+            >>> print(len(array))
+            2
+
+        Args:
+            array (Array): the Array to guard.
+
+        Returns:
+            concurrent_array (ConcurrentArray): a ConcurrentArray using `array` as its storage.
+
+        Raises:
+            TypeError: if array is not an Array.
+        """
+        if not isinstance(array, Array):
+            raise TypeError("Input must be an Array")
+        concurrent_array = ConcurrentArray.__new__(ConcurrentArray)
+        concurrent_array._items = array
+        concurrent_array._lock = ReadWriteLock()
+        concurrent_array._mutex = concurrent_array._lock.mutex
+        return concurrent_array
+
+    @staticmethod
+    def from_list(list_items: list, dtype: Any = object) -> 'ConcurrentArray':
+        """ Create a ConcurrentArray from a Python list.
+
+        Args:
+            list_items (list): the list to create the ConcurrentArray from.
+            dtype (Any): the dtype to store the items as (default is object).
+
+        Returns:
+            array (ConcurrentArray): a new ConcurrentArray containing the items from `list_items`.
+
+        Raises:
+            TypeError: if list_items is not a list.
+        """
+        return ConcurrentArray.wrap(Array.from_list(list_items, dtype))
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Property for getting the numpy dtype of the items.
+
+        Returns:
+            dtype (np.dtype): the dtype of the items.
+        """
+        return self._items.dtype
+
+    @contextmanager
+    def read(self) -> Iterator[Array]:
+        """ Hold the lock for reading and give direct access to the underlying Array, so several reads
+            see one consistent state. Other readers may run at the same time; writers wait.
+
+        Examples:
+            >>> array = ConcurrentArray.from_list(['a', 'b'])
+            >>> with array.read() as items:
+            ...     print(items[len(items) - 1])
+            b
+
+        Yields:
+            items (Array): the underlying Array; it must only be read, and must not escape the block.
+        """
+        with self._lock.read_locked():
+            yield self._items
+
+    @contextmanager
+    def batch(self) -> Iterator[Array]:
+        """ Hold the lock for writing and give direct access to the underlying Array, so a batch of
+            changes is made under a single lock acquisition and is seen by readers all at once.
+
+        Examples:
+            >>> array = ConcurrentArray()
+            >>> with array.batch() as items:
+            ...     for word in ['a', 'b']: items.append(word)
+            >>> print(array)
+            ['a' 'b']
+
+        Yields:
+            items (Array): the underlying Array; it must not escape the block.
+        """
+        with self._lock.write_locked():
+            yield self._items
+
+    def _index_stale(self) -> bool:
+        """ True if the Array has a HashIndex that its next lookup would rebuild. """
+        return self._items._index is not None and self._items._index.stale
+
+    def _rebuild_index(self) -> None:
+        """ Rebuild a stale HashIndex under the write lock, so lookups never rebuild it while reading. """
+        with self._lock.write_locked():
+            if self._index_stale():
+                self._items.build_index()
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """ Bracket operator for getting an item. A slice returns a new Array holding a copy of the items.
+
+        Args:
+            index (int | slice): the desired index or slice.
+
+        Returns:
+            Any: the item at the index, or an Array for a slice.
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if isinstance(index, slice):
+            with self._lock.read_locked():
+                return self._items[index].copy()
+        with self._mutex:
+            self._lock.wait_for_writers()
+            return self._items[index]
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        """ Bracket operator for setting an item.
+
+        Args:
+            index (int): the desired index to set.
+            data (Any): the desired data to set at index.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        with self._lock.write_locked():
+            self._items[index] = data
+
+    def append(self, data: Any) -> None:
+        """ Append an item to the end.
+
+        Args:
+            data (Any): the desired data to append.
+
+        Returns:
+            None
+        """
+        with self._lock.write_locked():
+            self._items.append(data)
+
+    def extend(self, iterable: Iterable) -> None:
+        """ Append every item of an iterable under a single lock acquisition. The items are collected
+            before the lock is taken, so a slow generator does not hold up other threads.
+
+        Examples:
+            >>> array = ConcurrentArray(dtype='int64')
+            >>> array.extend(range(3))
+            >>> print(array)
+            [0 1 2]
+
+        Args:
+            iterable (Iterable): the items to append.
+
+        Returns:
+            None
+        """
+        block = iterable if isinstance(iterable, (Array, np.ndarray)) else Array.from_iterable(iterable, dtype=self.dtype)
+        with self._lock.write_locked():
+            self._items.extend(block)
+
+    def __delitem__(self, index: int) -> None:
+        """ Delete an item.
+
+        Args:
+            index (int): the desired index to delete.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        with self._lock.write_locked():
+            del self._items[index]
+
+    def delete_many(self, indices: Iterable[int]) -> int:
+        """ Delete the items at all of the given indices at once (see Array.delete_many).
+
+        Args:
+            indices (Iterable[int]): the indices to delete.
+
+        Returns:
+            deleted (int): the number of items deleted.
+
+        Raises:
+            IndexError: if any index is out of bounds.
+        """
+        with self._lock.write_locked():
+            return self._items.delete_many(indices)
+
+    def resize(self, new_size: int, default_value: Any = None) -> None:
+        """ Resize the Array (see Array.resize).
+
+        Args:
+            new_size (int): the desired new size.
+            default_value (Any): the value for new items (default is None, the default value of the array).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the new size is less than 0.
+        """
+        with self._lock.write_locked():
+            self._items.resize(new_size, default_value)
+
+    def sort(self, key: Any = None, reverse: bool = False, stable: bool = True) -> None:
+        """ Sort the Array in place (see Array.sort).
+
+        Args:
+            key (Any): a function of one item giving its sort key (default is None, the items themselves).
+            reverse (bool): sort in descending order (default is False).
+            stable (bool): keep items with equal keys in their original order (default is True).
+
+        Returns:
+            None
+        """
+        with self._lock.write_locked():
+            self._items.sort(key, reverse, stable)
+
+    def clear(self) -> None:
+        """ Clear the Array.
+
+        Returns:
+            None
+        """
+        with self._lock.write_locked():
+            self._items.clear()
+
+    def __len__(self) -> int:
+        """ Length operator for getting the number of items.
+
+        Returns:
+            length (int): the number of items.
+        """
+        with self._mutex:
+            self._lock.wait_for_writers()
+            return len(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in).
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            contains_item (bool): true if the array contains the item.
+        """
+        while True:
+            with self._mutex:
+                self._lock.wait_for_writers()
+                if not self._index_stale():
+                    return item in self._items
+            self._rebuild_index()
+
+    def __does_not_contain__(self, item: Any) -> bool:
+        """ Does not contain operator (not in).
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            does_not_contains_item (bool): true if the array does not contain the item.
+        """
+        return not self.__contains__(item)
+
+    def index(self, item: Any) -> int:
+        """ Find the index of the first occurrence of an item.
+
+        Args:
+            item (Any): the item to search for.
+
+        Returns:
+            index (int): the index of the first item equal to `item`.
+
+        Raises:
+            ValueError: if the item is not present.
+        """
+        while True:
+            with self._mutex:
+                self._lock.wait_for_writers()
+                if not self._index_stale():
+                    return self._items.index(item)
+            self._rebuild_index()
+
+    def count(self, item: Any) -> int:
+        """ Count the occurrences of an item.
+
+        Args:
+            item (Any): the item to count.
+
+        Returns:
+            count (int): the number of items equal to `item`.
+        """
+        while True:
+            with self._mutex:
+                self._lock.wait_for_writers()
+                if not self._index_stale():
+                    return self._items.count(item)
+            self._rebuild_index()
+
+    def find_all(self, item: Any) -> np.ndarray:
+        """ Find the indices of every occurrence of an item.
+
+        Args:
+            item (Any): the item to search for.
+
+        Returns:
+            indices (np.ndarray): the indices of the items equal to `item`, in increasing order.
+        """
+        while True:
+            with self._mutex:
+                self._lock.wait_for_writers()
+                if not self._index_stale():
+                    return self._items.find_all(item)
+            self._rebuild_index()
+
+    def copy(self) -> Array:
+        """ Take a consistent copy of the items.
+
+        Returns:
+            array (Array): a new, unsynchronized Array holding the same items.
+        """
+        with self._lock.read_locked():
+            return self._items.__copy__()
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Iterator operator. Iterates over a copy taken under the lock, so other threads may change
+            the ConcurrentArray while the loop runs.
+
+        Yields:
+            item (Any): yields the item at index
+        """
+        with self._lock.read_locked():
+            snapshot = np.array(self._items, copy=True)
+        yield from snapshot
+
+    def __eq__(self, other: object) -> bool:
+        """ Equality operator ==. Compares against another ConcurrentArray or an Array.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_equal (bool): true if both hold equal items in the same order.
+
+        Raises:
+            TypeError: if other is not a ConcurrentArray or Array.
+        """
+        if isinstance(other, ConcurrentArray):
+            other = other.copy()
+        if not isinstance(other, Array):
+            raise TypeError("Input must be an array.")
+        with self._lock.read_locked():
+            return self._items == other
+
+    def __ne__(self, other: object) -> bool:
+        """ Non-Equality operator !=.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_not_equal (bool): true if the arrays are NOT equal.
+        """
+        return not self.__eq__(other)
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        with self._lock.read_locked():
+            return str(self._items)
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return self.__str__()
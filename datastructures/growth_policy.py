@@ -0,0 +1,188 @@
+# datastructures.growth_policy
+
+""" This module defines the growth policies an Array uses to decide its capacity.
+    A policy answers two questions: how big should the buffer become when it is full, and
+    should the buffer shrink after items have been removed. Shrinking uses hysteresis
+    (the shrink point is well below the grow point) so alternating appends and deletes
+    around a boundary do not reallocate on every call.
+"""
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import math
+
+
+class GrowthPolicy(ABC):
+    """ Class GrowthPolicy - abstract base class for Array capacity policies.
+            Subclasses must implement grow(); a subclass that does not cannot be constructed.
+            The default shrink() halves the capacity once the Array is at most a quarter full.
+    """
+
+    def __init__(self, shrink_threshold: float = 0.25) -> None:
+        """ GrowthPolicy Constructor.
+
+        Examples:
+            >>> policy = DoublingGrowth(shrink_threshold=0.1)
+            >>> print(policy.shrink_threshold)
+            0.1
+
+        Args:
+            shrink_threshold (float): fraction of the capacity the size must drop to (or below)
+                before the buffer shrinks. 0 disables shrinking. (default is 0.25)
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if shrink_threshold is not in the range [0, 0.5).
+        """
+        if shrink_threshold < 0 or shrink_threshold >= 0.5:
+            raise ValueError('shrink_threshold must be in the range [0, 0.5)')
+        self.shrink_threshold = shrink_threshold
+
+    @abstractmethod
+    def grow(self, capacity: int, required: int) -> int:
+        """ Compute the new capacity for a buffer that must hold at least `required` items.
+
+        Args:
+            capacity (int): the current capacity.
+            required (int): the minimum number of items the new buffer must hold.
+
+        Returns:
+            new_capacity (int): the new capacity (the caller guarantees it is at least `required`).
+        """
+
+    def shrink(self, capacity: int, size: int) -> int | None:
+        """ Compute the new capacity after items were removed, or None to keep the buffer.
+
+        Examples:
+            >>> print(DoublingGrowth().shrink(capacity=64, size=16))
+            32
+            >>> print(DoublingGrowth().shrink(capacity=64, size=17))
+            None
+
+        Args:
+            capacity (int): the current capacity.
+            size (int): the number of items currently stored.
+
+        Returns:
+            new_capacity (int | None): the smaller capacity, or None if the buffer should not shrink.
+        """
+        if self.shrink_threshold == 0 or capacity == 0 or size > capacity * self.shrink_threshold:
+            return None
+        new_capacity = capacity // 2
+        return new_capacity if new_capacity < capacity else None
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the policy. """
+        return f'{type(self).__name__}(shrink_threshold={self.shrink_threshold})'
+
+
+class DoublingGrowth(GrowthPolicy):
+    """ Class DoublingGrowth - doubles the capacity every time the buffer is full. """
+
+    def grow(self, capacity: int, required: int) -> int:
+        """ Double the capacity until it holds `required` items.
+
+        Examples:
+            >>> print(DoublingGrowth().grow(capacity=8, required=9))
+            16
+            >>> print(DoublingGrowth().grow(capacity=0, required=1))
+            1
+        """
+        new_capacity = max(capacity, 1)
+        while new_capacity < required:
+            new_capacity *= 2
+        return new_capacity
+
+
+class FactorGrowth(GrowthPolicy):
+    """ Class FactorGrowth - multiplies the capacity by a constant factor (1.5 by default).
+            A factor below 2 wastes less memory and lets freed blocks be reused by the allocator.
+    """
+
+    def __init__(self, factor: float = 1.5, shrink_threshold: float = 0.25) -> None:
+        """ FactorGrowth Constructor.
+
+        Examples:
+            >>> print(FactorGrowth(1.5).grow(capacity=10, required=11))
+            15
+
+        Args:
+            factor (float): the growth factor (default is 1.5).
+            shrink_threshold (float): see GrowthPolicy (default is 0.25).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if factor is not greater than 1.
+        """
+        super().__init__(shrink_threshold)
+        if factor <= 1:
+            raise ValueError('factor must be greater than 1')
+        self.factor = factor
+
+    def grow(self, capacity: int, required: int) -> int:
+        """ Multiply the capacity by the factor until it holds `required` items. """
+        new_capacity = max(capacity, 1)
+        while new_capacity < required:
+            new_capacity = max(new_capacity + 1, math.ceil(new_capacity * self.factor))
+        return new_capacity
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the policy. """
+        return f'FactorGrowth(factor={self.factor}, shrink_threshold={self.shrink_threshold})'
+
+
+class ChunkGrowth(GrowthPolicy):
+    """ Class ChunkGrowth - grows the capacity by a fixed number of items.
+            Useful when memory is tight and the final size is roughly known. Shrinks once at
+            least two whole chunks are unused.
+    """
+
+    def __init__(self, chunk_size: int = 1024, shrink_threshold: float = 0.25) -> None:
+        """ ChunkGrowth Constructor.
+
+        Examples:
+            >>> print(ChunkGrowth(100).grow(capacity=250, required=251))
+            350
+
+        Args:
+            chunk_size (int): the number of items added to the capacity per growth (default is 1024).
+            shrink_threshold (float): 0 disables shrinking, any other value enables it (default is 0.25).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if chunk_size is less than 1.
+        """
+        super().__init__(shrink_threshold)
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        self.chunk_size = chunk_size
+
+    def grow(self, capacity: int, required: int) -> int:
+        """ Add whole chunks to the capacity until it holds `required` items. """
+        missing = required - capacity
+        if missing <= 0:
+            return capacity
+        return capacity + math.ceil(missing / self.chunk_size) * self.chunk_size
+
+    def shrink(self, capacity: int, size: int) -> int | None:
+        """ Drop unused chunks once at least two of them are free, keeping one spare chunk.
+
+        Examples:
+            >>> print(ChunkGrowth(100).shrink(capacity=500, size=250))
+            400
+            >>> print(ChunkGrowth(100).shrink(capacity=500, size=350))
+            None
+        """
+        if self.shrink_threshold == 0 or capacity - size < 2 * self.chunk_size:
+            return None
+        return capacity - ((capacity - size) // self.chunk_size - 1) * self.chunk_size
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the policy. """
+        return f'ChunkGrowth(chunk_size={self.chunk_size}, shrink_threshold={self.shrink_threshold})'
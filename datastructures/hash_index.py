@@ -0,0 +1,183 @@
+# datastructures.hash_index.HashIndex
+
+""" This module defines a HashIndex class that maps values to the positions they occupy in an Array.
+    An Array with an index answers `in`, index(), count() and find_all() with a dictionary
+    lookup instead of a scan. The Array keeps the index up to date as it changes; bulk
+    operations mark it stale instead, and it is rebuilt on the next lookup.
+"""
+
+from __future__ import annotations
+import sys
+from typing import AbstractSet, Any, Iterable
+import numpy as np
+
+
+class _NaN:
+    """ The key all NaN items are recorded under. Every read of a NaN from a typed buffer is a new
+        np.float64 object that is neither equal nor identical to the stored one, so NaN itself
+        cannot be found again as a dictionary key.
+    """
+
+    def __repr__(self) -> str:
+        return 'nan'
+
+
+_NAN_KEY = _NaN()
+
+
+def _key(item: Any) -> Any:
+    """ The dictionary key for `item`: the item itself, or _NAN_KEY for a float NaN. """
+    if isinstance(item, (float, np.floating)) and item != item:
+        return _NAN_KEY
+    return item
+
+
+class HashIndex:
+    """ Class HashIndex - a dictionary from each (hashable) value to the set of its positions.
+            Stipulations:
+            1. Every value stored must be hashable.
+            2. An index does not notice items that are mutated in place: after changing an item's
+               hash or equality, the owner must call invalidate().
+            3. NaN positions are tracked, but positions(nan) is always empty: like a scan, which
+               compares with ==, a lookup never finds NaN.
+    """
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        """ HashIndex Constructor. Builds the index for items at positions 0, 1, 2, ...
+
+        Examples:
+            >>> index = HashIndex(['a', 'b', 'a'])
+            >>> print(sorted(index.positions('a')))
+            [0, 2]
+
+        Args:
+            items (Iterable[Any]): the items to index (default is no items).
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if an item is not hashable.
+        """
+        self._positions: dict[Any, set[int]] = {}
+        self._stale = False
+        for position, item in enumerate(items):
+            self.add(item, position)
+
+    @property
+    def stale(self) -> bool:
+        """ Property for checking whether the index must be rebuilt before it can be trusted.
+
+        Returns:
+            stale (bool): true after invalidate() until the owner rebuilds the index.
+        """
+        return self._stale
+
+    def invalidate(self) -> None:
+        """ Mark the index as stale, e.g. after items were mutated in place or rearranged in bulk.
+
+        Returns:
+            None
+        """
+        self._stale = True
+
+    def add(self, item: Any, position: int) -> None:
+        """ Record that `item` is stored at `position`.
+
+        Args:
+            item (Any): the item.
+            position (int): the position of the item.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if the item is not hashable.
+        """
+        item = _key(item)
+        positions = self._positions.get(item)
+        if positions is None:
+            self._positions[item] = {position}
+        else:
+            positions.add(position)
+
+    def discard(self, item: Any, position: int) -> None:
+        """ Forget that `item` is stored at `position`. Does nothing if it was not recorded.
+
+        Args:
+            item (Any): the item.
+            position (int): the position of the item.
+
+        Returns:
+            None
+        """
+        item = _key(item)
+        positions = self._positions.get(item)
+        if positions is None:
+            return
+        positions.discard(position)
+        if not positions:
+            del self._positions[item]
+
+    def move(self, item: Any, old_position: int, new_position: int) -> None:
+        """ Record that `item` moved from `old_position` to `new_position`.
+
+        Args:
+            item (Any): the item.
+            old_position (int): the position the item was at.
+            new_position (int): the position the item is at now.
+
+        Returns:
+            None
+        """
+        positions = self._positions[_key(item)]
+        positions.discard(old_position)
+        positions.add(new_position)
+
+    def positions(self, item: Any) -> AbstractSet[int]:
+        """ Get the positions recorded for `item`.
+
+        Examples:
+            >>> index = HashIndex(['a', 'b'])
+            >>> print(index.positions('b'), len(index.positions('z')))
+            {1} 0
+
+        Args:
+            item (Any): the item to look up.
+
+        Returns:
+            positions (AbstractSet[int]): the recorded positions (empty if there are none). Do not modify it.
+
+        Raises:
+            TypeError: if the item is not hashable.
+        """
+        if _key(item) is _NAN_KEY:
+            return _NO_POSITIONS
+        return self._positions.get(item, _NO_POSITIONS)
+
+    def memory_usage(self) -> int:
+        """ Estimate the memory used by the index itself (the dictionary and position sets, not the items).
+
+        Examples:
+            >>> print(HashIndex(range(1000)).memory_usage() > HashIndex(range(10)).memory_usage())
+            True
+
+        Returns:
+            nbytes (int): the approximate size of the index in bytes.
+        """
+        nbytes = sys.getsizeof(self._positions)
+        for positions in self._positions.values():
+            nbytes += sys.getsizeof(positions)
+            nbytes += sum(sys.getsizeof(position) for position in positions)
+        return nbytes
+
+    def __len__(self) -> int:
+        """ Length operator for getting the number of distinct values in the index.
+
+        Returns:
+            length (int): the number of distinct values.
+        """
+        return len(self._positions)
+
+
+_NO_POSITIONS: frozenset[int] = frozenset()
@@ -0,0 +1,376 @@
+# datastructures.instrumentation
+
+""" This module adds opt-in allocation, copy and timing statistics to Array (and its subclasses),
+    Array2D and LinkedList. enable(obj) switches a single instance to an instrumented subclass of its
+    own class by assigning __class__, and disable(obj) switches it back. The regular classes are never
+    modified, so instances that are not instrumented pay nothing for the feature.
+    Every instance's Stats also feed one global aggregate, returned by global_stats().
+    Allocation and copy counts come from Array's buffer management, so they are only recorded for
+    Arrays. LinkedList gets timing counters only (calls and seconds per operation): its nodes are
+    not tracked. Array2D's own operations are timed, and its storage Array is instrumented with the
+    same Stats, so the allocations and copies it makes are counted under the Array2D operation.
+    Stats are not synchronized; instrument an object used from several threads through its own lock.
+"""
+
+from __future__ import annotations
+import functools
+import json
+from time import perf_counter
+from typing import Any, Callable
+
+import numpy as np
+
+from datastructures.array import Array
+from datastructures.array2d import Array2D
+from datastructures.linked_list import LinkedList
+from datastructures.mapped_array import MappedArray
+
+
+class OperationStats:
+    """ Class OperationStats - the calls, time and copies of one kind of operation (e.g. append). """
+
+    def __init__(self) -> None:
+        """ OperationStats Constructor. All counters start at zero.
+
+        Returns:
+            None
+        """
+        self.calls = 0
+        self.seconds = 0.0
+        self.elements_copied = 0
+        self.bytes_copied = 0
+
+    def as_dict(self) -> dict:
+        """ Export the counters.
+
+        Returns:
+            counters (dict): calls, seconds, elements_copied and bytes_copied.
+        """
+        return {'calls': self.calls, 'seconds': self.seconds,
+                'elements_copied': self.elements_copied, 'bytes_copied': self.bytes_copied}
+
+
+class Stats:
+    """ Class Stats - allocation, copy and timing counters for one instrumented object (or the global aggregate).
+            Stipulations:
+            1. Only existing items moved to a new place count as copied: reallocation, the shift after a
+               delete, compaction and copy-on-write copies. Writing new items does not.
+            2. A nested operation (e.g. the resize inside an extend) is attributed to the outermost one.
+            3. Every counter is also added to the parent Stats, if there is one.
+    """
+
+    def __init__(self, parent: Stats | None = None) -> None:
+        """ Stats Constructor.
+
+        Args:
+            parent (Stats | None): the Stats that aggregates these ones (default is None).
+
+        Returns:
+            None
+        """
+        self._parent = parent
+        self._depth = 0
+        self._operation: str | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        """ Set every counter back to zero. The parent's counters are not changed.
+
+        Returns:
+            None
+        """
+        self.allocations = 0
+        self.growth_events = 0
+        self.peak_capacity = 0
+        self.elements_copied = 0
+        self.bytes_copied = 0
+        self.operations: dict[str, OperationStats] = {}
+
+    def _operation_stats(self, name: str) -> OperationStats:
+        """ The OperationStats for `name`, created on first use. """
+        if name not in self.operations:
+            self.operations[name] = OperationStats()
+        return self.operations[name]
+
+    def record_allocation(self, capacity: int) -> None:
+        """ Count a newly allocated buffer of `capacity` slots.
+
+        Args:
+            capacity (int): the size of the buffer in items.
+
+        Returns:
+            None
+        """
+        self.allocations += 1
+        self.peak_capacity = max(self.peak_capacity, capacity)
+        if self._parent is not None:
+            self._parent.record_allocation(capacity)
+
+    def record_growth(self) -> None:
+        """ Count a reallocation to a larger capacity.
+
+        Returns:
+            None
+        """
+        self.growth_events += 1
+        if self._parent is not None:
+            self._parent.record_growth()
+
+    def record_copy(self, elements: int, nbytes: int, operation: str | None = None) -> None:
+        """ Count existing items copied to a new place.
+
+        Args:
+            elements (int): the number of items copied.
+            nbytes (int): the number of bytes copied.
+            operation (str | None): the operation to attribute them to (default is None, the running one).
+
+        Returns:
+            None
+        """
+        operation = operation if operation is not None else self._operation
+        self.elements_copied += elements
+        self.bytes_copied += nbytes
+        if operation is not None:
+            operation_stats = self._operation_stats(operation)
+            operation_stats.elements_copied += elements
+            operation_stats.bytes_copied += nbytes
+        if self._parent is not None:
+            self._parent.record_copy(elements, nbytes, operation)
+
+    def record_call(self, operation: str, seconds: float) -> None:
+        """ Count one completed call of an operation.
+
+        Args:
+            operation (str): the name of the operation.
+            seconds (float): the time it took.
+
+        Returns:
+            None
+        """
+        operation_stats = self._operation_stats(operation)
+        operation_stats.calls += 1
+        operation_stats.seconds += seconds
+        if self._parent is not None:
+            self._parent.record_call(operation, seconds)
+
+    def as_dict(self) -> dict:
+        """ Export the counters as a dict of plain Python values.
+
+        Examples:
+            >>> array = Array(dtype='int64')
+            >>> stats = enable(array)
+            >>> for item in range(5):
+            ...     array.append(item)
+            >>> counters = stats.as_dict()
+            >>> print(counters['growth_events'], counters['elements_copied'], counters['peak_capacity'])
+            4 7 8
+            >>> print(counters['operations']['append']['calls'])
+            5
+
+        Returns:
+            counters (dict): allocations, growth_events, peak_capacity, elements_copied, bytes_copied and
+                operations (a dict of OperationStats.as_dict() per operation name).
+        """
+        return {'allocations': self.allocations, 'growth_events': self.growth_events,
+                'peak_capacity': self.peak_capacity, 'elements_copied': self.elements_copied,
+                'bytes_copied': self.bytes_copied,
+                'operations': {name: stats.as_dict() for name, stats in sorted(self.operations.items())}}
+
+    def to_json(self, indent: int | None = None) -> str:
+        """ Export the counters as JSON (the same layout as as_dict()).
+
+        Args:
+            indent (int | None): passed to json.dumps (default is None, a single line).
+
+        Returns:
+            json (str): the counters.
+        """
+        return json.dumps(self.as_dict(), indent=indent)
+
+
+_GLOBAL_STATS = Stats()
+
+
+def global_stats() -> Stats:
+    """ The Stats aggregated over every object instrumented so far (including disabled ones).
+
+    Returns:
+        stats (Stats): the global aggregate.
+    """
+    return _GLOBAL_STATS
+
+
+# the operations timed per supported class; subclasses use the entry of their nearest base.
+_OPERATIONS: dict[type, tuple[str, ...]] = {
+    Array: ('__getitem__', '__setitem__', 'append', 'extend', 'resize', '__delitem__', 'delete_many',
+            'remove_where', 'reserve', 'shrink_to_fit', 'sort', 'clear', 'index', 'count', 'find_all',
+            '__contains__', '__eq__'),
+    Array2D: ('__getitem__', 'resize_rows', 'resize_columns', '__eq__', '__contains__'),
+    LinkedList: ('append', 'prepend', 'insert_before', 'insert_after', 'extract', 'pop_front', 'pop_back',
+                 'clear', '__contains__', '__eq__'),
+}
+# attributes holding an Array used as storage, instrumented with the owner's Stats.
+_STORAGE = {Array2D: '_items2d'}
+_INSTRUMENTED: dict[type, type] = {}
+
+
+class _ArrayCounters:
+    """ Mixin for instrumented Arrays: counts the allocations and copies made by Array's internals. """
+
+    _stats: Stats
+    _stats_base: type
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if capacity:
+            self._stats.record_allocation(capacity)
+        return super()._allocate(capacity)
+
+    def _reallocate(self, new_capacity: int) -> None:
+        if new_capacity > self._physical_size:
+            self._stats.record_growth()
+        if isinstance(self, MappedArray):
+            # the file is resized and remapped in place: a new mapping, but no items copied
+            super()._reallocate(new_capacity)
+            self._stats.record_allocation(new_capacity)
+            return
+        copied = min(self._logical_size, new_capacity)
+        super()._reallocate(new_capacity)
+        self._stats.record_copy(copied, copied * self._dtype.itemsize)
+
+    def _ensure_writable(self) -> None:
+        if self._owners is not None and self._owners[0] > 1:
+            self._stats.record_allocation(self._physical_size)
+            self._stats.record_copy(self._physical_size, self._physical_size * self._dtype.itemsize)
+        super()._ensure_writable()
+
+    def __delitem__(self, index: int) -> None:
+        moved = self._logical_size - index - 1 if 0 <= index < self._logical_size else 0
+        super().__delitem__(index)
+        self._stats.record_copy(moved, moved * self._dtype.itemsize)
+
+    def _compact(self, keep: np.ndarray) -> int:
+        first_removed = int(np.argmin(keep))
+        moved = 0 if keep[first_removed] else int(np.count_nonzero(keep[first_removed:]))
+        removed = super()._compact(keep)
+        self._stats.record_copy(moved, moved * self._dtype.itemsize)
+        return removed
+
+
+def _timed(name: str, method: Callable) -> Callable:
+    """ Wrap `method` so that each outermost call is counted and timed under `name`. """
+    @functools.wraps(method)
+    def timed(self: Any, *args: Any, **kwargs: Any) -> Any:
+        stats = self._stats
+        if stats._depth:
+            return method(self, *args, **kwargs)
+        stats._depth += 1
+        stats._operation = name
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            stats._depth -= 1
+            stats._operation = None
+            stats.record_call(name, elapsed)
+    return timed
+
+
+def _supported_base(cls: type) -> type:
+    """ The nearest base of `cls` that can be instrumented. """
+    for base in cls.__mro__:
+        if base in _OPERATIONS:
+            return base
+    raise TypeError(f'{cls.__name__} cannot be instrumented')
+
+
+def _instrumented_class(cls: type) -> type:
+    """ The instrumented subclass of `cls`, created once and cached. """
+    if cls not in _INSTRUMENTED:
+        base = _supported_base(cls)
+        bases = (_ArrayCounters, cls) if base is Array else (cls,)
+        # resolve each operation through the mixin first, so timing wraps the counting
+        resolver = type('_Resolver', bases, {})
+        namespace: dict[str, Any] = {'_stats_base': cls, '__module__': cls.__module__,
+                                     '__qualname__': cls.__qualname__}
+        for name in _OPERATIONS[base]:
+            namespace[name] = _timed(name, getattr(resolver, name))
+        _INSTRUMENTED[cls] = type(cls.__name__, bases, namespace)
+    return _INSTRUMENTED[cls]
+
+
+def _attach(obj: Any, stats: Stats) -> None:
+    """ Switch `obj` (and any Array it uses as storage) to its instrumented class, recording into `stats`. """
+    cls = type(obj)
+    obj.__class__ = _instrumented_class(cls)
+    obj._stats = stats
+    storage = _STORAGE.get(_supported_base(cls))
+    if storage is not None and isinstance(getattr(obj, storage, None), Array):
+        _attach(getattr(obj, storage), stats)
+    if isinstance(obj, Array):
+        stats.peak_capacity = max(stats.peak_capacity, obj._physical_size)
+
+
+def enable(obj: Any) -> Stats:
+    """ Start collecting statistics for an Array (or subclass), Array2D or LinkedList. Enabling an
+        object that is already instrumented returns its existing Stats.
+
+    Examples:
+        >>> array = Array(size=3, dtype='float64')
+        >>> stats = enable(array)
+        >>> del array[0]
+        >>> print(stats.elements_copied, stats.bytes_copied)
+        2 16
+        >>> disable(array)
+        >>> print(type(array) is Array)
+        True
+
+    Args:
+        obj (Any): the object to instrument.
+
+    Returns:
+        stats (Stats): the object's counters, which also feed global_stats().
+
+    Raises:
+        TypeError: if the object's class cannot be instrumented.
+    """
+    existing = stats_of(obj)
+    if existing is not None:
+        return existing
+    _supported_base(type(obj))
+    stats = Stats(parent=_GLOBAL_STATS)
+    _attach(obj, stats)
+    return stats
+
+
+def disable(obj: Any) -> None:
+    """ Stop collecting statistics for an object, restoring its original class. Does nothing if the
+        object is not instrumented. Its counts stay in global_stats().
+
+    Args:
+        obj (Any): the instrumented object.
+
+    Returns:
+        None
+    """
+    if stats_of(obj) is None:
+        return
+    storage = _STORAGE.get(_supported_base(type(obj)))
+    if storage is not None:
+        disable(getattr(obj, storage, None))
+    obj.__class__ = type(obj)._stats_base
+    del obj._stats
+
+
+def stats_of(obj: Any) -> Stats | None:
+    """ The Stats of an instrumented object.
+
+    Args:
+        obj (Any): any object.
+
+    Returns:
+        stats (Stats | None): the object's counters, or None if it is not instrumented.
+    """
+    if type(obj) not in _INSTRUMENTED.values():
+        return None
+    return obj._stats
@@ -0,0 +1,236 @@
+# datastructures.mapped_array.MappedArray
+
+""" This module defines a MappedArray class: an Array whose items live in a file instead of memory.
+    The file is memory-mapped with numpy.memmap, so only the pages that are touched are read,
+    and data sets larger than RAM can be used with the regular Array API. The file layout
+    (a small header followed by the raw items) is described in datastructures.array_file.
+"""
+
+from __future__ import annotations
+import os
+from typing import Any
+import numpy as np
+
+from datastructures.array import Array
+from datastructures.array_file import HEADER_DTYPE, HEADER_SIZE, encode_header, read_header
+from datastructures.growth_policy import GrowthPolicy, DoublingGrowth
+
+
+class MappedArray(Array):
+    """ Class MappedArray - a disk-backed Array of a typed (numeric or bool) dtype.
+            Stipulations:
+            1. Object dtype is not supported; items are stored as raw bytes in the file.
+            2. The header is kept up to date on every change, so a file can be reopened in O(1)
+               without reading the items.
+            3. numpy views of the items (not ArrayViews) must not be used after the MappedArray
+               reallocates, because the file may have been remapped.
+    """
+
+    def __init__(self, path: str | os.PathLike, size: int = 0, default_item_value: Any = None,
+                 dtype: Any = np.float64, growth_policy: GrowthPolicy | None = None, mode: str = 'w+') -> None:
+        """ MappedArray Constructor. Creates a new file (mode 'w+', overwriting any existing file)
+            or opens an existing one (mode 'r+' for reading and writing, 'r' for reading only).
+            When opening, size, default_item_value and dtype are taken from the file.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), 'column.bin')
+            >>> array = MappedArray(path, size=3, default_item_value=1.5)
+            >>> array.append(2.5)
+            >>> array.close()
+            >>> print(MappedArray.open(path))
+            [1.5 1.5 1.5 2.5]
+
+        Args:
+            path (str | os.PathLike): the file backing the Array.
+            size (int): the initial size when creating a file (default is 0).
+            default_item_value (Any): the default value when creating a file (default is None, i.e. zero).
+            dtype (Any): the dtype when creating a file (default is float64).
+            growth_policy (GrowthPolicy): how the file grows (default is DoublingGrowth without
+                automatic shrinking; use shrink_to_fit() to truncate the file).
+            mode (str): 'w+' to create, 'r+' to open for writing, 'r' to open read-only (default is 'w+').
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if dtype is object or otherwise unsupported.
+            ValueError: if mode is invalid or an existing file is not an array file.
+        """
+        if mode not in ('w+', 'r+', 'r'):
+            raise ValueError(f"mode must be 'w+', 'r+' or 'r', not {mode!r}")
+        if growth_policy is None:
+            growth_policy = DoublingGrowth(shrink_threshold=0)
+
+        self._path = os.fspath(path)
+        self._mode = mode
+        self._header: np.memmap | None = None
+
+        if mode == 'w+':
+            if Array._validate_dtype(dtype).kind == 'O':
+                raise TypeError('MappedArray cannot store Python objects')
+            super().__init__(0, default_item_value, dtype, growth_policy)
+            with open(self._path, 'wb') as file:
+                encode_header(self._dtype, self._default_item_value, 0, 0).tofile(file)
+            self._header = np.memmap(self._path, dtype=HEADER_DTYPE, mode='r+', shape=(1,))
+            self._reallocate(size)
+            self._logical_size = size
+        else:
+            header = read_header(self._path)
+            super().__init__(0, header.default_item_value, header.dtype, growth_policy)
+            self._header = np.memmap(self._path, dtype=HEADER_DTYPE, mode=mode, shape=(1,))
+            self._items = self._map(header.capacity)
+            self._physical_size = header.capacity
+            self._size = header.size
+
+    @staticmethod
+    def open(path: str | os.PathLike, mode: str = 'r+', growth_policy: GrowthPolicy | None = None) -> 'MappedArray':
+        """ Open an existing MappedArray file. Only the header is read; items are paged in on access.
+
+        Examples:
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), 'ids.bin')
+            >>> MappedArray(path, size=2, dtype='int32').close()
+            >>> print(len(MappedArray.open(path, mode='r')))
+            2
+
+        Args:
+            path (str | os.PathLike): the file to open.
+            mode (str): 'r+' to open for writing, 'r' to open read-only (default is 'r+').
+            growth_policy (GrowthPolicy): how the file grows (default is DoublingGrowth without shrinking).
+
+        Returns:
+            array (MappedArray): the Array backed by the file.
+
+        Raises:
+            ValueError: if the file is not an array file.
+        """
+        if mode not in ('r+', 'r'):
+            raise ValueError(f"mode must be 'r+' or 'r', not {mode!r}")
+        return MappedArray(path, growth_policy=growth_policy, mode=mode)
+
+    @property
+    def _logical_size(self) -> int:
+        """ The logical size, mirrored into the file header whenever it changes. """
+        return self._size
+
+    @_logical_size.setter
+    def _logical_size(self, size: int) -> None:
+        self._size = size
+        if self._header is not None:
+            self._header['size'] = size
+
+    @property
+    def path(self) -> str:
+        """ Property for getting the path of the file backing the Array.
+
+        Returns:
+            path (str): the file path.
+        """
+        return self._path
+
+    def _map(self, capacity: int) -> np.ndarray:
+        """ Map `capacity` items of the file (an empty in-memory array for 0, which cannot be mapped). """
+        if capacity == 0:
+            return np.empty(0, dtype=self._dtype)
+        mode = 'r' if self._mode == 'r' else 'r+'
+        return np.memmap(self._path, dtype=self._dtype, mode=mode, offset=HEADER_SIZE, shape=(capacity,))
+
+    def _reallocate(self, new_capacity: int) -> None:
+        """ Resize the file to `new_capacity` slots and remap it. The items stay where they are
+            on disk, so nothing is copied.
+        """
+        if self._mode == 'r':
+            raise ValueError('MappedArray was opened read-only')
+        old_capacity = self._physical_size
+        self.flush()
+        self._items = np.empty(0, dtype=self._dtype)
+        os.truncate(self._path, HEADER_SIZE + new_capacity * self._dtype.itemsize)
+        self._items = self._map(new_capacity)
+        if new_capacity > old_capacity:
+            self._items[old_capacity:].fill(self._default_item_value)
+        self._physical_size = new_capacity
+        self._header['capacity'] = new_capacity
+
+    def clear(self) -> None:
+        """ Clear the Array and truncate the file to just its header.
+
+        Examples:
+            >>> import os, tempfile
+            >>> array = MappedArray(os.path.join(tempfile.mkdtemp(), 'a.bin'), size=10)
+            >>> array.clear()
+            >>> print(len(array), os.path.getsize(array.path))
+            0 64
+
+        Returns:
+            None
+        """
+        if self._mode == 'r':
+            raise ValueError('MappedArray was opened read-only')
+        super().clear()
+        os.truncate(self._path, HEADER_SIZE)
+        self._header['capacity'] = 0
+
+    def flush(self) -> None:
+        """ Write any changes still held in memory to the file.
+
+        Returns:
+            None
+        """
+        if isinstance(self._items, np.memmap):
+            self._items.flush()
+        if self._header is not None:
+            self._header.flush()
+
+    def close(self) -> None:
+        """ Flush and unmap the file. The MappedArray must not be used afterwards; reopen the file
+            with MappedArray.open() instead.
+
+        Returns:
+            None
+        """
+        self.flush()
+        self._items = np.empty(0, dtype=self._dtype)
+        self._header = None
+        self._logical_size = self._physical_size = 0
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        """ Support for pickle: a MappedArray is pickled as a reference to its file, which is
+            flushed first and reopened when unpickled, so the items themselves are never copied.
+
+        Args:
+            protocol (int): the pickle protocol in use.
+
+        Returns:
+            reduce_value (tuple): a callable and its arguments that reopen the file.
+        """
+        self.flush()
+        return (MappedArray.open, (self._path, 'r' if self._mode == 'r' else 'r+', self._growth_policy))
+
+    def __deepcopy__(self, memo: dict) -> Array:
+        """ Deep copy (copy.deepcopy): an in-memory Array holding a copy of the items.
+
+        Args:
+            memo (dict): the deepcopy memo.
+
+        Returns:
+            array (Array): the copy, no longer backed by the file.
+        """
+        return Array.__copy__(self)
+
+    def snapshot(self) -> Array:
+        """ Snapshot: an in-memory Array holding a copy of the items. The file may be remapped or
+            changed by other processes, so its pages cannot be shared copy-on-write.
+
+        Returns:
+            array (Array): the copy, no longer backed by the file.
+        """
+        return Array.__copy__(self)
+
+    def __enter__(self) -> 'MappedArray':
+        """ Enter a with block; the file is closed when the block exits. """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """ Close the file when leaving a with block. """
+        self.close()
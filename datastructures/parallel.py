@@ -0,0 +1,173 @@
+# datastructures.parallel
+
+""" This module runs chunk-wise map and reduce operations over a numpy array in worker processes.
+    Typed (numeric or bool) items are copied once into multiprocessing.shared_memory; each worker
+    attaches to the block and works on a zero-copy view of its own range, and map results are
+    written straight into a shared output block. Object items cannot be shared that way, so each
+    worker is sent a pickled copy of its chunk instead.
+    Array.parallel_map() and Array.parallel_reduce() are the public entry points.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+import functools
+from multiprocessing import shared_memory
+import os
+from typing import Any, Callable
+import numpy as np
+
+
+def chunk_bounds(size: int, workers: int) -> list[tuple[int, int]]:
+    """ Split range(size) into at most `workers` contiguous, non-empty, nearly equal chunks.
+
+    Examples:
+        >>> print(chunk_bounds(10, 3))
+        [(0, 3), (3, 7), (7, 10)]
+
+    Args:
+        size (int): the number of items.
+        workers (int): the number of chunks wanted.
+
+    Returns:
+        bounds (list[tuple[int, int]]): (start, stop) pairs in order.
+    """
+    edges = np.linspace(0, size, min(workers, size) + 1).round().astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """ Attach to an existing shared memory block from a worker. Workers share the parent's resource
+        tracker, so attaching only repeats the parent's registration; the parent alone unlinks the block.
+    """
+    return shared_memory.SharedMemory(name=name)
+
+
+def _shared_array(block: shared_memory.SharedMemory, dtype: np.dtype, size: int) -> np.ndarray:
+    """ View a shared memory block as a 1-D array. """
+    return np.ndarray((size,), dtype=dtype, buffer=block.buf)
+
+
+def _reduce_values(fn: Callable, values: np.ndarray) -> Any:
+    """ Reduce a non-empty chunk: fn.reduce for a ufunc, functools.reduce otherwise. """
+    if isinstance(fn, np.ufunc):
+        return fn.reduce(values)
+    return functools.reduce(fn, values)
+
+
+def _apply(fn: Callable, chunk: np.ndarray) -> np.ndarray:
+    """ Apply fn to a chunk, checking that it returned one result per item. """
+    result = np.asarray(fn(chunk))
+    if result.shape != chunk.shape:
+        raise ValueError(f'fn returned {result.shape} items for a chunk of {len(chunk)}')
+    return result
+
+
+def _map_shared(fn: Callable, source: str, target: str, dtype: str, out_dtype: str, size: int,
+                start: int, stop: int) -> None:
+    """ Worker: apply fn to items [start, stop) of the shared source, writing into the shared target. """
+    source_block, target_block = _attach(source), _attach(target)
+    try:
+        values = _shared_array(source_block, np.dtype(dtype), size)
+        result = _shared_array(target_block, np.dtype(out_dtype), size)
+        result[start:stop] = _apply(fn, values[start:stop])
+        del values, result
+    finally:
+        source_block.close()
+        target_block.close()
+
+
+def _reduce_shared(fn: Callable, source: str, dtype: str, size: int, start: int, stop: int) -> Any:
+    """ Worker: reduce items [start, stop) of the shared source. """
+    source_block = _attach(source)
+    try:
+        values = _shared_array(source_block, np.dtype(dtype), size)
+        partial = _reduce_values(fn, values[start:stop])
+        del values
+        return partial
+    finally:
+        source_block.close()
+
+
+def parallel_map(values: np.ndarray, fn: Callable, workers: int | None = None, dtype: Any = None) -> np.ndarray:
+    """ Apply `fn` to chunks of `values` in worker processes and concatenate the results.
+
+    Examples:
+        >>> print(parallel_map(np.arange(6, dtype=np.int64), np.square, workers=2))
+        [ 0  1  4  9 16 25]
+
+    Args:
+        values (np.ndarray): the 1-D items.
+        fn (Callable): takes a chunk (np.ndarray) and returns an array of the same length; it must
+            be picklable (a ufunc or a module-level function).
+        workers (int | None): the number of processes (default is None, os.cpu_count()).
+        dtype (Any): the dtype of the result (default is None, the dtype of `values` for typed items).
+
+    Returns:
+        result (np.ndarray): the mapped items.
+
+    Raises:
+        ValueError: if fn returns a chunk of the wrong length.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = chunk_bounds(len(values), workers)
+    out_dtype = np.dtype(dtype if dtype is not None else values.dtype)
+
+    if values.dtype.kind == 'O' or out_dtype.kind == 'O':
+        with ProcessPoolExecutor(max_workers=max(len(bounds), 1)) as pool:
+            results = list(pool.map(_apply, [fn] * len(bounds), [values[start:stop] for start, stop in bounds]))
+        return np.concatenate(results).astype(out_dtype, copy=False) if results else np.empty(0, dtype=out_dtype)
+
+    source = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    target = shared_memory.SharedMemory(create=True, size=max(len(values) * out_dtype.itemsize, 1))
+    try:
+        _shared_array(source, values.dtype, len(values))[:] = values
+        with ProcessPoolExecutor(max_workers=max(len(bounds), 1)) as pool:
+            futures = [pool.submit(_map_shared, fn, source.name, target.name, values.dtype.str,
+                                   out_dtype.str, len(values), start, stop) for start, stop in bounds]
+            for future in futures:
+                future.result()
+        return _shared_array(target, out_dtype, len(values)).copy()
+    finally:
+        for block in (source, target):
+            block.close()
+            block.unlink()
+
+
+def parallel_reduce(values: np.ndarray, fn: Callable, init: Any, workers: int | None = None) -> Any:
+    """ Reduce `values` with an associative binary function, one chunk per worker process, then combine
+        the partial results (starting from `init`) in the calling process.
+
+    Examples:
+        >>> print(parallel_reduce(np.arange(101, dtype=np.int64), np.add, 0, workers=2))
+        5050
+
+    Args:
+        values (np.ndarray): the 1-D items.
+        fn (Callable): an associative function of two items, or a binary numpy ufunc (which reduces each
+            chunk with ufunc.reduce); it must be picklable.
+        init (Any): the starting value, returned unchanged for empty `values`.
+        workers (int | None): the number of processes (default is None, os.cpu_count()).
+
+    Returns:
+        result (Any): fn folded over init and every item.
+    """
+    workers = workers or os.cpu_count() or 1
+    bounds = chunk_bounds(len(values), workers)
+    if not bounds:
+        return init
+
+    if values.dtype.kind == 'O':
+        with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+            partials = list(pool.map(_reduce_values, [fn] * len(bounds), [values[start:stop] for start, stop in bounds]))
+    else:
+        source = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        try:
+            _shared_array(source, values.dtype, len(values))[:] = values
+            with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+                futures = [pool.submit(_reduce_shared, fn, source.name, values.dtype.str, len(values), start, stop)
+                           for start, stop in bounds]
+                partials = [future.result() for future in futures]
+        finally:
+            source.close()
+            source.unlink()
+    return functools.reduce(fn, partials, init)
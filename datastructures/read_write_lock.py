@@ -0,0 +1,183 @@
+# datastructures.read_write_lock.ReadWriteLock
+
+""" This module defines a ReadWriteLock class: a lock that lets any number of readers hold it at once,
+    or a single writer. Waiting writers take priority over new readers, so a steady stream of
+    reads cannot starve a write.
+"""
+
+from __future__ import annotations
+import threading
+from typing import Any, Callable
+
+
+class _Guard:
+    """ A reusable context manager that calls `acquire` on entry and `release` on exit. It is created
+        once per lock, so a with block does not build a generator on every call.
+    """
+
+    __slots__ = ('_acquire', '_release')
+
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]) -> None:
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self) -> None:
+        self._acquire()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._release()
+
+
+class ReadWriteLock:
+    """ Class ReadWriteLock - a writer-preferring reader/writer lock.
+            Stipulations:
+            1. The lock is not reentrant: a thread must not acquire it again (for reading or writing)
+               while it already holds it.
+            2. Every acquire must be paired with the matching release; prefer the context managers.
+    """
+
+    def __init__(self) -> None:
+        """ ReadWriteLock Constructor. The lock starts unlocked.
+
+        Examples:
+            >>> lock = ReadWriteLock()
+            >>> with lock.read_locked():
+            ...     print(lock.readers)
+            1
+
+        Returns:
+            None
+        """
+        self._mutex = threading.Lock()
+        self._condition = threading.Condition(self._mutex)
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self._read_guard = _Guard(self.acquire_read, self.release_read)
+        self._write_guard = _Guard(self.acquire_write, self.release_write)
+
+    @property
+    def readers(self) -> int:
+        """ Property for getting the number of threads currently holding the lock for reading.
+
+        Returns:
+            readers (int): the number of active readers.
+        """
+        return self._readers
+
+    @property
+    def writing(self) -> bool:
+        """ Property for checking whether a writer currently holds the lock.
+
+        Returns:
+            locked (bool): true while a writer holds the lock.
+        """
+        return self._writer
+
+    @property
+    def mutex(self) -> threading.Lock:
+        """ Property for getting the internal mutex. A short read can hold it instead of the read lock:
+            `with lock.mutex: lock.wait_for_writers(); ...` is one acquisition instead of two, and no writer
+            can start while the mutex is held. Other short reads wait for it too, which costs nothing
+            under the GIL; readers holding the read lock are not blocked for longer than the short read.
+
+        Examples:
+            >>> lock = ReadWriteLock()
+            >>> with lock.mutex:
+            ...     lock.wait_for_writers()
+            ...     print(lock.writing)
+            False
+
+        Returns:
+            mutex (threading.Lock): the lock guarding the reader and writer counts.
+        """
+        return self._mutex
+
+    def _unlocked(self) -> bool:
+        """ True if no reader or writer holds the lock. """
+        return not self._writer and not self._readers
+
+    def _no_writers(self) -> bool:
+        """ True if no writer holds or is waiting for the lock. """
+        return not self._writer and not self._waiting_writers
+
+    def wait_for_writers(self) -> None:
+        """ With the mutex held, wait until no writer holds or is waiting for the lock.
+
+        Returns:
+            None
+        """
+        if self._writer or self._waiting_writers:
+            self._condition.wait_for(self._no_writers)
+
+    def acquire_read(self) -> None:
+        """ Acquire the lock for reading, waiting while a writer holds or is waiting for it.
+
+        Returns:
+            None
+        """
+        with self._mutex:
+            self.wait_for_writers()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """ Release the lock after reading.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: if the lock is not held for reading.
+        """
+        with self._mutex:
+            if self._readers == 0:
+                raise RuntimeError('ReadWriteLock is not held for reading')
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """ Acquire the lock for writing, waiting until no reader or writer holds it.
+
+        Returns:
+            None
+        """
+        with self._mutex:
+            if self._writer or self._readers:
+                self._waiting_writers += 1
+                try:
+                    self._condition.wait_for(self._unlocked)
+                finally:
+                    self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """ Release the lock after writing.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: if the lock is not held for writing.
+        """
+        with self._mutex:
+            if not self._writer:
+                raise RuntimeError('ReadWriteLock is not held for writing')
+            self._writer = False
+            self._condition.notify_all()
+
+    def read_locked(self) -> _Guard:
+        """ Context manager that holds the lock for reading for the duration of a with block.
+
+        Returns:
+            guard (_Guard): a context manager shared by every read_locked() call on this lock.
+        """
+        return self._read_guard
+
+    def write_locked(self) -> _Guard:
+        """ Context manager that holds the lock for writing for the duration of a with block.
+
+        Returns:
+            guard (_Guard): a context manager shared by every write_locked() call on this lock.
+        """
+        return self._write_guard
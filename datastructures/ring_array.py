@@ -0,0 +1,415 @@
+# datastructures.ring_array.RingArray
+
+""" This module defines a RingArray class: a bounded circular array for sliding windows over a stream.
+    The items live in one numpy buffer of fixed capacity; a head offset and a size describe the
+    window, so pushing or popping at either end is O(1) and nothing is ever shifted or reallocated.
+    When the buffer is full, a push either overwrites the item at the opposite end ('overwrite')
+    or waits until another thread pops ('block').
+"""
+
+from __future__ import annotations
+import threading
+from typing import Any, Iterator
+import numpy as np
+
+from datastructures.array import Array, _match_items
+
+
+class RingArray:
+    """ Class RingArray - a fixed-capacity circular array with O(1) push and pop at both ends.
+            Stipulations:
+            1. Items are stored in a single numpy buffer (object or typed dtype) that never grows.
+            2. Slots outside the window always hold the default value.
+            3. Every operation takes an internal lock, so producer, consumer and reader threads can share
+               a RingArray; with the 'block' policy a full push waits for a pop. Views returned by
+               segments() are not protected once the call returns.
+    """
+
+    POLICIES = ('overwrite', 'block')
+
+    def __init__(self, capacity: int, default_item_value: Any = None, dtype: Any = object,
+                 policy: str = 'overwrite') -> None:
+        """ RingArray Constructor. Creates an empty window of the given capacity.
+
+        Examples:
+            >>> window = RingArray(3, dtype='int64')
+            >>> for i in range(5): window.push_back(i)
+            >>> print(window)
+            [2 3 4]
+
+        Args:
+            capacity (int): the maximum number of items.
+            default_item_value (Any): the value of empty slots (default is None, zero/False for typed dtypes).
+            dtype (Any): object (default), bool, int8-int64, uint8-uint64 or float16-float64.
+            policy (str): 'overwrite' to evict from the opposite end when full, 'block' to wait (default is 'overwrite').
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if dtype is not supported.
+            ValueError: if capacity is less than 1 or policy is unknown.
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        if policy not in RingArray.POLICIES:
+            raise ValueError(f"policy must be 'overwrite' or 'block', not {policy!r}")
+        self._dtype = Array._validate_dtype(dtype)
+        if self._dtype.kind != 'O' and default_item_value is None:
+            default_item_value = self._dtype.type(0)
+        self._default_item_value = default_item_value
+        self._policy = policy
+        self._items = np.empty(capacity, dtype=self._dtype)
+        self._items.fill(default_item_value)
+        self._head = 0
+        self._logical_size = 0
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Property for getting the numpy dtype of the buffer.
+
+        Returns:
+            dtype (np.dtype): the dtype of the items.
+        """
+        return self._dtype
+
+    @property
+    def capacity(self) -> int:
+        """ Property for getting the maximum number of items.
+
+        Returns:
+            capacity (int): the size of the buffer.
+        """
+        return len(self._items)
+
+    @property
+    def policy(self) -> str:
+        """ Property for getting what a push does when the RingArray is full.
+
+        Returns:
+            policy (str): 'overwrite' or 'block'.
+        """
+        return self._policy
+
+    @property
+    def full(self) -> bool:
+        """ Property for checking whether the window holds `capacity` items.
+
+        Returns:
+            full (bool): true if the next push overwrites or blocks.
+        """
+        return self._logical_size == len(self._items)
+
+    def _physical(self, index: int) -> int:
+        """ Map a window index to a buffer slot. """
+        return (self._head + index) % len(self._items)
+
+    def _wait_for_room(self, timeout: float | None) -> bool:
+        """ Make room for one push, with the lock held. Returns true if the push must evict. """
+        if not self.full:
+            return False
+        if self._policy == 'overwrite':
+            return True
+        if not self._not_full.wait_for(lambda: not self.full, timeout):
+            raise TimeoutError('RingArray is full')
+        return False
+
+    def push_back(self, data: Any, timeout: float | None = None) -> None:
+        """ Add an item at the back. When full, the front item is overwritten ('overwrite')
+            or the call waits for a pop ('block').
+
+        Examples:
+            >>> window = RingArray(2)
+            >>> window.push_back('a'); window.push_back('b'); window.push_back('c')
+            >>> print(window)
+            ['b' 'c']
+
+        Args:
+            data (Any): the desired data to push.
+            timeout (float | None): with the 'block' policy, how many seconds to wait (default is None, forever).
+
+        Returns:
+            None
+
+        Raises:
+            TimeoutError: if the 'block' policy timed out waiting for room.
+        """
+        with self._lock:
+            if self._wait_for_room(timeout):
+                self._head = self._physical(1)
+                self._logical_size -= 1
+            self._items[self._physical(self._logical_size)] = data
+            self._logical_size += 1
+
+    def push_front(self, data: Any, timeout: float | None = None) -> None:
+        """ Add an item at the front. When full, the back item is overwritten ('overwrite')
+            or the call waits for a pop ('block').
+
+        Examples:
+            >>> window = RingArray(2)
+            >>> window.push_front('a'); window.push_front('b'); window.push_front('c')
+            >>> print(window)
+            ['c' 'b']
+
+        Args:
+            data (Any): the desired data to push.
+            timeout (float | None): with the 'block' policy, how many seconds to wait (default is None, forever).
+
+        Returns:
+            None
+
+        Raises:
+            TimeoutError: if the 'block' policy timed out waiting for room.
+        """
+        with self._lock:
+            if self._wait_for_room(timeout):
+                self._logical_size -= 1
+            self._head = self._physical(-1)
+            self._items[self._head] = data
+            self._logical_size += 1
+
+    def pop_back(self) -> Any:
+        """ Remove and return the item at the back.
+
+        Examples:
+            >>> window = RingArray(3)
+            >>> window.push_back('a'); window.push_back('b')
+            >>> print(window.pop_back(), len(window))
+            b 1
+
+        Returns:
+            item (Any): the removed item.
+
+        Raises:
+            IndexError: if the RingArray is empty.
+        """
+        with self._lock:
+            if self._logical_size == 0:
+                raise IndexError('pop from an empty RingArray')
+            slot = self._physical(self._logical_size - 1)
+            item = self._items[slot]
+            self._items[slot] = self._default_item_value
+            self._logical_size -= 1
+            self._not_full.notify()
+            return item
+
+    def pop_front(self) -> Any:
+        """ Remove and return the item at the front.
+
+        Examples:
+            >>> window = RingArray(3)
+            >>> window.push_back('a'); window.push_back('b')
+            >>> print(window.pop_front(), len(window))
+            a 1
+
+        Returns:
+            item (Any): the removed item.
+
+        Raises:
+            IndexError: if the RingArray is empty.
+        """
+        with self._lock:
+            if self._logical_size == 0:
+                raise IndexError('pop from an empty RingArray')
+            item = self._items[self._head]
+            self._items[self._head] = self._default_item_value
+            self._head = self._physical(1)
+            self._logical_size -= 1
+            self._not_full.notify()
+            return item
+
+    def segments(self) -> tuple[np.ndarray, ...]:
+        """ Get the window as one or two numpy views of the buffer, oldest items first.
+            No items are copied; the views see later writes to the same slots.
+
+        Examples:
+            >>> window = RingArray(4, dtype='int64')
+            >>> for i in range(6): window.push_back(i)
+            >>> print(window.segments())
+            (array([2, 3]), array([4, 5]))
+
+        Returns:
+            segments (tuple[np.ndarray, ...]): one view if the window does not wrap, otherwise two
+                (no views when empty).
+        """
+        with self._lock:
+            return self._segments()
+
+    def _segments(self) -> tuple[np.ndarray, ...]:
+        """ segments() with the lock already held. """
+        end = self._head + self._logical_size
+        if self._logical_size == 0:
+            return ()
+        if end <= len(self._items):
+            return (self._items[self._head:end],)
+        return (self._items[self._head:], self._items[:end - len(self._items)])
+
+    def __getitem__(self, index: int) -> Any:
+        """ Bracket operator for getting an item; index 0 is the front (oldest) item.
+
+        Examples:
+            >>> window = RingArray(2)
+            >>> for word in ['a', 'b', 'c']: window.push_back(word)
+            >>> print(window[0])
+            b
+
+        Args:
+            index (int): the desired index.
+
+        Returns:
+            Any: the item at the index.
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        with self._lock:
+            if index < 0 or index >= self._logical_size:
+                raise IndexError('Must be in range of array.')
+            return self._items[self._physical(index)]
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        """ Bracket operator for setting an item.
+
+        Args:
+            index (int): the desired index to set.
+            data (Any): the desired data to set at index.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        with self._lock:
+            if index < 0 or index >= self._logical_size:
+                raise IndexError(f'Index {index} out of bounds')
+            self._items[self._physical(index)] = data
+
+    def __len__(self) -> int:
+        """ Length operator for getting the number of items in the window.
+
+        Returns:
+            length (int): the number of items.
+        """
+        return self._logical_size
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Iterator operator, from the front (oldest) item to the back. Iterates over a copy of the
+            window taken under the lock, so concurrent pushes and pops do not affect it.
+
+        Yields:
+            item (Any): yields the item at index
+        """
+        yield from np.asarray(self)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """ Reversed iterator operator, from the back (newest) item to the front. Like __iter__, it
+            iterates over a copy of the window.
+
+        Yields:
+            item (Any): yields the item at index starting at the end
+        """
+        yield from np.asarray(self)[::-1]
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in). Each segment is compared in one numpy pass.
+
+        Args:
+            item (Any): the desired item to check whether it's in the window.
+
+        Returns:
+            contains_item (bool): true if the window contains the item.
+        """
+        with self._lock:
+            return any(_match_items(segment, item).any() for segment in self._segments())
+
+    def __does_not_contain__(self, item: Any) -> bool:
+        """ Does not contain operator (not in).
+
+        Args:
+            item (Any): the desired item to check whether it's in the window.
+
+        Returns:
+            does_not_contains_item (bool): true if the window does not contain the item.
+        """
+        return not self.__contains__(item)
+
+    def __eq__(self, other: object) -> bool:
+        """ Equality operator ==. Compares the windows item by item; capacity is ignored.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_equal (bool): true if both hold equal items in the same order.
+
+        Raises:
+            TypeError: if other is not a RingArray or Array.
+        """
+        if not isinstance(other, (RingArray, Array)):
+            raise TypeError("Input must be an array.")
+        if len(self) != len(other):
+            return False
+        return bool(np.array_equal(np.asarray(self), np.asarray(other)))
+
+    def __ne__(self, other: object) -> bool:
+        """ Non-Equality operator !=.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_not_equal (bool): true if the arrays are NOT equal.
+        """
+        return not self.__eq__(other)
+
+    def clear(self) -> None:
+        """ Remove every item, waking any pushes waiting for room.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._items.fill(self._default_item_value)
+            self._head = 0
+            self._logical_size = 0
+            self._not_full.notify_all()
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """ numpy conversion (np.asarray(window)). The window is copied into one contiguous array;
+            use segments() for zero-copy access.
+
+        Args:
+            dtype (Any): the dtype of the result (default is None, the window's dtype).
+            copy (bool | None): False is rejected because the window may wrap around.
+
+        Returns:
+            values (np.ndarray): the items, oldest first.
+
+        Raises:
+            ValueError: if copy is False.
+        """
+        if copy is False:
+            raise ValueError('A RingArray cannot be converted to numpy without a copy')
+        with self._lock:
+            segments = self._segments()
+            values = np.concatenate(segments) if segments else np.empty(0, dtype=self._dtype)
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return str(np.asarray(self))
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return self.__str__()
@@ -0,0 +1,339 @@
+# datastructures.sorted_array.SortedArray
+
+""" This module defines a SortedArray class: an Array that keeps its items in ascending order.
+    Lookups use binary search (O(log n)) instead of a linear scan, range queries return
+    zero-copy ArrayViews, and batches of new items are merged in with one pass over the
+    existing items instead of being inserted one at a time.
+    The SortedArray uses a datastructures.Array object as the internal data structure.
+"""
+
+from __future__ import annotations
+from typing import Any, Iterable, Iterator
+import numpy as np
+
+from datastructures.array import Array, ArrayView
+
+
+class SortedArray:
+    """ Class SortedArray - an ordered collection backed by an Array.
+            Stipulations:
+            1. Items are kept in ascending order; equal items keep their insertion order.
+            2. Items must be comparable with each other (<).
+            3. Writing through a view returned by range() must not break the order.
+    """
+
+    def __init__(self, items: Iterable = (), dtype: Any = object) -> None:
+        """ SortedArray Constructor. Sorts the initial items once.
+
+        Examples:
+            >>> array = SortedArray([3, 1, 2], dtype='int64')
+            >>> print(array)
+            [1 2 3]
+
+        Args:
+            items (Iterable): the initial items (default is no items).
+            dtype (Any): the dtype to store the items as (default is object).
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if dtype is not supported or the items are not comparable.
+        """
+        self._items = Array.from_iterable(items, dtype=dtype)
+        self._items.sort()
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Property for getting the numpy dtype of the items.
+
+        Returns:
+            dtype (np.dtype): the dtype of the items.
+        """
+        return self._items.dtype
+
+    def add(self, item: Any) -> None:
+        """ Insert one item, after any equal items. The items after it are shifted in one block copy.
+
+        Examples:
+            >>> array = SortedArray(['a', 'c'])
+            >>> array.add('b')
+            >>> print(array)
+            ['a' 'b' 'c']
+
+        Args:
+            item (Any): the item to insert.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if the item is not comparable with the items.
+        """
+        position = self._items.bisect_right(item)
+        size = len(self._items)
+        self._items.append(item)
+        if position < size:
+            self._items[position + 1:size + 1][:] = np.asarray(self._items[position:size])
+            self._items[position] = item
+
+    def update(self, iterable: Iterable) -> None:
+        """ Insert a batch of items. The batch is sorted (O(k log k)), its insertion points are found by
+            binary search, and the existing items are merged with it in a single O(n + k) pass.
+
+        Examples:
+            >>> array = SortedArray([10, 20, 30], dtype='int64')
+            >>> array.update([25, 5, 30])
+            >>> print(array)
+            [ 5 10 20 25 30 30]
+
+        Args:
+            iterable (Iterable): the items to insert.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if the items are not comparable.
+        """
+        batch = Array.from_iterable(iterable, dtype=self._items.dtype)
+        if len(batch) == 0:
+            return
+        batch.sort()
+        existing = np.asarray(self._items)
+        new_items = np.asarray(batch)
+        positions = np.searchsorted(existing, new_items, side='right')
+        self._items = Array.from_numpy(np.insert(existing, positions, new_items))
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """ Bracket operator for getting an item (or a read view of a slice) in sorted order.
+
+        Examples:
+            >>> print(SortedArray(['b', 'a'])[0])
+            a
+
+        Args:
+            index (int | slice): the desired index.
+
+        Returns:
+            Any: the item at the index, or an ArrayView for a slice.
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        return self._items[index]
+
+    def __delitem__(self, index: int) -> None:
+        """ Delete the item at an index. The order of the remaining items is unchanged.
+
+        Args:
+            index (int): the desired index to delete.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        del self._items[index]
+
+    def remove(self, item: Any) -> None:
+        """ Remove the first occurrence of an item.
+
+        Examples:
+            >>> array = SortedArray([1, 2, 2])
+            >>> array.remove(2)
+            >>> print(array)
+            [1 2]
+
+        Args:
+            item (Any): the item to remove.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the item is not present.
+        """
+        del self._items[self.index(item)]
+
+    def __len__(self) -> int:
+        """ Length operator for getting the number of items.
+
+        Returns:
+            length (int): the number of items.
+        """
+        return len(self._items)
+
+    def _find(self, item: Any) -> int:
+        """ Binary search for `item`, returning its first index or -1. Incomparable items are absent. """
+        try:
+            position = self._items.bisect_left(item)
+        except TypeError:
+            return -1
+        if position < len(self._items) and self._items[position] == item:
+            return position
+        return -1
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in). Uses a binary search, O(log n).
+
+        Examples:
+            >>> array = SortedArray(['a', 'b', 'c'])
+            >>> print('b' in array, 'z' in array)
+            True False
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            contains_item (bool): true if the array contains the item.
+        """
+        return self._find(item) >= 0
+
+    def __does_not_contain__(self, item: Any) -> bool:
+        """ Does not contain operator (not in).
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            does_not_contains_item (bool): true if the array does not contain the item.
+        """
+        return not self.__contains__(item)
+
+    def index(self, item: Any) -> int:
+        """ Find the index of the first occurrence of an item with a binary search, O(log n).
+
+        Examples:
+            >>> print(SortedArray([5, 1, 3]).index(3))
+            1
+
+        Args:
+            item (Any): the item to search for.
+
+        Returns:
+            index (int): the index of the first item equal to `item`.
+
+        Raises:
+            ValueError: if the item is not present.
+        """
+        position = self._find(item)
+        if position < 0:
+            raise ValueError(f'{item!r} is not in array')
+        return position
+
+    def count(self, item: Any) -> int:
+        """ Count the occurrences of an item with two binary searches.
+
+        Args:
+            item (Any): the item to count.
+
+        Returns:
+            count (int): the number of items equal to `item`.
+        """
+        try:
+            return self._items.bisect_right(item) - self._items.bisect_left(item)
+        except TypeError:
+            return 0
+
+    def range(self, lo: Any, hi: Any) -> ArrayView:
+        """ Get the items x with lo <= x < hi as a zero-copy view.
+
+        Examples:
+            >>> array = SortedArray([1, 3, 5, 7, 9], dtype='int64')
+            >>> print(array.range(3, 8))
+            [3 5 7]
+
+        Args:
+            lo (Any): the inclusive lower bound.
+            hi (Any): the exclusive upper bound.
+
+        Returns:
+            view (ArrayView): a view of the matching items, valid until the SortedArray next changes.
+
+        Raises:
+            TypeError: if the bounds are not comparable with the items.
+        """
+        start = self._items.bisect_left(lo)
+        stop = max(start, self._items.bisect_left(hi))
+        return self._items[start:stop]
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Iterator operator, in ascending order.
+
+        Yields:
+            item (Any): yields the item at index
+        """
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """ Reversed iterator operator, in descending order.
+
+        Yields:
+            item (Any): yields the item at index starting at the end
+        """
+        return reversed(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        """ Equality operator ==.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_equal (bool): true if both hold equal items.
+
+        Raises:
+            TypeError: if other is not a SortedArray.
+        """
+        if not isinstance(other, SortedArray):
+            raise TypeError("Input must be a SortedArray.")
+        return self._items == other._items
+
+    def __ne__(self, other: object) -> bool:
+        """ Non-Equality operator !=.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_not_equal (bool): true if the arrays are NOT equal.
+        """
+        return not self.__eq__(other)
+
+    def clear(self) -> None:
+        """ Remove every item.
+
+        Returns:
+            None
+        """
+        self._items.clear()
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """ numpy conversion (np.asarray(array)). Returns a view of the sorted items unless a copy is needed.
+
+        Args:
+            dtype (Any): the dtype of the result (default is None, the array's dtype).
+            copy (bool | None): True to always copy, False to never copy, None to copy only if needed.
+
+        Returns:
+            values (np.ndarray): the items in ascending order.
+        """
+        return self._items.__array__(dtype, copy)
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return str(self._items)
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return self.__str__()
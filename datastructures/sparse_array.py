@@ -0,0 +1,502 @@
+# datastructures.sparse_array.SparseArray
+
+""" This module defines a SparseArray class: a one-dimensional array for data that is mostly the default value.
+    While few items differ from the default, only those items are stored, in a dictionary from
+    index to value, so memory is proportional to the populated items rather than the length.
+    When the array fills up past a density threshold it switches to a dense datastructures.Array,
+    and it switches back once it empties out again (with hysteresis, so it does not flip back and
+    forth around the threshold).
+
+    SparseArray is a separate type rather than a storage mode of Array because Array promises a
+    contiguous numpy buffer: slices are zero-copy ArrayViews, np.asarray(), the buffer protocol,
+    memory mapping, pickle-5 buffers and copy-on-write snapshots all hand out that buffer, which a
+    dictionary of entries cannot provide without materializing it. A typed Array whose default is
+    zero already costs no memory until its pages are written, since its buffer is allocated zeroed.
+    Code that builds mostly-default arrays can switch by constructing a SparseArray with the same
+    arguments, or converting with SparseArray.from_array(); the item API is the same, and
+    to_array() converts back where an Array is required.
+"""
+
+from __future__ import annotations
+from typing import Any, Iterator
+import numpy as np
+
+from datastructures.array import Array, _match_items
+
+
+class SparseArray:
+    """ Class SparseArray - an array that stores only its non-default items while it is sparse.
+            Stipulations:
+            1. Items equal to the default value are never stored in sparse mode.
+            2. The array becomes dense when more than density_threshold of the items are populated,
+               and sparse again when fewer than half of that are.
+            3. Negative indices are not supported, as in Array.
+    """
+
+    def __init__(self, size: int = 0, default_item_value: Any = None, dtype: Any = object,
+                 density_threshold: float = 0.05) -> None:
+        """ SparseArray Constructor. Creates an array of `size` default values without materializing them.
+
+        Examples:
+            >>> vector = SparseArray(size=10_000_000, dtype='float64')
+            >>> vector[123] = 1.5
+            >>> print(len(vector), vector.populated, vector.is_sparse)
+            10000000 1 True
+
+        Args:
+            size (int): the initial size (default is 0).
+            default_item_value (Any): the default value (default is None, zero/False for typed dtypes).
+            dtype (Any): object (default), bool, int8-int64, uint8-uint64 or float16-float64.
+            density_threshold (float): the fraction of populated items above which the array is stored
+                densely (default is 0.05).
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: if dtype is not supported.
+            ValueError: if size is negative or density_threshold is not in (0, 1].
+        """
+        if size < 0:
+            raise ValueError('size must not be negative')
+        if not 0 < density_threshold <= 1:
+            raise ValueError('density_threshold must be in (0, 1]')
+        self._dtype = Array._validate_dtype(dtype)
+        if self._dtype.kind != 'O' and default_item_value is None:
+            default_item_value = self._dtype.type(0)
+        self._default_item_value = default_item_value
+        self._density_threshold = density_threshold
+        self._size = size
+        self._populated = 0
+        self._entries: dict[int, Any] = {}
+        self._dense: Array | None = None
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Property for getting the numpy dtype of the items.
+
+        Returns:
+            dtype (np.dtype): the dtype of the items.
+        """
+        return self._dtype
+
+    @property
+    def is_sparse(self) -> bool:
+        """ Property for checking whether only the populated items are stored.
+
+        Returns:
+            is_sparse (bool): true in sparse mode, false in dense mode.
+        """
+        return self._dense is None
+
+    @property
+    def populated(self) -> int:
+        """ Property for getting the number of items that differ from the default value.
+
+        Returns:
+            populated (int): the number of non-default items.
+        """
+        return self._populated
+
+    @property
+    def density(self) -> float:
+        """ Property for getting the fraction of items that differ from the default value.
+
+        Returns:
+            density (float): populated / length (0.0 for an empty array).
+        """
+        return self._populated / self._size if self._size else 0.0
+
+    def _is_default(self, value: Any) -> bool:
+        """ Check whether `value` equals the default value. """
+        try:
+            return bool(value == self._default_item_value)
+        except (TypeError, ValueError):
+            return False
+
+    def _cast(self, value: Any) -> Any:
+        """ Convert a value the way storing it in the dense buffer would. """
+        return value if self._dtype.kind == 'O' else self._dtype.type(value)
+
+    def _count_populated(self, values: np.ndarray) -> int:
+        """ Count the items of `values` that differ from the default value, in one numpy pass. """
+        return len(values) - int(np.count_nonzero(_match_items(values, self._default_item_value)))
+
+    def _to_dense(self) -> None:
+        """ Switch to dense storage. """
+        dense = Array(self._size, self._default_item_value, self._dtype)
+        if self._entries:
+            positions = np.fromiter(self._entries.keys(), dtype=np.intp, count=len(self._entries))
+            values = np.fromiter(self._entries.values(), dtype=self._dtype, count=len(self._entries))
+            np.asarray(dense)[positions] = values
+        self._dense = dense
+        self._entries = {}
+
+    def _to_sparse(self) -> None:
+        """ Switch to sparse storage. """
+        values = np.asarray(self._dense)
+        positions = np.flatnonzero(~_match_items(values, self._default_item_value))
+        self._entries = dict(zip(positions.tolist(), values[positions]))
+        self._dense = None
+
+    def _rebalance(self) -> None:
+        """ Switch storage if the density crossed the threshold (the dense-to-sparse switch happens at half of it). """
+        limit = self._density_threshold * self._size
+        if self._dense is None and self._populated > limit:
+            self._to_dense()
+        elif self._dense is not None and self._populated < limit / 2:
+            self._to_sparse()
+
+    def __getitem__(self, index: int) -> Any:
+        """ Bracket operator for getting an item.
+
+        Examples:
+            >>> vector = SparseArray(size=5, default_item_value=0)
+            >>> vector[3] = 7
+            >>> print(vector[3], vector[4])
+            7 0
+
+        Args:
+            index (int): the desired index.
+
+        Returns:
+            Any: the item at the index.
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self._size:
+            raise IndexError('Must be in range of array.')
+        if self._dense is not None:
+            return self._dense[index]
+        return self._entries.get(index, self._default_item_value)
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        """ Bracket operator for setting an item. Setting the default value removes a stored item.
+
+        Args:
+            index (int): the desired index to set.
+            data (Any): the desired data to set at index.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self._size:
+            raise IndexError(f'Index {index} out of bounds')
+        data = self._cast(data)
+        populated = not self._is_default(data)
+        if self._dense is not None:
+            self._populated += populated - (not self._is_default(self._dense[index]))
+            self._dense[index] = data
+        elif populated:
+            self._populated += index not in self._entries
+            self._entries[index] = data
+        elif index in self._entries:
+            del self._entries[index]
+            self._populated -= 1
+        self._rebalance()
+
+    def append(self, data: Any) -> None:
+        """ Append an item to the end.
+
+        Examples:
+            >>> vector = SparseArray(size=2)
+            >>> vector.append('x')
+            >>> print(vector)
+            [None None 'x']
+
+        Args:
+            data (Any): the desired data to append.
+
+        Returns:
+            None
+        """
+        if self._dense is not None:
+            self._dense.append(data)
+        self._size += 1
+        if self._dense is None:
+            self[self._size - 1] = data
+        else:
+            self._populated += not self._is_default(self._dense[self._size - 1])
+            self._rebalance()
+
+    def __len__(self) -> int:
+        """ Length operator for getting the number of items, including default ones.
+
+        Returns:
+            length (int): the number of items.
+        """
+        return self._size
+
+    def resize(self, new_size: int, default_value: Any = None) -> None:
+        """ Resize the array. Shrinking truncates; growing appends default values, which costs nothing
+            in sparse mode.
+
+        Examples:
+            >>> vector = SparseArray(size=2, default_item_value=0)
+            >>> vector[1] = 5
+            >>> vector.resize(1_000_000)
+            >>> print(len(vector), vector.populated)
+            1000000 1
+
+        Args:
+            new_size (int): the desired new size.
+            default_value (Any): the value for new items (default is None, the default value of the array).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if the new size is less than 0.
+        """
+        if new_size < 0:
+            raise ValueError()
+        fill_populated = default_value is not None and not self._is_default(self._cast(default_value))
+        if new_size > self._size and fill_populated and self._dense is None:
+            self._to_dense()
+
+        if self._dense is not None:
+            if new_size < self._size:
+                self._populated -= self._count_populated(np.asarray(self._dense[new_size:]))
+            elif fill_populated:
+                self._populated += new_size - self._size
+            self._dense.resize(new_size, default_value)
+        elif new_size < self._size:
+            for index in [index for index in self._entries if index >= new_size]:
+                del self._entries[index]
+            self._populated = len(self._entries)
+        self._size = new_size
+        self._rebalance()
+
+    def __delitem__(self, index: int) -> None:
+        """ Delete an item, moving the items after it down by one.
+
+        Args:
+            index (int): the desired index to delete.
+
+        Returns:
+            None
+
+        Raises:
+            IndexError: if the index is out of bounds.
+        """
+        if index < 0 or index >= self._size:
+            raise IndexError("Index out of range")
+        if self._dense is not None:
+            self._populated -= not self._is_default(self._dense[index])
+            del self._dense[index]
+        else:
+            self._entries = {(position - 1 if position > index else position): value
+                             for position, value in self._entries.items() if position != index}
+            self._populated = len(self._entries)
+        self._size -= 1
+        self._rebalance()
+
+    def items(self) -> Iterator[tuple[int, Any]]:
+        """ Iterate over the populated items only, in index order. In sparse mode this costs
+            O(populated log populated), not O(length).
+
+        Examples:
+            >>> vector = SparseArray(size=1000, default_item_value=0)
+            >>> vector[900] = 2; vector[5] = 1
+            >>> print(list(vector.items()))
+            [(5, 1), (900, 2)]
+
+        Yields:
+            item (tuple[int, Any]): the index and value of each non-default item.
+        """
+        if self._dense is None:
+            yield from sorted(self._entries.items())
+            return
+        values = np.asarray(self._dense)
+        for position in np.flatnonzero(~_match_items(values, self._default_item_value)).tolist():
+            yield position, values[position]
+
+    def __iter__(self) -> Iterator[Any]:
+        """ Iterator operator over every item, including default ones.
+
+        Yields:
+            item (Any): yields the item at index
+        """
+        if self._dense is not None:
+            yield from self._dense
+            return
+        default = self._default_item_value
+        position = 0
+        for index, value in sorted(self._entries.items()):
+            for _ in range(index - position):
+                yield default
+            yield value
+            position = index + 1
+        for _ in range(self._size - position):
+            yield default
+
+    def __reversed__(self) -> Iterator[Any]:
+        """ Reversed iterator operator over every item, including default ones.
+
+        Yields:
+            item (Any): yields the item at index starting at the end
+        """
+        for index in range(self._size - 1, -1, -1):
+            yield self[index]
+
+    def __contains__(self, item: Any) -> bool:
+        """ Contains operator (in). In sparse mode only the populated items are compared.
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            contains_item (bool): true if the array contains the item.
+        """
+        if self._dense is not None:
+            return item in self._dense
+        if self._populated < self._size and self._is_default(item):
+            return True
+        values = np.fromiter(self._entries.values(), dtype=self._dtype, count=len(self._entries))
+        return bool(_match_items(values, item).any())
+
+    def __does_not_contain__(self, item: Any) -> bool:
+        """ Does not contain operator (not in).
+
+        Args:
+            item (Any): the desired item to check whether it's in the array.
+
+        Returns:
+            does_not_contains_item (bool): true if the array does not contain the item.
+        """
+        return not self.__contains__(item)
+
+    def __eq__(self, other: object) -> bool:
+        """ Equality operator ==. Two sparse arrays with the same default are compared by their
+            populated items alone; anything else is compared item by item.
+
+        Examples:
+            >>> first, second = SparseArray(size=10**6), SparseArray(size=10**6)
+            >>> first[10] = second[10] = 'x'
+            >>> print(first == second)
+            True
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_equal (bool): true if both hold equal items in the same order.
+
+        Raises:
+            TypeError: if other is not a SparseArray or Array.
+        """
+        if not isinstance(other, (SparseArray, Array)):
+            raise TypeError("Input must be an array.")
+        if len(self) != len(other):
+            return False
+        if (isinstance(other, SparseArray) and self._dense is None and other._dense is None
+                and self._is_default(other._default_item_value)):
+            if self._entries.keys() != other._entries.keys():
+                return False
+            positions = list(self._entries)
+            mine = np.fromiter((self._entries[index] for index in positions), dtype=self._dtype, count=len(positions))
+            theirs = np.fromiter((other._entries[index] for index in positions), dtype=other._dtype, count=len(positions))
+            return bool(np.array_equal(mine, theirs))
+        return bool(np.array_equal(np.asarray(self), np.asarray(other)))
+
+    def __ne__(self, other: object) -> bool:
+        """ Non-Equality operator !=.
+
+        Args:
+            other (object): the instance to compare self to.
+
+        Returns:
+            is_not_equal (bool): true if the arrays are NOT equal.
+        """
+        return not self.__eq__(other)
+
+    def clear(self) -> None:
+        """ Clear the array, releasing all storage.
+
+        Returns:
+            None
+        """
+        self._size = 0
+        self._populated = 0
+        self._entries = {}
+        self._dense = None
+
+    @staticmethod
+    def from_array(array: Array, density_threshold: float = 0.05) -> 'SparseArray':
+        """ Create a SparseArray with the items, default value and dtype of an Array. Only the items
+            that differ from the default are kept if they are few enough.
+
+        Examples:
+            >>> array = Array(size=1000, dtype='int32')
+            >>> array[10] = 7
+            >>> vector = SparseArray.from_array(array)
+            >>> print(vector.populated, vector.is_sparse, vector[10])
+            1 True 7
+
+        Args:
+            array (Array): the Array to convert.
+            density_threshold (float): see the constructor (default is 0.05).
+
+        Returns:
+            vector (SparseArray): a new SparseArray holding the same items.
+        """
+        vector = SparseArray(0, array._default_item_value, array.dtype, density_threshold)
+        values = np.asarray(array)
+        positions = np.flatnonzero(~_match_items(values, vector._default_item_value))
+        vector._size = len(values)
+        vector._entries = dict(zip(positions.tolist(), values[positions]))
+        vector._populated = len(positions)
+        vector._rebalance()
+        return vector
+
+    def to_array(self) -> Array:
+        """ Materialize the items into a dense Array.
+
+        Returns:
+            array (Array): a new Array holding every item.
+        """
+        return Array.from_numpy(np.asarray(self).copy(), default_item_value=self._default_item_value)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """ numpy conversion (np.asarray(vector)). In sparse mode this builds the dense items.
+
+        Args:
+            dtype (Any): the dtype of the result (default is None, the array's dtype).
+            copy (bool | None): True to always copy, False to never copy, None to copy only if needed.
+
+        Returns:
+            values (np.ndarray): every item.
+
+        Raises:
+            ValueError: if copy is False in sparse mode, where the dense items do not exist yet.
+        """
+        if self._dense is not None:
+            return self._dense.__array__(dtype, copy)
+        if copy is False:
+            raise ValueError('A sparse SparseArray cannot be converted to numpy without a copy')
+        values = np.empty(self._size, dtype=self._dtype)
+        values.fill(self._default_item_value)
+        if self._entries:
+            positions = np.fromiter(self._entries.keys(), dtype=np.intp, count=len(self._entries))
+            values[positions] = np.fromiter(self._entries.values(), dtype=self._dtype, count=len(self._entries))
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __str__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return str(np.asarray(self))
+
+    def __repr__(self) -> str:
+        """ Return a string representation of the data and structure.
+
+        Returns:
+            string (str): the string representation of the data and structure.
+        """
+        return self.__str__()
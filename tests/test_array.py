@@ -2,8 +2,22 @@
 # Just make sure the new name starts with test_ and ends with .py.
 
 # import data structures like this:
-from datastructures.array import Array
+from datastructures.array import Array, ArrayView
+from datastructures import array as array_module
+from datastructures.array_file import HEADER_SIZE
+from datastructures import buffer_pool
+from datastructures.buffer_pool import BufferPool
+from datastructures.growth_policy import ChunkGrowth
+from datastructures.hash_index import HashIndex
+from tests.car import Car, Color, Make, Model
+import copy
+import numpy as np
+import operator
+import os
+import pickle
 import pytest
+import sys
+import weakref
 
 
 class TestClassTemplate:
@@ -251,4 +265,1164 @@ class TestClassTemplate:
     #testing str
             
 
-    #testing repr
\ No newline at end of file
+    #testing repr
+
+    #testing dtype
+    def test_default_dtype_is_object(self):
+        test_array = Array(3)
+        assert test_array.dtype == object
+
+    def test_typed_array_uses_native_buffer(self):
+        test_array = Array(size=4, dtype='int32')
+        assert test_array._items.dtype == np.int32
+        assert list(test_array) == [0, 0, 0, 0]
+
+    def test_typed_array_default_value(self):
+        test_array = Array(size=3, default_item_value=1.5, dtype='float64')
+        assert list(test_array) == [1.5, 1.5, 1.5]
+
+    def test_typed_array_unsupported_dtype(self):
+        with pytest.raises(TypeError):
+            Array(size=3, dtype='complex128')
+
+    def test_typed_array_append_and_resize_keep_dtype(self):
+        test_array = Array(dtype='int64')
+        for i in range(10):
+            test_array.append(i)
+        test_array.resize(12)
+        assert test_array._items.dtype == np.int64
+        assert list(test_array) == list(range(10)) + [0, 0]
+
+    def test_typed_array_eq_and_contains(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int16')
+        other_array = Array.from_list([1, 2, 3], dtype='int16')
+        assert test_array == other_array
+        assert 2 in test_array
+        assert 5 not in test_array
+        assert 'two' not in test_array
+
+    def test_typed_array_reversed(self):
+        test_array = Array.from_list([1, 2, 3], dtype='uint8')
+        assert list(reversed(test_array)) == [3, 2, 1]
+
+    def test_clear_keeps_numpy_buffer(self):
+        test_array = Array(size=5, dtype='bool')
+        test_array.clear()
+        assert isinstance(test_array._items, np.ndarray)
+        test_array.append(True)
+        assert list(test_array) == [True]
+
+    #testing growth policy
+    def test_append_grows_with_policy(self):
+        test_array = Array(growth_policy=ChunkGrowth(chunk_size=8))
+        for i in range(9):
+            test_array.append(i)
+        assert test_array.capacity == 16
+        assert list(test_array) == list(range(9))
+
+    def test_append_doubles_by_default(self):
+        test_array = Array(size=4)
+        test_array.append(1)
+        assert test_array.capacity == 8
+
+    def test_reserve_grows_capacity_only(self):
+        test_array = Array.from_list([1, 2, 3])
+        test_array.reserve(50)
+        assert test_array.capacity == 50
+        assert len(test_array) == 3
+        assert list(test_array) == [1, 2, 3]
+
+    def test_reserve_never_shrinks(self):
+        test_array = Array(size=10)
+        test_array.reserve(2)
+        assert test_array.capacity == 10
+
+    def test_reserve_negative(self):
+        with pytest.raises(ValueError):
+            Array().reserve(-1)
+
+    def test_shrink_to_fit(self):
+        test_array = Array.from_list(['a', 'b'])
+        test_array.reserve(10)
+        test_array.shrink_to_fit()
+        assert test_array.capacity == 2
+        assert list(test_array) == ['a', 'b']
+
+    def test_append_after_reserve_does_not_reallocate(self):
+        test_array = Array(dtype='int64')
+        test_array.reserve(100)
+        items = test_array._items
+        for i in range(100):
+            test_array.append(i)
+        assert test_array._items is items
+
+    def test_resize_keeps_capacity_when_truncating(self):
+        test_array = Array(size=10, default_item_value=1)
+        test_array.resize(6)
+        assert test_array.capacity == 10
+        assert list(test_array) == [1] * 6
+
+    def test_resize_uses_default_value_argument(self):
+        test_array = Array.from_list([1, 2])
+        test_array.resize(4, default_value=0)
+        assert list(test_array) == [1, 2, 0, 0]
+
+    def test_resize_truncate_then_grow_restores_defaults(self):
+        test_array = Array.from_list([1, 2, 3, 4])
+        test_array.resize(2)
+        test_array.resize(4)
+        assert list(test_array) == [1, 2, None, None]
+
+    def test_delete_shrinks_with_hysteresis(self):
+        test_array = Array(size=16)
+        for _ in range(11):
+            del test_array[0]
+        assert test_array.capacity == 16
+        for _ in range(1):
+            del test_array[0]
+        assert test_array.capacity == 8
+        assert len(test_array) == 4
+
+    def test_eq_ignores_capacity(self):
+        test_array = Array.from_list([1, 2, 3])
+        test_array.reserve(10)
+        assert test_array == Array.from_list([1, 2, 3])
+
+    #testing bulk construction
+    def test_from_list_keeps_nested_lists_as_items(self):
+        test_array = Array.from_list([[1, 2], [3, 4]])
+        assert len(test_array) == 2
+        assert test_array[1] == [3, 4]
+
+    def test_from_list_typed(self):
+        test_array = Array.from_list([1, 2, 3], dtype='float32')
+        assert test_array._items.dtype == np.float32
+        assert list(test_array) == [1.0, 2.0, 3.0]
+
+    def test_from_iterable_generator(self):
+        test_array = Array.from_iterable((i for i in range(10)), dtype='int64')
+        assert list(test_array) == list(range(10))
+
+    def test_from_iterable_size_hint_reserves(self):
+        test_array = Array.from_iterable(iter([1, 2, 3]), size_hint=100)
+        assert len(test_array) == 3
+        assert test_array.capacity == 100
+
+    def test_from_numpy_shares_buffer(self):
+        data = np.arange(5)
+        test_array = Array.from_numpy(data)
+        data[0] = 42
+        assert test_array[0] == 42
+        assert test_array.dtype == data.dtype
+
+    def test_from_numpy_copy(self):
+        data = np.arange(5)
+        test_array = Array.from_numpy(data, copy=True)
+        data[0] = 42
+        assert test_array[0] == 0
+
+    def test_from_numpy_rejects_bad_input(self):
+        with pytest.raises(TypeError):
+            Array.from_numpy([1, 2, 3])
+        with pytest.raises(ValueError):
+            Array.from_numpy(np.zeros((2, 2)))
+        with pytest.raises(TypeError):
+            Array.from_numpy(np.zeros(2, dtype=complex))
+
+    #testing extend
+    def test_extend_list(self):
+        test_array = Array.from_list(['a'])
+        test_array.extend(['b', 'c'])
+        assert list(test_array) == ['a', 'b', 'c']
+
+    def test_extend_array_and_numpy(self):
+        test_array = Array(dtype='int64')
+        test_array.extend(Array.from_list([1, 2], dtype='int64'))
+        test_array.extend(np.array([3, 4]))
+        assert list(test_array) == [1, 2, 3, 4]
+
+    def test_extend_with_itself(self):
+        test_array = Array.from_list([1, 2])
+        test_array.extend(test_array)
+        assert list(test_array) == [1, 2, 1, 2]
+
+    def test_extend_generator_in_chunks(self):
+        test_array = Array(dtype='int32')
+        test_array.extend(i for i in range(200000))
+        assert len(test_array) == 200000
+        assert test_array[199999] == 199999
+
+    def test_extend_typed_rejects_bad_items(self):
+        test_array = Array(dtype='int64')
+        with pytest.raises(ValueError):
+            test_array.extend(['one'])
+        assert len(test_array) == 0
+
+    #testing delete_many
+    def test_delitem_keeps_capacity(self):
+        test_array = Array.from_list(['a', 'b', 'c', 'd'])
+        items = test_array._items
+        del test_array[1]
+        assert test_array._items is items
+        assert list(test_array) == ['a', 'c', 'd']
+
+    def test_delete_many(self):
+        test_array = Array.from_list(list(range(10)))
+        assert test_array.delete_many([9, 0, 4]) == 3
+        assert list(test_array) == [1, 2, 3, 5, 6, 7, 8]
+
+    def test_delete_many_duplicates_and_generator(self):
+        test_array = Array.from_list(list(range(5)), dtype='int64')
+        assert test_array.delete_many(i for i in [1, 1, 2]) == 2
+        assert list(test_array) == [0, 3, 4]
+
+    def test_delete_many_empty(self):
+        test_array = Array.from_list([1, 2])
+        assert test_array.delete_many([]) == 0
+        assert list(test_array) == [1, 2]
+
+    def test_delete_many_out_of_bounds(self):
+        test_array = Array.from_list([1, 2, 3])
+        with pytest.raises(IndexError):
+            test_array.delete_many([0, 3])
+        with pytest.raises(IndexError):
+            test_array.delete_many([-1])
+        assert list(test_array) == [1, 2, 3]
+
+    def test_delete_many_clears_tail_slots(self):
+        test_array = Array.from_list(['a', 'b', 'c', 'd'])
+        test_array.delete_many([0, 1])
+        assert list(test_array._items) == ['c', 'd', None, None]
+
+    #testing remove_where
+    def test_remove_where(self):
+        test_array = Array.from_list([1, None, 2, None])
+        assert test_array.remove_where([False, True, False, True]) == 2
+        assert list(test_array) == [1, 2]
+
+    def test_remove_where_nothing(self):
+        test_array = Array.from_list([1, 2], dtype='int64')
+        assert test_array.remove_where(np.zeros(2, dtype=bool)) == 0
+        assert list(test_array) == [1, 2]
+
+    def test_remove_where_everything(self):
+        test_array = Array.from_list([1, 2], dtype='int64')
+        assert test_array.remove_where([True, True]) == 2
+        assert len(test_array) == 0
+
+    def test_remove_where_wrong_length(self):
+        test_array = Array.from_list([1, 2, 3])
+        with pytest.raises(ValueError):
+            test_array.remove_where([True])
+
+    #testing slicing
+    def test_get_uses_logical_size(self):
+        test_array = Array.from_list([1, 2])
+        test_array.reserve(10)
+        with pytest.raises(IndexError):
+            test_array[2]
+
+    def test_slice_returns_view(self):
+        test_array = Array.from_list(['zero', 'one', 'two', 'three'])
+        view = test_array[1:3]
+        assert isinstance(view, ArrayView)
+        assert len(view) == 2
+        assert list(view) == ['one', 'two']
+
+    def test_slice_shares_buffer(self):
+        test_array = Array.from_list(list(range(10)), dtype='int64')
+        view = test_array[2:8:2]
+        assert np.shares_memory(view._values(), test_array._items)
+        view[1] = 100
+        assert test_array[4] == 100
+        test_array[6] = 60
+        assert view[2] == 60
+
+    def test_slice_negative_step_and_empty(self):
+        test_array = Array.from_list([0, 1, 2, 3])
+        assert list(test_array[::-1]) == [3, 2, 1, 0]
+        assert list(test_array[3:1:-1]) == [3, 2]
+        assert list(test_array[5:]) == []
+        assert list(Array()[::-1]) == []
+
+    def test_slice_of_view(self):
+        test_array = Array.from_list(list(range(10)))
+        view = test_array[2:][::3]
+        assert list(view) == [2, 5, 8]
+        assert list(reversed(view)) == [8, 5, 2]
+
+    def test_view_index_out_of_bounds(self):
+        view = Array.from_list([0, 1, 2])[1:]
+        with pytest.raises(IndexError):
+            view[2]
+        with pytest.raises(IndexError):
+            view[-1] = 5
+
+    def test_view_slice_assignment(self):
+        test_array = Array.from_list([0, 0, 0, 0], dtype='int64')
+        test_array[::2][:] = [1, 2]
+        assert list(test_array) == [1, 0, 2, 0]
+        with pytest.raises(ValueError):
+            test_array[:2][:] = [1, 2, 3]
+
+    def test_view_survives_reallocation(self):
+        test_array = Array.from_list([0, 1, 2])
+        view = test_array[:2]
+        test_array.reserve(100)
+        view[0] = 'new'
+        assert test_array[0] == 'new'
+
+    def test_view_copy_is_independent(self):
+        test_array = Array.from_list([0, 1, 2], dtype='int32')
+        copied = test_array[1:].copy()
+        copied[0] = 9
+        assert isinstance(copied, Array)
+        assert copied.dtype == np.int32
+        assert list(test_array) == [0, 1, 2]
+        assert list(copied) == [9, 2]
+
+    def test_view_eq_and_contains(self):
+        test_array = Array.from_list(['a', 'b', 'a', 'b'])
+        assert test_array[:2] == test_array[2:]
+        assert test_array[:2] == Array.from_list(['a', 'b'])
+        assert test_array[:2] != test_array[1:3]
+        assert 'b' in test_array[1:2]
+        assert 'a' not in test_array[1:2]
+
+    def test_view_contains_matches_array(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        assert [1, 2] not in test_array[0:2]
+        assert 2 in test_array[0:2]
+        assert 3 not in test_array[0:2]
+        nested = Array.from_list([[1], [2]])
+        assert [2] in nested[1:]
+        assert nested[1:] == Array.from_list([[2]])
+
+    def test_view_clamped_to_current_length(self):
+        test_array = Array.from_list([1, 2, 3, 4])
+        view = test_array[1:4]
+        del test_array[0]
+        del test_array[0]
+        assert len(view) == 1
+        assert list(view) == [4]
+        assert str(view) == '[4]'
+        assert view[0] == 4
+        with pytest.raises(IndexError):
+            view[1]
+        test_array.extend([5, 6])
+        assert list(view) == [4, 5, 6]
+
+    def test_reversed_view_clamped_to_current_length(self):
+        test_array = Array.from_list([1, 2, 3, 4, 5])
+        view = test_array[::-1]
+        test_array.resize(3)
+        assert list(view) == [3, 2, 1]
+        assert len(view) == 3
+
+    def test_setitem_slice(self):
+        test_array = Array.from_list([0, 1, 2, 3], dtype='int64')
+        test_array[1:3] = [10, 20]
+        assert list(test_array) == [0, 10, 20, 3]
+        test_array[::2] = np.array([7, 8])
+        assert list(test_array) == [7, 10, 8, 3]
+        with pytest.raises(ValueError):
+            test_array[1:3] = [1]
+
+    def test_setitem_slice_keeps_index_and_snapshot(self):
+        test_array = Array.from_list(['a', 'b', 'c'])
+        test_array.build_index()
+        frozen = test_array.snapshot()
+        test_array[:2] = ['x', 'y']
+        assert 'a' not in test_array
+        assert test_array.index('y') == 1
+        assert list(frozen) == ['a', 'b', 'c']
+
+    #testing vectorized search
+    def test_eq_compares_logical_items_only(self):
+        test_array = Array.from_list([1, 2, 3])
+        test_array.append(4)
+        del test_array[3]
+        assert test_array == Array.from_list([1, 2, 3])
+
+    def test_eq_typed_and_object(self):
+        assert Array.from_list([1, 2], dtype='int64') == Array.from_list([1, 2])
+        assert Array.from_list([1, 2], dtype='int64') != Array.from_list([1, 3])
+
+    def test_contains_tuple_item(self):
+        test_array = Array.from_list([(1, 2), (3, 4)])
+        assert (3, 4) in test_array
+        assert (1, 3) not in test_array
+
+    def test_contains_typed_with_sequence_item(self):
+        test_array = Array.from_list([1, 2], dtype='int64')
+        assert [1, 2] not in test_array
+
+    def test_contains_ignores_unused_capacity(self):
+        test_array = Array(dtype='int64')
+        test_array.reserve(10)
+        test_array.append(5)
+        assert 0 not in test_array
+
+    def test_index(self):
+        test_array = Array.from_list(['a', 'b', 'c', 'b'])
+        assert test_array.index('b') == 1
+
+    def test_index_missing(self):
+        with pytest.raises(ValueError):
+            Array.from_list(['a']).index('z')
+        with pytest.raises(ValueError):
+            Array().index('z')
+
+    def test_count(self):
+        test_array = Array.from_list([1.5, 2.0, 1.5], dtype='float64')
+        assert test_array.count(1.5) == 2
+        assert test_array.count(7) == 0
+
+    def test_find_all(self):
+        test_array = Array.from_list([None, 1, None])
+        assert list(test_array.find_all(None)) == [0, 2]
+        assert len(test_array.find_all(5)) == 0
+
+    #testing hash index
+    def _cars(self):
+        return [Car(vin=str(i), color=Color.RED, make=Make.TOYOTA, model=Model.CAMRY) for i in range(5)]
+
+    def _assert_index_matches_scan(self, test_array):
+        expected = HashIndex(list(test_array))
+        assert test_array._index._positions == expected._positions
+
+    def test_indexed_constructor(self):
+        test_array = Array(size=3, default_item_value=0, indexed=True)
+        assert test_array.indexed
+        assert 0 in test_array
+        assert test_array.count(0) == 3
+
+    def test_index_contains_cars(self):
+        test_array = Array.from_list(self._cars())
+        test_array.build_index()
+        assert Car(vin='3', color=Color.RED, make=Make.TOYOTA, model=Model.CAMRY) in test_array
+        assert Car(vin='9', color=Color.RED, make=Make.TOYOTA, model=Model.CAMRY) not in test_array
+
+    def test_index_maintained_by_setitem_and_append(self):
+        test_array = Array.from_list(['a', 'b'])
+        test_array.build_index()
+        test_array[0] = 'c'
+        test_array.append('a')
+        assert test_array.index('a') == 2
+        assert 'b' in test_array
+        self._assert_index_matches_scan(test_array)
+
+    def test_index_maintained_by_delete(self):
+        test_array = Array.from_list(['a', 'b', 'a', 'c'])
+        test_array.build_index()
+        del test_array[1]
+        assert list(test_array.find_all('a')) == [0, 1]
+        assert 'b' not in test_array
+        self._assert_index_matches_scan(test_array)
+
+    def test_index_with_nan_in_typed_array(self):
+        nan = float('nan')
+        test_array = Array.from_list([1.0, nan, 2.0, nan], dtype='float64')
+        test_array.build_index()
+        del test_array[0]
+        test_array.append(nan)
+        test_array.extend([3.0, nan])
+        test_array[1] = nan
+        test_array[2] = 4.0
+        del test_array[3]
+        assert np.array_equal(np.asarray(test_array), [nan, nan, 4.0, 3.0, nan], equal_nan=True)
+        assert nan not in test_array
+        assert test_array.count(nan) == 0
+        assert test_array.count(4.0) == 1
+        assert test_array.index(3.0) == 3
+        self._assert_index_matches_scan(test_array)
+
+    def test_index_maintained_by_resize_and_extend(self):
+        test_array = Array.from_list(['a', 'b', 'c'])
+        test_array.build_index()
+        test_array.resize(2)
+        assert 'c' not in test_array
+        test_array.resize(4, default_value='z')
+        test_array.extend(['c', 'z'])
+        assert test_array.count('z') == 3
+        self._assert_index_matches_scan(test_array)
+
+    def test_index_rebuilt_after_bulk_delete(self):
+        test_array = Array.from_list(['a', 'b', 'c', 'd'])
+        test_array.build_index()
+        test_array.delete_many([0, 2])
+        assert test_array.index('d') == 1
+        self._assert_index_matches_scan(test_array)
+
+    def test_index_rebuilt_after_view_write(self):
+        test_array = Array.from_list(['a', 'b', 'c'])
+        test_array.build_index()
+        test_array[1:][:] = ['x', 'y']
+        assert 'y' in test_array
+        assert 'c' not in test_array
+
+    def test_index_after_clear(self):
+        test_array = Array.from_list(['a'])
+        test_array.build_index()
+        test_array.clear()
+        test_array.append('b')
+        assert 'a' not in test_array
+        assert 'b' in test_array
+
+    def test_index_invalidate_after_in_place_mutation(self):
+        cars = self._cars()
+        test_array = Array.from_list(cars)
+        test_array.build_index()
+        cars[0].vin = '100'
+        test_array.invalidate_index()
+        assert Car(vin='100', color=Color.RED, make=Make.TOYOTA, model=Model.CAMRY) in test_array
+
+    def test_index_rejects_unhashable_items(self):
+        test_array = Array.from_list(['a'])
+        test_array.build_index()
+        with pytest.raises(TypeError):
+            test_array.append(['unhashable'])
+        with pytest.raises(TypeError):
+            test_array.extend(['b', ['unhashable']])
+        assert list(test_array) == ['a']
+        assert 'b' not in test_array
+
+    def test_index_memory_usage(self):
+        test_array = Array.from_list(list(range(100)))
+        assert test_array.index_memory_usage() == 0
+        test_array.build_index()
+        assert test_array.index_memory_usage() > 0
+        test_array.drop_index()
+        assert not test_array.indexed
+
+    #testing save and load
+    def test_save_load_round_trip(self, tmp_path):
+        path = tmp_path / 'array.bin'
+        test_array = Array.from_list([1.5, -2.0, 3.25], dtype='float64')
+        test_array.reserve(100)
+        test_array.save(path)
+        assert os.path.getsize(path) == HEADER_SIZE + 3 * 8
+        for mmap in (True, False):
+            loaded = Array.load(path, mmap=mmap)
+            assert loaded == test_array
+            assert loaded.dtype == np.float64
+
+    def test_load_mmap_is_copy_on_write(self, tmp_path):
+        path = tmp_path / 'array.bin'
+        Array.from_list([1, 2, 3], dtype='int32').save(path)
+        loaded = Array.load(path)
+        loaded[0] = 100
+        loaded.append(4)
+        assert list(loaded) == [100, 2, 3, 4]
+        assert list(Array.load(path)) == [1, 2, 3]
+
+    def test_load_keeps_default_value(self, tmp_path):
+        path = tmp_path / 'array.bin'
+        Array(size=0, default_item_value=7, dtype='uint8').save(path)
+        loaded = Array.load(path)
+        loaded.resize(2)
+        assert list(loaded) == [7, 7]
+
+    def test_save_object_array_not_supported(self, tmp_path):
+        with pytest.raises(TypeError):
+            Array.from_list(['a']).save(tmp_path / 'array.bin')
+        assert not os.path.exists(tmp_path / 'array.bin')
+
+    #testing pickle
+    def test_pickle_round_trip_all_protocols(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(test_array, protocol=protocol))
+            assert restored == test_array
+            restored[0] = 10
+
+    def test_pickle_skips_unused_capacity(self):
+        small = Array.from_list(list(range(10)), dtype='int64')
+        large = Array.from_list(list(range(10)), dtype='int64')
+        large.reserve(100000)
+        assert len(pickle.dumps(large)) == len(pickle.dumps(small))
+
+    def test_pickle_protocol_5_out_of_band(self):
+        test_array = Array.from_list(list(range(1000)), dtype='float64')
+        buffers = []
+        data = pickle.dumps(test_array, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        assert len(data) < 1000
+        restored = pickle.loads(data, buffers=buffers)
+        assert restored == test_array
+        assert np.shares_memory(restored._items, test_array._items)
+
+    def test_pickle_object_array_keeps_settings(self):
+        test_array = Array.from_list(['a', 'b'])
+        test_array.growth_policy = ChunkGrowth(chunk_size=16)
+        test_array.build_index()
+        restored = pickle.loads(pickle.dumps(test_array))
+        assert restored == test_array
+        assert restored.indexed
+        assert isinstance(restored.growth_policy, ChunkGrowth)
+
+    def test_shallow_copy_has_own_buffer(self):
+        test_array = Array.from_list([1, 2])
+        copied = copy.copy(test_array)
+        copied.append(3)
+        copied[0] = 10
+        assert list(test_array) == [1, 2]
+
+    #testing numpy interop
+    def test_asarray_is_a_view_of_logical_items(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int32')
+        test_array.reserve(10)
+        values = np.asarray(test_array)
+        assert values.shape == (3,)
+        assert np.shares_memory(values, test_array._items)
+
+    def test_asarray_object_array(self):
+        test_array = Array.from_list(['a', 'b'])
+        values = np.asarray(test_array)
+        assert values.dtype == object
+        assert list(values) == ['a', 'b']
+
+    def test_array_dtype_and_copy(self):
+        test_array = Array.from_list([1, 2], dtype='int64')
+        assert np.array(test_array, dtype='float32').dtype == np.float32
+        copied = np.array(test_array, copy=True)
+        copied[0] = 5
+        assert test_array[0] == 1
+
+    def test_array_interface_survives_reallocation(self):
+        test_array = Array.from_list([1, 2], dtype='int64')
+        values = np.asarray(test_array)
+        test_array.reserve(1000)
+        test_array[0] = 7
+        assert list(values) == [1, 2]
+
+    def test_array_interface_not_for_objects(self):
+        assert not hasattr(Array.from_list(['a']), '__array_interface__')
+
+    def test_buffer(self):
+        test_array = Array.from_list([1, 2], dtype='int16')
+        view = test_array.__buffer__(0)
+        assert view.format == 'h'
+        assert view.tolist() == [1, 2]
+        with pytest.raises(TypeError):
+            Array.from_list(['a']).__buffer__(0)
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason='memoryview() uses __buffer__ from Python 3.12')
+    def test_memoryview(self):
+        assert memoryview(Array.from_list([1, 2], dtype='int16')).tolist() == [1, 2]
+
+    def test_ufunc_returns_array(self):
+        test_array = Array.from_list([1.0, 4.0], dtype='float64')
+        result = np.multiply(test_array, 2)
+        assert isinstance(result, Array)
+        assert list(result) == [2.0, 8.0]
+
+    def test_ufunc_with_two_arrays(self):
+        first = Array.from_list([1, 2], dtype='int64')
+        second = Array.from_list([10, 20], dtype='int64')
+        assert list(np.add(first, second)) == [11, 22]
+
+    def test_ufunc_out_array(self):
+        test_array = Array.from_list([1.0, 4.0], dtype='float64')
+        result = np.sqrt(test_array, out=test_array)
+        assert result is test_array
+        assert list(test_array) == [1.0, 2.0]
+
+    def test_ufunc_reduce_and_view_input(self):
+        test_array = Array.from_list([1, 2, 3, 4], dtype='int64')
+        assert np.add.reduce(test_array) == 10
+        assert list(np.negative(test_array[::2])) == [-1, -3]
+
+    #testing sort and bisect
+    def test_sort_typed(self):
+        test_array = Array.from_list([3, 1, 2], dtype='int64')
+        test_array.sort()
+        assert list(test_array) == [1, 2, 3]
+        test_array.sort(reverse=True)
+        assert list(test_array) == [3, 2, 1]
+
+    def test_sort_ignores_unused_capacity(self):
+        test_array = Array(dtype='int64')
+        test_array.reserve(8)
+        test_array.extend([5, -1])
+        test_array.sort()
+        assert list(test_array) == [-1, 5]
+        assert list(test_array._items[2:]) == [0] * 6
+
+    def test_sort_strings_with_trailing_nul(self):
+        for items in (['a\x00', 'a', 'b', 'a\x00\x00'], [b'a\x00', b'a', b'\x00']):
+            test_array = Array.from_list(items)
+            test_array.sort()
+            assert list(test_array) == sorted(items)
+            test_array = Array.from_list(items)
+            assert [items[i] for i in test_array.argsort(reverse=True)] == sorted(items, reverse=True)
+
+    def test_sort_cars_by_vin(self):
+        cars = [Car(vin=vin, color=Color.RED, make=Make.TOYOTA, model=Model.CAMRY) for vin in ['c', 'a', 'b']]
+        test_array = Array.from_list(cars)
+        test_array.sort(key=lambda car: car.vin)
+        assert [car.vin for car in test_array] == ['a', 'b', 'c']
+
+    def test_sort_reverse_is_stable(self):
+        pairs = [(1, 'a'), (2, 'b'), (1, 'c'), (2, 'd')]
+        test_array = Array.from_list(pairs)
+        test_array.sort(key=lambda pair: pair[0], reverse=True)
+        assert list(test_array) == sorted(pairs, key=lambda pair: pair[0], reverse=True)
+
+    def test_sort_ufunc_key(self):
+        test_array = Array.from_list([-3.0, 1.0, -2.0], dtype='float64')
+        test_array.sort(key=np.abs)
+        assert list(test_array) == [1.0, -2.0, -3.0]
+
+    def test_sort_incomparable(self):
+        with pytest.raises(TypeError):
+            Array.from_list([1, 'a']).sort()
+
+    def test_sort_updates_index(self):
+        test_array = Array.from_list(['b', 'a'])
+        test_array.build_index()
+        test_array.sort()
+        assert test_array.index('a') == 0
+
+    def test_argsort(self):
+        test_array = Array.from_list(['b', 'c', 'a'])
+        assert list(test_array.argsort()) == [2, 0, 1]
+        assert list(test_array.argsort(reverse=True)) == [1, 0, 2]
+        assert list(test_array) == ['b', 'c', 'a']
+
+    def test_bisect(self):
+        test_array = Array.from_list([1, 2, 2, 4], dtype='int64')
+        assert test_array.bisect_left(2) == 1
+        assert test_array.bisect_right(2) == 3
+        assert test_array.bisect_left(3) == 3
+        assert test_array.bisect_right(9) == 4
+        assert test_array.bisect_left(2, lo=2) == 2
+
+    def test_bisect_object_tuples(self):
+        test_array = Array.from_list([(1, 1), (2, 2)])
+        assert test_array.bisect_left((2, 0)) == 1
+
+    def test_bisect_invalid_bounds(self):
+        with pytest.raises(ValueError):
+            Array.from_list([1, 2]).bisect_left(1, hi=3)
+
+    #testing parallel map and reduce
+    def test_parallel_map_typed(self):
+        test_array = Array.from_list(list(range(10)), dtype='int64')
+        result = test_array.parallel_map(np.negative, workers=3)
+        assert isinstance(result, Array)
+        assert list(result) == [-value for value in range(10)]
+
+    def test_parallel_map_dtype(self):
+        test_array = Array.from_list([1, 4, 9], dtype='int64')
+        result = test_array.parallel_map(np.sqrt, workers=2, dtype='float64')
+        assert result.dtype == np.float64
+        assert list(result) == [1.0, 2.0, 3.0]
+
+    def test_parallel_map_object(self):
+        test_array = Array.from_list([1, -2, 3])
+        result = test_array.parallel_map(np.negative, workers=2)
+        assert result.dtype == object
+        assert list(result) == [-1, 2, -3]
+
+    def test_parallel_map_empty(self):
+        assert len(Array(dtype='float64').parallel_map(np.sqrt, workers=2)) == 0
+
+    def test_parallel_reduce_ufunc(self):
+        test_array = Array.from_list(list(range(1, 101)), dtype='int64')
+        assert test_array.parallel_reduce(np.add, 0, workers=4) == 5050
+        assert test_array.parallel_reduce(np.maximum, 0, workers=4) == 100
+
+    def test_parallel_reduce_object(self):
+        test_array = Array.from_list(['a', 'b', 'c', 'd'])
+        assert test_array.parallel_reduce(operator.add, '', workers=3) == 'abcd'
+
+    def test_parallel_reduce_empty(self):
+        assert Array().parallel_reduce(operator.add, 7) == 7
+
+    #testing snapshot and deepcopy
+    def test_snapshot_shares_buffer_until_write(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        frozen = test_array.snapshot()
+        assert frozen._items is test_array._items
+        test_array[0] = 100
+        assert frozen._items is not test_array._items
+        assert list(frozen) == [1, 2, 3]
+        assert list(test_array) == [100, 2, 3]
+
+    def test_snapshot_write_to_snapshot(self):
+        test_array = Array.from_list(['a', 'b'])
+        frozen = test_array.snapshot()
+        frozen.append('c')
+        del frozen[0]
+        assert list(test_array) == ['a', 'b']
+        assert list(frozen) == ['b', 'c']
+
+    def test_snapshot_every_mutator_copies(self):
+        for mutate in (lambda a: a.__setitem__(0, 9), lambda a: a.extend([9]), lambda a: a.resize(1),
+                       lambda a: a.__delitem__(0), lambda a: a.delete_many([1]), lambda a: a.sort(reverse=True),
+                       lambda a: a.remove_where([True, False, False]), lambda a: a.clear()):
+            test_array = Array.from_list([1, 2, 3], dtype='int64')
+            test_array.reserve(10)
+            frozen = test_array.snapshot()
+            mutate(test_array)
+            assert list(frozen) == [1, 2, 3]
+
+    def test_snapshot_view_write_copies(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        frozen = test_array.snapshot()
+        test_array[1:][:] = [20, 30]
+        assert list(frozen) == [1, 2, 3]
+        assert list(test_array) == [1, 20, 30]
+
+    def test_snapshot_numpy_view_is_read_only_while_shared(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        frozen = test_array.snapshot()
+        with pytest.raises(ValueError):
+            np.asarray(test_array)[0] = 5
+        np.negative(test_array, out=test_array)
+        assert list(frozen) == [1, 2, 3]
+        assert list(test_array) == [-1, -2, -3]
+        np.asarray(test_array)[0] = 5
+        assert test_array[0] == 5
+
+    def test_snapshot_released_when_collected(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        frozen = test_array.snapshot()
+        buffer = test_array._items
+        del frozen
+        test_array[0] = 7
+        assert test_array._items is buffer
+
+    def test_snapshot_index(self):
+        test_array = Array.from_list(['a', 'b'])
+        test_array.build_index()
+        frozen = test_array.snapshot()
+        test_array[0] = 'z'
+        assert 'a' in frozen
+        assert 'a' not in test_array
+        assert frozen.index('b') == 1
+
+    def test_deepcopy_immutable_items(self):
+        test_array = Array.from_list(['a', 1, None, Color.RED])
+        copied = copy.deepcopy(test_array)
+        assert copied == test_array
+        assert copied._items is not test_array._items
+
+    def test_deepcopy_mutable_items(self):
+        cars = self._cars()
+        test_array = Array.from_list(cars)
+        copied = copy.deepcopy(test_array)
+        copied[0].color = Color.BLUE
+        assert test_array[0].color == Color.RED
+        assert copied[0] is not cars[0]
+
+    def test_deepcopy_typed(self):
+        test_array = Array.from_list([1.5, 2.5], dtype='float64')
+        copied = copy.deepcopy(test_array)
+        copied[0] = 0.0
+        assert test_array[0] == 1.5
+        assert copied.dtype == np.float64
+
+    #testing chunked iteration
+    def test_iter_fast(self):
+        test_array = Array.from_list(['zero', 'one', 'two'])
+        assert list(test_array.iter_fast()) == ['zero', 'one', 'two']
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        test_array.reserve(10)
+        assert list(test_array.iter_fast()) == [1, 2, 3]
+        assert list(Array().iter_fast()) == []
+
+    def test_iter_chunks_are_views(self):
+        test_array = Array.from_list(list(range(10)), dtype='int64')
+        chunks = list(test_array.iter_chunks(4))
+        assert [chunk.tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert all(np.shares_memory(chunk, test_array._items) for chunk in chunks)
+        chunks[0][0] = 100
+        assert test_array[0] == 100
+
+    def test_iter_chunks_reversed(self):
+        test_array = Array.from_list(list(range(5)))
+        chunks = list(test_array.iter_chunks_reversed(2))
+        assert [chunk.tolist() for chunk in chunks] == [[4, 3], [2, 1], [0]]
+        assert np.concatenate(chunks).tolist() == list(reversed(test_array))
+
+    def test_iter_chunks_invalid_size(self):
+        test_array = Array.from_list([1, 2])
+        with pytest.raises(ValueError):
+            list(test_array.iter_chunks(0))
+        with pytest.raises(ValueError):
+            list(test_array.iter_chunks_reversed(-1))
+
+    def test_iter_chunks_read_only_while_shared(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        frozen = test_array.snapshot()
+        chunk = next(test_array.iter_chunks(2))
+        with pytest.raises(ValueError):
+            chunk[0] = 5
+        assert list(frozen) == [1, 2, 3]
+
+    #testing buffer pool
+    def test_pool_recycles_growth_buffers(self):
+        pool = BufferPool()
+        for _ in range(10):
+            test_array = Array(dtype='int64', pool=pool)
+            for item in range(100):
+                test_array.append(item)
+            assert list(test_array) == list(range(100))
+            del test_array
+        stats = pool.stats()
+        assert stats['misses'] == 8
+        assert stats['hits'] == 72
+
+    def test_pool_buffer_is_filled_with_default(self):
+        pool = BufferPool()
+        first = Array(size=8, default_item_value=7, dtype='int64', pool=pool)
+        del first
+        second = Array(size=8, dtype='int64', pool=pool)
+        assert pool.stats()['hits'] == 1
+        assert list(second) == [0] * 8
+
+    def test_pool_clear_releases_buffer(self):
+        pool = BufferPool()
+        test_array = Array(size=10, pool=pool)
+        test_array.clear()
+        assert pool.stats()['idle_buffers'] == 1
+        test_array.append('a')
+        assert list(test_array) == ['a']
+
+    def test_pool_keeps_exported_views_valid(self):
+        pool = BufferPool()
+        test_array = Array(size=3, default_item_value=5, dtype='int64', pool=pool)
+        view = np.asarray(test_array)
+        test_array.clear()
+        Array(size=3, default_item_value=9, dtype='int64', pool=pool)
+        assert view.tolist() == [5, 5, 5]
+
+    def test_pool_snapshot_shared_buffer_not_released(self):
+        pool = BufferPool()
+        test_array = Array(size=4, default_item_value=1, dtype='int64', pool=pool)
+        frozen = test_array.snapshot()
+        del test_array
+        assert pool.stats()['idle_buffers'] == 0
+        other = Array(size=4, default_item_value=2, dtype='int64', pool=pool)
+        assert list(frozen) == [1, 1, 1, 1]
+        assert list(other) == [2, 2, 2, 2]
+        del frozen
+        assert pool.stats()['idle_buffers'] == 1
+
+    def test_default_pool_used_by_new_arrays(self):
+        pool = BufferPool()
+        buffer_pool.set_default_pool(pool)
+        try:
+            test_array = Array.from_list([1, 2, 3], dtype='int64')
+            assert test_array._pool is pool
+        finally:
+            buffer_pool.set_default_pool(None)
+        assert Array()._pool is None
+
+    def test_plain_array_has_no_release_hook(self):
+        assert not hasattr(Array, '__del__')
+        assert Array(size=3)._buffer_hook is None
+        assert Array(size=3, pool=BufferPool())._buffer_hook is not None
+
+    def test_pool_releases_current_buffer_when_collected(self):
+        pool = BufferPool()
+        test_array = Array(dtype='int64', pool=pool)
+        for item in range(5):
+            test_array.append(item)
+        assert pool.stats()['idle_buffers'] == 3
+        del test_array
+        assert pool.stats()['idle_buffers'] == 4
+
+    def test_release_hooks_do_not_keep_arrays_alive(self):
+        hooks = len(array_module._buffer_hooks)
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        frozen = test_array.snapshot()
+        collected = weakref.ref(frozen)
+        del frozen
+        assert collected() is None
+        del test_array
+        assert len(array_module._buffer_hooks) == hooks
+
+    #testing lazy pipeline
+    def test_lazy_records_without_running(self):
+        calls = []
+        test_array = Array.from_list([1, 2, 3])
+        pipeline = test_array.lazy().map(lambda item: calls.append(item) or item)
+        assert calls == []
+        assert list(pipeline) == [1, 2, 3]
+        assert calls == [1, 2, 3]
+
+    def test_lazy_steps_return_new_pipelines(self):
+        test_array = Array.from_list(list(range(6)), dtype='int64')
+        base = test_array.lazy().filter(lambda n: n % 2 == 0)
+        assert list(base.map(lambda n: n * 10).collect()) == [0, 20, 40]
+        assert list(base.collect()) == [0, 2, 4]
+
+    def test_lazy_vectorized_ufuncs(self):
+        test_array = Array.from_list(list(range(10_000)), dtype='int64')
+        pipeline = test_array.lazy().map(np.square).filter(lambda block: block % 2 == 0, vectorized=True)
+        assert pipeline.vectorized
+        result = pipeline.collect()
+        assert result.dtype == np.int64
+        assert list(result) == [n * n for n in range(10_000) if n % 2 == 0]
+
+    def test_lazy_per_item_collect_infers_dtype(self):
+        test_array = Array.from_list(['a', 'bb', 'ccc'])
+        assert test_array.lazy().map(len).collect().dtype == np.int64
+        assert test_array.lazy().map(str.upper).collect().dtype == object
+        assert test_array.lazy().map(len).collect(dtype='float64').dtype == np.float64
+
+    def test_lazy_take_short_circuits(self):
+        seen = []
+        test_array = Array.from_list(list(range(100)))
+        result = test_array.lazy().map(lambda n: seen.append(n) or n).filter(lambda n: n > 4).take(2).collect()
+        assert list(result) == [5, 6]
+        assert seen == list(range(7))
+
+    def test_lazy_take_short_circuits_vectorized(self):
+        blocks = []
+        test_array = Array.from_list(list(range(100_000)), dtype='int64')
+
+        def record(block):
+            blocks.append(len(block))
+            return block
+
+        assert test_array.lazy().map(record, vectorized=True).take(10).count() == 10
+        assert len(blocks) == 1
+        assert list(test_array.lazy().take(0)) == []
+
+    def test_lazy_any_all_short_circuit(self):
+        blocks = []
+        test_array = Array.from_list([1] + [0] * 100_000, dtype='int64')
+
+        def record(block):
+            blocks.append(len(block))
+            return block
+
+        assert test_array.lazy().map(record, vectorized=True).any()
+        assert len(blocks) == 1
+        assert not test_array.lazy().all()
+        assert Array.from_list([1, 2]).lazy().map(lambda n: n > 0).all()
+        assert not Array(size=3).lazy().any()
+
+    def test_lazy_sum_and_count(self):
+        test_array = Array.from_list(list(range(1, 101)), dtype='int64')
+        assert test_array.lazy().sum() == 5050
+        assert test_array.lazy().filter(lambda n: n > 50).sum() == sum(range(51, 101))
+        assert test_array.lazy().filter(lambda block: block > 90, vectorized=True).count() == 10
+        assert Array().lazy().sum(start=7) == 7
+
+    def test_lazy_empty_and_invalid(self):
+        assert len(Array(dtype='float64').lazy().map(np.sqrt).collect()) == 0
+        with pytest.raises(ValueError):
+            Array().lazy().take(-1)
+        with pytest.raises(ValueError):
+            Array.from_list([1, 2], dtype='int64').lazy().map(lambda block: 1, vectorized=True).collect()
+
+    def test_lazy_str(self):
+        pipeline = Array.from_list([1, 2]).lazy().map(np.negative).take(1)
+        assert str(pipeline) == 'Array(2 items).lazy().map(negative).take(1)'
+
+    #testing gather and scatter
+    def test_gather_index_array(self):
+        test_array = Array.from_list([10, 20, 30, 40], dtype='int64')
+        gathered = test_array[np.array([3, 0, 3])]
+        assert isinstance(gathered, Array)
+        assert list(gathered) == [40, 10, 40]
+        gathered[0] = 0
+        assert test_array[3] == 40
+
+    def test_gather_list_and_array_indices(self):
+        test_array = Array.from_list(['a', 'b', 'c'])
+        assert list(test_array[[2, 1]]) == ['c', 'b']
+        assert list(test_array[Array.from_list([0, 0], dtype='int64')]) == ['a', 'a']
+        assert len(test_array[[]]) == 0
+
+    def test_gather_mask(self):
+        test_array = Array.from_list([1, 5, 2, 7], dtype='int64')
+        assert list(test_array[np.asarray(test_array) > 2]) == [5, 7]
+        assert list(test_array[[True, False, False, True]]) == [1, 7]
+        with pytest.raises(IndexError):
+            test_array[[True, False]]
+
+    def test_gather_bounds_checked_once(self):
+        test_array = Array.from_list([1, 2, 3])
+        test_array.reserve(10)
+        with pytest.raises(IndexError):
+            test_array[[0, 3]]
+        with pytest.raises(IndexError):
+            test_array[np.array([-1, 0])]
+        with pytest.raises(TypeError):
+            test_array[[0.5, 1.0]]
+        with pytest.raises(ValueError):
+            test_array[np.zeros((2, 2), dtype=int)]
+
+    def test_scatter_values(self):
+        test_array = Array.from_list([1, 2, 3, 4], dtype='int64')
+        test_array[[0, 2]] = [10, 30]
+        assert list(test_array) == [10, 2, 30, 4]
+        test_array[np.array([1, 3])] = np.array([20, 40])
+        assert list(test_array) == [10, 20, 30, 40]
+
+    def test_scatter_broadcast_and_mask(self):
+        test_array = Array.from_list([1, -2, 3, -4], dtype='int64')
+        test_array[np.asarray(test_array) < 0] = 0
+        assert list(test_array) == [1, 0, 3, 0]
+
+    def test_scatter_object_items(self):
+        test_array = Array(size=3)
+        test_array[[0, 2]] = [[1], [2]]
+        assert test_array[0] == [1]
+        assert test_array[2] == [2]
+        test_array[[1]] = 'text'
+        assert test_array[1] == 'text'
+
+    def test_scatter_invalid(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        with pytest.raises(ValueError):
+            test_array[[0, 1]] = [1, 2, 3]
+        with pytest.raises(IndexError):
+            test_array[[0, 5]] = 1
+        assert list(test_array) == [1, 2, 3]
+
+    def test_scatter_copy_on_write(self):
+        test_array = Array.from_list([1, 2, 3], dtype='int64')
+        frozen = test_array.snapshot()
+        test_array[[0, 1]] = [9, 9]
+        assert list(frozen) == [1, 2, 3]
+        assert list(test_array) == [9, 9, 3]
+
+    def test_scatter_keeps_index_coherent(self):
+        test_array = Array.from_list(['a', 'b', 'c'])
+        test_array.build_index()
+        test_array[[0, 2]] = ['x', 'y']
+        assert 'a' not in test_array
+        assert test_array.index('y') == 2
+        with pytest.raises(TypeError):
+            test_array[[1]] = [[1, 2]]
+
+    def test_scatter_ndarray_values_on_indexed_array(self):
+        test_array = Array.from_list(['a', 'b', 'c'])
+        test_array.build_index()
+        test_array[[0, 1]] = np.array(['x', 'y'], dtype=object)
+        assert list(test_array) == ['x', 'y', 'c']
+        test_array[np.array([False, True, True])] = np.array(['m', 'n'], dtype=object)
+        assert list(test_array) == ['x', 'm', 'n']
+        assert 'b' not in test_array
+        assert test_array.index('n') == 2
+
+    #testing zeroed allocation
+    def test_large_zero_default_allocation(self):
+        test_array = Array(size=50_000_000, dtype='float64')
+        assert test_array[49_999_999] == 0.0
+        test_array[7] = 1.5
+        assert test_array.count(0.0) == 49_999_999
+
+    def test_non_zero_bytes_default_is_filled(self):
+        assert np.signbit(np.asarray(Array(size=3, default_item_value=-0.0, dtype='float64'))).all()
+        assert list(Array(size=3, default_item_value=True, dtype='bool')) == [True] * 3
+        test_array = Array(size=2, dtype='int64')
+        test_array.resize(5)
+        assert list(test_array) == [0] * 5
@@ -0,0 +1,165 @@
+from datastructures.array import Array
+from datastructures.bool_array import BoolArray
+import numpy
+import pytest
+
+
+class TestBoolArray:
+    #testing constructor
+    def test_constructor_packs_words(self):
+        flags = BoolArray(size=1000)
+        assert len(flags) == 1000
+        assert flags.nbytes == 128
+        assert flags.count() == 0
+
+    def test_constructor_default_true_keeps_tail_zero(self):
+        flags = BoolArray(size=70, default_item_value=True)
+        assert flags.count() == 70
+        assert int(flags._words[1]) == (1 << 6) - 1
+
+    def test_constructor_negative_size(self):
+        with pytest.raises(ValueError):
+            BoolArray(size=-1)
+
+    def test_from_list(self):
+        flags = BoolArray.from_list([True, 0, 1, False])
+        assert list(flags) == [True, False, True, False]
+        with pytest.raises(TypeError):
+            BoolArray.from_list((True,))
+
+    def test_from_numpy(self):
+        flags = BoolArray.from_numpy(numpy.array([0, 2, 0, 5]))
+        assert list(flags) == [False, True, False, True]
+
+    #testing getitem and setitem
+    def test_setitem_across_words(self):
+        flags = BoolArray(size=200)
+        for index in (0, 63, 64, 127, 199):
+            flags[index] = True
+        assert flags.set_bits().tolist() == [0, 63, 64, 127, 199]
+        flags[63] = False
+        assert flags[63] is False
+        assert flags[64] is True
+
+    def test_index_out_of_bounds(self):
+        flags = BoolArray(size=3)
+        with pytest.raises(IndexError):
+            flags[3]
+        with pytest.raises(IndexError):
+            flags[-1] = True
+
+    #testing append, extend, resize and delitem
+    def test_append_and_extend(self):
+        flags = BoolArray()
+        expected = []
+        for index in range(130):
+            flags.append(index % 3 == 0)
+            expected.append(index % 3 == 0)
+        flags.extend([True] * 70)
+        expected += [True] * 70
+        assert list(flags) == expected
+
+    def test_extend_from_bool_array(self):
+        flags = BoolArray.from_list([True])
+        flags.extend(BoolArray.from_list([False, True]))
+        assert list(flags) == [True, False, True]
+
+    def test_resize_shrink_clears_bits(self):
+        flags = BoolArray(size=100, default_item_value=True)
+        flags.resize(10)
+        assert flags.count() == 10
+        flags.resize(100, default_value=False)
+        assert flags.count() == 10
+        with pytest.raises(ValueError):
+            flags.resize(-1)
+
+    def test_delitem_shifts_across_words(self):
+        values = [index % 5 == 0 for index in range(150)]
+        flags = BoolArray.from_list(values)
+        del flags[2]
+        del values[2]
+        assert list(flags) == values
+        assert flags.count() == sum(values)
+
+    #testing count, any and all
+    def test_count(self):
+        flags = BoolArray.from_list([True, False, True])
+        assert flags.count() == 2
+        assert flags.count(False) == 1
+        assert flags.count('x') == 0
+
+    def test_any_all(self):
+        assert not BoolArray(size=100).any()
+        assert BoolArray().all()
+        flags = BoolArray(size=65, default_item_value=True)
+        assert flags.all()
+        flags[64] = False
+        assert not flags.all()
+        assert flags.any()
+
+    #testing bitwise operators
+    def test_bitwise_operators(self):
+        left = BoolArray.from_list([True, True, False, False])
+        right = BoolArray.from_list([True, False, True, False])
+        assert list(left & right) == [True, False, False, False]
+        assert list(left | right) == [True, True, True, False]
+        assert list(left ^ right) == [False, True, True, False]
+
+    def test_invert_masks_tail(self):
+        flags = ~BoolArray(size=70)
+        assert flags.count() == 70
+        assert flags.all()
+        assert (~flags).count() == 0
+
+    def test_bitwise_length_mismatch(self):
+        with pytest.raises(ValueError):
+            BoolArray(size=2) & BoolArray(size=3)
+        with pytest.raises(TypeError):
+            BoolArray(size=2) | [True, False]
+
+    #testing set bits, index and contains
+    def test_set_bits_skips_empty_words(self):
+        flags = BoolArray(size=100_000)
+        flags[5] = flags[99_999] = True
+        assert flags.set_bits().tolist() == [5, 99_999]
+        assert BoolArray(size=10).set_bits().tolist() == []
+
+    def test_index_and_find_all(self):
+        flags = BoolArray.from_list([False, True, False])
+        assert flags.index(True) == 1
+        assert flags.find_all(False).tolist() == [0, 2]
+        with pytest.raises(ValueError):
+            BoolArray(size=3).index(True)
+
+    def test_contains(self):
+        flags = BoolArray.from_list([False, False])
+        assert False in flags
+        assert True not in flags
+        assert 'x' not in flags
+        assert True not in BoolArray()
+
+    #testing equality, iteration and conversion
+    def test_equality(self):
+        flags = BoolArray.from_list([True, False])
+        assert flags == BoolArray.from_list([True, False])
+        assert flags != BoolArray.from_list([True, True])
+        assert flags == Array.from_list([True, False], dtype=bool)
+        with pytest.raises(TypeError):
+            flags == [True, False]
+
+    def test_reversed(self):
+        values = [index % 7 == 0 for index in range(100)]
+        assert list(reversed(BoolArray.from_list(values))) == values[::-1]
+
+    def test_array_conversion(self):
+        flags = BoolArray.from_list([True, False])
+        assert numpy.asarray(flags).tolist() == [True, False]
+        assert numpy.asarray(flags, dtype='int8').dtype == numpy.int8
+        with pytest.raises(ValueError):
+            numpy.array(flags, copy=False)
+
+    def test_clear(self):
+        flags = BoolArray(size=10, default_item_value=True)
+        flags.clear()
+        assert len(flags) == 0
+        assert flags.count() == 0
@@ -0,0 +1,102 @@
+from datastructures.buffer_pool import BufferPool, size_class, default_pool, set_default_pool
+import numpy
+import pytest
+
+
+class TestBufferPool:
+    #testing size classes
+    def test_size_class(self):
+        assert [size_class(n) for n in (1, 2, 3, 4, 5, 1000)] == [1, 2, 4, 4, 8, 1024]
+
+    #testing acquire and release
+    def test_acquire_returns_exact_view(self):
+        pool = BufferPool()
+        buffer = pool.acquire(5, 'int64')
+        assert len(buffer) == 5
+        assert buffer.dtype == numpy.int64
+        assert len(buffer.base) == 8
+
+    def test_acquire_zero(self):
+        pool = BufferPool()
+        assert len(pool.acquire(0, 'float64')) == 0
+        assert pool.stats()['misses'] == 0
+
+    def test_release_and_reuse(self):
+        pool = BufferPool()
+        buffer = pool.acquire(100, 'float32')
+        base_id = id(buffer.base)
+        assert pool.release(buffer)
+        del buffer
+        reused = pool.acquire(120, 'float32')
+        assert id(reused.base) == base_id
+        stats = pool.stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_classes_are_per_dtype(self):
+        pool = BufferPool()
+        pool.release(pool.acquire(8, 'int64'))
+        pool.acquire(8, 'float64')
+        assert pool.stats()['hits'] == 0
+
+    def test_release_foreign_buffer_is_ignored(self):
+        pool = BufferPool()
+        assert not pool.release(numpy.zeros(8))
+        assert pool.stats()['idle_buffers'] == 0
+
+    def test_release_referenced_buffer_is_rejected(self):
+        pool = BufferPool()
+        buffer = pool.acquire(8, 'int64')
+        view = buffer[2:4]
+        assert not pool.release(buffer)
+        assert pool.stats()['rejected'] == 1
+        del view
+        assert pool.release(buffer)
+
+    def test_release_object_buffer_drops_items(self):
+        pool = BufferPool()
+        buffer = pool.acquire(4, object)
+        buffer[0] = item = ['kept alive?']
+        pool.release(buffer)
+        assert buffer.base[0] is None
+        assert item == ['kept alive?']
+
+    #testing memory cap and eviction
+    def test_lru_eviction(self):
+        pool = BufferPool(max_bytes=2 * 64)
+        first, second, third = (pool.acquire(8, 'int64') for _ in range(3))
+        first_id, third_id = id(first.base), id(third.base)
+        for buffer in (first, second, third):
+            pool.release(buffer)
+        del first, second, third
+        stats = pool.stats()
+        assert stats['evictions'] == 1
+        assert stats['pooled_bytes'] == 128
+        assert id(pool.acquire(8, 'int64').base) == third_id
+        assert id(pool.acquire(8, 'int64').base) != first_id
+
+    def test_buffer_over_cap_is_not_pooled(self):
+        pool = BufferPool(max_bytes=16)
+        assert not pool.release(pool.acquire(8, 'int64'))
+        assert pool.pooled_bytes == 0
+
+    def test_clear(self):
+        pool = BufferPool()
+        pool.release(pool.acquire(8, 'int64'))
+        pool.clear()
+        assert pool.stats()['idle_buffers'] == 0
+        assert pool.pooled_bytes == 0
+
+    def test_invalid_cap(self):
+        with pytest.raises(ValueError):
+            BufferPool(max_bytes=-1)
+
+    #testing default pool
+    def test_default_pool(self):
+        assert default_pool() is None
+        pool = BufferPool()
+        set_default_pool(pool)
+        try:
+            assert default_pool() is pool
+        finally:
+            set_default_pool(None)
@@ -0,0 +1,264 @@
+from datastructures.array import Array
+from datastructures.chunked_array import ChunkedArray
+import numpy
+import pytest
+
+
+class TestChunkedArray:
+    #testing constructor
+    def test_constructor_default_values(self):
+        array = ChunkedArray(size=5, default_item_value=7, block_size=2)
+        assert list(array) == [7] * 5
+        assert array.block_count == 3
+
+    def test_constructor_typed_default_is_zero(self):
+        array = ChunkedArray(size=3, dtype='float64')
+        assert array.dtype == numpy.float64
+        assert list(array) == [0.0, 0.0, 0.0]
+
+    def test_constructor_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ChunkedArray(size=-1)
+        with pytest.raises(ValueError):
+            ChunkedArray(block_size=0)
+        with pytest.raises(TypeError):
+            ChunkedArray(dtype='complex128')
+
+    #testing getitem and setitem
+    def test_getitem_across_blocks(self):
+        array = ChunkedArray.from_list(list(range(10)), block_size=3)
+        assert [array[i] for i in range(10)] == list(range(10))
+
+    def test_setitem(self):
+        array = ChunkedArray.from_list(['a', 'b', 'c'], block_size=2)
+        array[2] = 'z'
+        assert list(array) == ['a', 'b', 'z']
+
+    def test_index_out_of_bounds(self):
+        array = ChunkedArray.from_list([1, 2, 3])
+        with pytest.raises(IndexError):
+            array[3]
+        with pytest.raises(IndexError):
+            array[-1]
+        with pytest.raises(IndexError):
+            array[3] = 0
+
+    def test_getitem_slice(self):
+        array = ChunkedArray.from_list(list(range(10)), dtype='int64', block_size=3)
+        array.prepend(-1)
+        part = array[2:9:3]
+        assert isinstance(part, ChunkedArray)
+        assert list(part) == [1, 4, 7]
+        assert part.dtype == numpy.int64
+        assert part.block_size == 3
+        assert list(array[::-4]) == [9, 5, 1]
+        assert list(array[-2:]) == [8, 9]
+        assert len(array[5:2]) == 0
+
+    def test_getitem_slice_is_a_copy(self):
+        array = ChunkedArray.from_list(['a', 'b', 'c'], block_size=2)
+        part = array[:2]
+        part[0] = 'z'
+        assert array[0] == 'a'
+
+    #testing append, prepend and extend
+    def test_append_allocates_one_block_at_a_time(self):
+        array = ChunkedArray(block_size=4)
+        for i in range(9):
+            array.append(i)
+        assert list(array) == list(range(9))
+        assert array.block_count == 3
+
+    def test_append_keeps_existing_blocks(self):
+        array = ChunkedArray.from_list([1, 2], block_size=2)
+        first_block = array._blocks[0]
+        array.append(3)
+        assert array._blocks[0] is first_block
+
+    def test_prepend(self):
+        array = ChunkedArray(block_size=2)
+        for i in range(5):
+            array.prepend(i)
+        assert list(array) == [4, 3, 2, 1, 0]
+        assert array[0] == 4
+
+    def test_prepend_does_not_shift_directory(self):
+        array = ChunkedArray(block_size=2)
+        for i in range(40):
+            array.prepend(i)
+        assert list(array) == list(range(39, -1, -1))
+        assert array.block_count == 20
+        # the front slots are doubled, so they ran out only log2(20) times, not once per block
+        assert len(array._blocks) - array.block_count <= array.block_count
+        array.append(-1)
+        assert array[40] == -1
+
+    def test_prepend_then_delete_front(self):
+        array = ChunkedArray(block_size=2)
+        for i in range(9):
+            array.prepend(i)
+        for _ in range(7):
+            del array[0]
+        assert list(array) == [1, 0]
+        assert array.block_count == 1
+        array.prepend('x')
+        assert list(array) == ['x', 1, 0]
+
+    def test_queue_usage_keeps_directory_small(self):
+        array = ChunkedArray(block_size=2)
+        for i in range(1000):
+            array.append(i)
+            if len(array) > 5:
+                del array[0]
+        assert list(array) == list(range(995, 1000))
+        assert len(array._blocks) <= 2 * array.block_count + 1
+
+    def test_extend_typed(self):
+        array = ChunkedArray(dtype='int32', block_size=4)
+        array.extend(i * i for i in range(10))
+        assert list(array) == [i * i for i in range(10)]
+
+    def test_from_list_requires_list(self):
+        with pytest.raises(TypeError):
+            ChunkedArray.from_list((1, 2))
+
+    #testing resize
+    def test_resize_grow_and_shrink(self):
+        array = ChunkedArray.from_list([1, 2, 3], block_size=2)
+        array.resize(6, default_value=9)
+        assert list(array) == [1, 2, 3, 9, 9, 9]
+        array.resize(1)
+        assert list(array) == [1]
+        assert array.block_count <= 2
+
+    def test_resize_negative(self):
+        with pytest.raises(ValueError):
+            ChunkedArray().resize(-1)
+
+    #testing delete
+    def test_delete_front_half(self):
+        array = ChunkedArray.from_list(list(range(7)), block_size=3)
+        del array[1]
+        assert list(array) == [0, 2, 3, 4, 5, 6]
+
+    def test_delete_back_half(self):
+        array = ChunkedArray.from_list(list(range(7)), block_size=3)
+        del array[5]
+        assert list(array) == [0, 1, 2, 3, 4, 6]
+
+    def test_delete_until_empty(self):
+        array = ChunkedArray.from_list(list(range(5)), block_size=2)
+        while len(array):
+            del array[len(array) // 2]
+        assert array.block_count <= 1
+
+    def test_delete_out_of_bounds(self):
+        with pytest.raises(IndexError):
+            del ChunkedArray.from_list([1])[1]
+
+    #testing bulk delete and sort
+    def test_delete_many(self):
+        array = ChunkedArray.from_list(list(range(10)), block_size=3)
+        array.prepend(-1)
+        assert array.delete_many([0, 5, 5, 10]) == 3
+        assert list(array) == [0, 1, 2, 3, 5, 6, 7, 8]
+        assert array.delete_many([]) == 0
+        with pytest.raises(IndexError):
+            array.delete_many([8])
+
+    def test_remove_where(self):
+        array = ChunkedArray.from_list(list(range(9)), dtype='int64', block_size=2)
+        assert array.remove_where(numpy.asarray(array) % 3 == 0) == 3
+        assert list(array) == [1, 2, 4, 5, 7, 8]
+        assert array.remove_where([False] * 6) == 0
+        assert array.remove_where([True] * 6) == 6
+        assert len(array) == 0 and array.block_count <= 1
+        with pytest.raises(ValueError):
+            array.remove_where([True])
+
+    def test_removed_slots_reset_to_default(self):
+        array = ChunkedArray.from_list(['a', 'b', 'c'], block_size=4)
+        array.remove_where([True, False, False])
+        assert list(array._blocks[0]) == ['b', 'c', None, None]
+
+    def test_sort(self):
+        items = [5, 3, 9, 1, 7, 3]
+        array = ChunkedArray.from_list(items, dtype='int64', block_size=2)
+        array.sort()
+        assert list(array) == sorted(items)
+        array.sort(reverse=True)
+        assert list(array) == sorted(items, reverse=True)
+
+    def test_sort_with_key_after_prepend(self):
+        array = ChunkedArray.from_list(['pear', 'fig'], block_size=2)
+        array.prepend('apple')
+        array.sort(key=len)
+        assert list(array) == ['fig', 'pear', 'apple']
+
+    #testing equality
+    def test_equality(self):
+        assert ChunkedArray.from_list([1, 2, 3], block_size=1) == ChunkedArray.from_list([1, 2, 3], block_size=8)
+        assert ChunkedArray.from_list([1, 2, 3]) == Array.from_list([1, 2, 3])
+        assert ChunkedArray.from_list([1, 2]) != ChunkedArray.from_list([1, 2, 3])
+
+    def test_equality_type_error(self):
+        with pytest.raises(TypeError):
+            ChunkedArray() == [1]
+
+    #testing iteration and membership
+    def test_reversed(self):
+        array = ChunkedArray.from_list(list(range(5)), block_size=2)
+        array.prepend(-1)
+        assert list(reversed(array)) == [4, 3, 2, 1, 0, -1]
+
+    def test_contains(self):
+        array = ChunkedArray.from_list(['a', 'b', 'c'], block_size=2)
+        assert 'c' in array
+        assert 'z' not in array
+        assert array.__does_not_contain__('z')
+
+    def test_index(self):
+        array = ChunkedArray.from_list(['a', 'b', 'c', 'b'], block_size=2)
+        array.prepend('z')
+        assert array.index('b') == 2
+        assert array.index('z') == 0
+        with pytest.raises(ValueError):
+            array.index('q')
+
+    def test_count_and_find_all(self):
+        array = ChunkedArray.from_list([1, 2, 1, 3, 1], dtype='int64', block_size=2)
+        array.prepend(1)
+        assert array.count(1) == 4
+        assert array.count(7) == 0
+        assert list(array.find_all(1)) == [0, 1, 3, 5]
+        assert len(ChunkedArray().find_all(1)) == 0
+
+    def test_find_all_matches_array(self):
+        items = [(1, 2), 'x', None, (1, 2), 3]
+        chunked = ChunkedArray.from_list(items, block_size=2)
+        assert list(chunked.find_all((1, 2))) == list(Array.from_list(items).find_all((1, 2)))
+        assert chunked.count(None) == 1
+
+    def test_capacity(self):
+        array = ChunkedArray(size=5, block_size=4)
+        assert array.capacity == 8
+        array.prepend(0)
+        assert array.capacity == 12
+        array.clear()
+        assert array.capacity == 0
+
+    #testing clear and numpy conversion
+    def test_clear(self):
+        array = ChunkedArray.from_list([1, 2, 3])
+        array.clear()
+        assert len(array) == 0
+        assert array.block_count == 0
+        array.append(4)
+        assert list(array) == [4]
+
+    def test_asarray(self):
+        array = ChunkedArray.from_list([1.0, 2.0, 3.0], dtype='float64', block_size=2)
+        array.prepend(0.0)
+        assert numpy.array_equal(numpy.asarray(array), [0.0, 1.0, 2.0, 3.0])
+        with pytest.raises(ValueError):
+            numpy.asarray(array, copy=False)
@@ -0,0 +1,219 @@
+from datastructures.array import Array
+from datastructures.concurrent_array import ConcurrentArray
+from datastructures.read_write_lock import ReadWriteLock
+import pytest
+import threading
+import time
+
+
+class TestReadWriteLock:
+    def test_readers_share_the_lock(self):
+        lock = ReadWriteLock()
+        lock.acquire_read()
+        lock.acquire_read()
+        assert lock.readers == 2
+        lock.release_read()
+        lock.release_read()
+        assert lock.readers == 0
+
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        lock.acquire_write()
+        entered = threading.Event()
+
+        def reader():
+            with lock.read_locked():
+                entered.set()
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        assert not entered.wait(0.05)
+        lock.release_write()
+        thread.join(timeout=5)
+        assert entered.is_set()
+
+    def test_waiting_writer_blocks_new_readers(self):
+        lock = ReadWriteLock()
+        lock.acquire_read()
+        writer = threading.Thread(target=lambda: (lock.acquire_write(), lock.release_write()))
+        writer.start()
+        while not lock._waiting_writers:
+            time.sleep(0.001)
+        reader_entered = threading.Event()
+        reader = threading.Thread(target=lambda: (lock.acquire_read(), reader_entered.set(), lock.release_read()))
+        reader.start()
+        assert not reader_entered.wait(0.05)
+        lock.release_read()
+        writer.join(timeout=5)
+        reader.join(timeout=5)
+        assert reader_entered.is_set()
+
+    def test_mutex_read_waits_for_writer(self):
+        lock = ReadWriteLock()
+        lock.acquire_write()
+        entered = threading.Event()
+
+        def short_reader():
+            with lock.mutex:
+                lock.wait_for_writers()
+                entered.set()
+
+        thread = threading.Thread(target=short_reader)
+        thread.start()
+        assert not entered.wait(0.05)
+        lock.release_write()
+        thread.join(timeout=5)
+        assert entered.is_set()
+
+    def test_release_without_acquire(self):
+        lock = ReadWriteLock()
+        with pytest.raises(RuntimeError):
+            lock.release_read()
+        with pytest.raises(RuntimeError):
+            lock.release_write()
+
+
+class TestConcurrentArray:
+    #testing constructor
+    def test_constructor(self):
+        array = ConcurrentArray(size=2, default_item_value=0, dtype='int64')
+        assert list(array) == [0, 0]
+        assert array.dtype == 'int64'
+
+    def test_wrap(self):
+        array = ConcurrentArray.wrap(Array.from_list([1, 2]))
+        assert array == Array.from_list([1, 2])
+        with pytest.raises(TypeError):
+            ConcurrentArray.wrap([1, 2])
+
+    #testing item access
+    def test_getitem_and_setitem(self):
+        array = ConcurrentArray.from_list(['a', 'b'])
+        array[1] = 'z'
+        assert array[1] == 'z'
+        with pytest.raises(IndexError):
+            array[2]
+
+    def test_slice_is_a_copy(self):
+        array = ConcurrentArray.from_list([1, 2, 3])
+        part = array[1:]
+        assert isinstance(part, Array)
+        part[0] = 20
+        assert array[1] == 2
+
+    #testing writes
+    def test_extend_delete_resize_clear(self):
+        array = ConcurrentArray(dtype='int64')
+        array.extend(x for x in range(5))
+        del array[0]
+        assert array.delete_many([0, 1]) == 2
+        assert list(array) == [3, 4]
+        array.resize(3)
+        assert list(array) == [3, 4, 0]
+        array.sort(reverse=True)
+        assert list(array) == [4, 3, 0]
+        array.clear()
+        assert len(array) == 0
+
+    def test_batch(self):
+        array = ConcurrentArray()
+        with array.batch() as items:
+            items.append('a')
+            items.append('b')
+        assert list(array) == ['a', 'b']
+
+    #testing reads
+    def test_search(self):
+        array = ConcurrentArray.from_list(['a', 'b', 'a'])
+        assert 'a' in array
+        assert array.__does_not_contain__('z')
+        assert array.index('b') == 1
+        assert array.count('a') == 2
+        assert list(array.find_all('a')) == [0, 2]
+
+    def test_read(self):
+        array = ConcurrentArray.from_list([1, 2])
+        with array.read() as items:
+            assert items[len(items) - 1] == 2
+
+    def test_iteration_survives_concurrent_writes(self):
+        array = ConcurrentArray.from_list([1, 2, 3])
+        seen = []
+        for item in array:
+            array.append(item)
+            seen.append(item)
+        assert seen == [1, 2, 3]
+        assert len(array) == 6
+
+    def test_equality(self):
+        assert ConcurrentArray.from_list([1]) == ConcurrentArray.from_list([1])
+        assert ConcurrentArray.from_list([1]) != Array.from_list([2])
+        with pytest.raises(TypeError):
+            ConcurrentArray.from_list([1]) == [1]
+
+    def test_short_reads_wait_for_writer(self):
+        array = ConcurrentArray.from_list([1, 2])
+        results = []
+        with array.batch() as items:
+            thread = threading.Thread(target=lambda: results.append((array[0], len(array), 1 in array)))
+            thread.start()
+            time.sleep(0.05)
+            assert results == []
+            items[0] = 5
+        thread.join(timeout=5)
+        assert results == [(5, 2, False)]
+
+    #testing concurrency
+    def test_stale_index_rebuilt_under_write_lock(self):
+        items = Array.from_list([value % 50 for value in range(500)], dtype='int64')
+        items.build_index()
+        array = ConcurrentArray.wrap(items)
+        rebuilt_while = []
+
+        def build_index():
+            rebuilt_while.append(array._lock.writing)
+            Array.build_index(items)
+
+        items.build_index = build_index
+        errors = []
+        stop = threading.Event()
+
+        def invalidate():
+            for _ in range(200):
+                with array.batch() as batch:
+                    batch.invalidate_index()
+                time.sleep(0)
+            stop.set()
+
+        def look_up():
+            while not stop.is_set():
+                if array.count(7) != 10 or array.index(7) != 7 or 49 not in array:
+                    errors.append('wrong result')
+                if list(array.find_all(3)) != list(range(3, 500, 50)):
+                    errors.append('wrong positions')
+
+        threads = [threading.Thread(target=invalidate)] + [threading.Thread(target=look_up) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        assert errors == []
+        assert rebuilt_while and all(rebuilt_while)
+
+    def test_concurrent_appends_lose_nothing(self):
+        array = ConcurrentArray(dtype='int64')
+
+        def append_many(start):
+            for value in range(start, start + 2000):
+                array.append(value)
+            array.extend(range(start, start + 100))
+
+        threads = [threading.Thread(target=append_many, args=(start * 10000,)) for start in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(array) == 8 * 2100
+        assert sorted(array) == sorted(
+            [value for start in range(8) for value in list(range(start * 10000, start * 10000 + 2000))
+             + list(range(start * 10000, start * 10000 + 100))])
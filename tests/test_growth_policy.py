@@ -0,0 +1,60 @@
+from datastructures.growth_policy import GrowthPolicy, DoublingGrowth, FactorGrowth, ChunkGrowth
+import pytest
+
+
+class TestGrowthPolicy:
+    #testing doubling
+    def test_doubling_grows_to_power_of_two(self):
+        policy = DoublingGrowth()
+        assert policy.grow(capacity=4, required=5) == 8
+        assert policy.grow(capacity=4, required=20) == 32
+
+    def test_doubling_from_empty(self):
+        assert DoublingGrowth().grow(capacity=0, required=1) == 1
+
+    #testing factor
+    def test_factor_grows_by_factor(self):
+        assert FactorGrowth(1.5).grow(capacity=100, required=101) == 150
+
+    def test_factor_always_makes_progress(self):
+        assert FactorGrowth(1.1).grow(capacity=1, required=2) == 2
+
+    def test_factor_must_be_greater_than_one(self):
+        with pytest.raises(ValueError):
+            FactorGrowth(1)
+
+    #testing chunk
+    def test_chunk_grows_by_whole_chunks(self):
+        assert ChunkGrowth(10).grow(capacity=20, required=35) == 40
+
+    def test_chunk_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            ChunkGrowth(0)
+
+    def test_chunk_shrink_keeps_one_spare_chunk(self):
+        assert ChunkGrowth(10).shrink(capacity=100, size=45) == 60
+        assert ChunkGrowth(10).shrink(capacity=100, size=85) is None
+
+    #testing shrink hysteresis
+    def test_shrink_only_below_threshold(self):
+        policy = DoublingGrowth()
+        assert policy.shrink(capacity=100, size=26) is None
+        assert policy.shrink(capacity=100, size=25) == 50
+
+    def test_shrink_disabled(self):
+        assert DoublingGrowth(shrink_threshold=0).shrink(capacity=100, size=0) is None
+
+    def test_invalid_shrink_threshold(self):
+        with pytest.raises(ValueError):
+            DoublingGrowth(shrink_threshold=0.5)
+
+    def test_base_policy_cannot_be_constructed(self):
+        with pytest.raises(TypeError):
+            GrowthPolicy()
+
+    def test_subclass_without_grow_cannot_be_constructed(self):
+        class NoGrowth(GrowthPolicy):
+            pass
+
+        with pytest.raises(TypeError):
+            NoGrowth()
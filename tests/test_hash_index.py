@@ -0,0 +1,43 @@
+from datastructures.hash_index import HashIndex
+import numpy as np
+import pytest
+
+
+class TestHashIndex:
+    def test_positions_of_duplicates(self):
+        index = HashIndex(['a', 'b', 'a'])
+        assert index.positions('a') == {0, 2}
+        assert len(index) == 2
+
+    def test_missing_item_has_no_positions(self):
+        assert not HashIndex(['a']).positions('z')
+
+    def test_add_and_discard(self):
+        index = HashIndex()
+        index.add('a', 3)
+        index.discard('a', 3)
+        index.discard('b', 1)
+        assert len(index) == 0
+
+    def test_move(self):
+        index = HashIndex(['a', 'b'])
+        index.move('b', 1, 0)
+        assert index.positions('b') == {0}
+
+    def test_unhashable_item(self):
+        with pytest.raises(TypeError):
+            HashIndex([['a']])
+
+    def test_invalidate(self):
+        index = HashIndex(['a'])
+        assert not index.stale
+        index.invalidate()
+        assert index.stale
+
+    def test_nan_recorded_under_one_key(self):
+        index = HashIndex([float('nan'), 1.0, np.float64('nan')])
+        assert len(index) == 2
+        index.move(np.float64('nan'), 2, 1)
+        index.discard(float('nan'), 0)
+        assert len(index) == 2
+        assert not index.positions(float('nan'))
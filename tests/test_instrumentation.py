@@ -0,0 +1,210 @@
+from datastructures.array import Array
+from datastructures.array2d import Array2D
+from datastructures.linked_list import LinkedList
+from datastructures.mapped_array import MappedArray
+from datastructures import instrumentation
+from datastructures.instrumentation import Stats, enable, disable, stats_of, global_stats
+import json
+import pytest
+
+
+class TestInstrumentation:
+    #testing enable and disable
+    def test_enable_swaps_class_and_disable_restores(self):
+        array = Array.from_list([1, 2, 3])
+        stats = enable(array)
+        assert isinstance(array, Array)
+        assert type(array) is not Array
+        assert stats_of(array) is stats
+        assert enable(array) is stats
+        disable(array)
+        assert type(array) is Array
+        assert stats_of(array) is None
+        assert '_stats' not in array.__dict__
+
+    def test_disabled_class_is_untouched(self):
+        instrumented = Array()
+        enable(instrumented)
+        assert hasattr(type(instrumented).append, '__wrapped__')
+        assert not hasattr(Array.append, '__wrapped__')
+        assert Array._reallocate is not instrumentation._ArrayCounters._reallocate
+        assert stats_of(Array()) is None
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError):
+            enable([1, 2, 3])
+
+    def test_disable_is_noop_when_not_enabled(self):
+        array = Array()
+        disable(array)
+        assert type(array) is Array
+
+    #testing counters
+    def test_growth_and_copies_from_append(self):
+        array = Array(dtype='int64')
+        stats = enable(array)
+        for item in range(9):
+            array.append(item)
+        assert stats.growth_events == 5
+        assert stats.allocations == 5
+        assert stats.peak_capacity == 16
+        assert stats.elements_copied == 1 + 2 + 4 + 8
+        assert stats.bytes_copied == 8 * stats.elements_copied
+        assert stats.operations['append'].calls == 9
+        assert stats.operations['append'].elements_copied == 15
+        assert list(array) == list(range(9))
+
+    def test_delitem_counts_shifted_items(self):
+        array = Array.from_list(list(range(10)), dtype='int32')
+        stats = enable(array)
+        del array[3]
+        assert stats.elements_copied == 6
+        assert stats.bytes_copied == 24
+        assert stats.operations['__delitem__'].calls == 1
+
+    def test_remove_where_counts_moved_tail(self):
+        array = Array.from_list(list(range(6)), dtype='int64')
+        stats = enable(array)
+        array.remove_where([False, True, False, True, False, False])
+        assert stats.operations['remove_where'].elements_copied == 3
+        assert list(array) == [0, 2, 4, 5]
+
+    def test_nested_operations_count_once(self):
+        array = Array()
+        stats = enable(array)
+        array.extend(item for item in range(10))
+        assert stats.operations['extend'].calls == 1
+        assert 'resize' not in stats.operations
+
+    def test_copy_on_write_copy_is_counted(self):
+        array = Array.from_list([1, 2, 3], dtype='int64')
+        stats = enable(array)
+        frozen = array.snapshot()
+        array[0] = 10
+        assert stats.operations['__setitem__'].elements_copied == 3
+        assert frozen[0] == 1
+
+    def test_timing_is_recorded(self):
+        array = Array()
+        stats = enable(array)
+        array.resize(1000)
+        assert stats.operations['resize'].seconds > 0
+
+    def test_reset(self):
+        array = Array()
+        stats = enable(array)
+        array.append(1)
+        stats.reset()
+        assert stats.as_dict()['operations'] == {}
+        assert stats.allocations == 0
+
+    def test_mapped_array_growth_copies_nothing(self, tmp_path):
+        array = MappedArray(tmp_path / 'a.bin', dtype='int64')
+        stats = enable(array)
+        for item in range(5):
+            array.append(item)
+        assert stats.growth_events > 0
+        assert stats.elements_copied == 0
+        array.close()
+
+    #testing global aggregate and export
+    def test_global_aggregate(self):
+        before = global_stats().operations.get('append')
+        before_calls = before.calls if before is not None else 0
+        first, second = Array(), Array()
+        enable(first)
+        enable(second)
+        first.append(1)
+        second.append(2)
+        assert global_stats().operations['append'].calls == before_calls + 2
+
+    def test_parent_receives_counts(self):
+        parent = Stats()
+        child = Stats(parent=parent)
+        child.record_copy(4, 32, 'append')
+        child.record_allocation(8)
+        assert parent.operations['append'].bytes_copied == 32
+        assert parent.peak_capacity == 8
+
+    def test_export_json(self):
+        array = Array()
+        stats = enable(array)
+        array.append(1)
+        exported = json.loads(stats.to_json())
+        assert exported == stats.as_dict()
+        assert exported['operations']['append']['calls'] == 1
+
+    #testing other datastructures
+    def test_array2d_storage_shares_stats(self):
+        grid = Array2D(rows=2, columns=2)
+        stats = enable(grid)
+        assert stats_of(grid._items2d) is stats
+        disable(grid)
+        assert type(grid) is Array2D
+        assert type(grid._items2d) is Array
+
+    def test_array2d_operations_count_storage_allocations(self):
+        class FlatGrid(Array2D):
+            def __getitem__(self, row_index):
+                start = row_index * self._columns
+                return [self._items2d[index] for index in range(start, start + self._columns)]
+
+            def resize_rows(self, new_rows_len):
+                self._items2d.resize(new_rows_len * self._columns)
+                self._rows = new_rows_len
+
+        grid = FlatGrid(rows=2, columns=2, default_item_value=0)
+        stats = enable(grid)
+        grid.resize_rows(5)
+        assert grid[4] == [0, 0]
+        assert stats.operations['resize_rows'].calls == 1
+        assert stats.operations['__getitem__'].calls == 1
+        assert stats.growth_events == 1
+        assert stats.allocations == 1
+        assert stats.operations['resize_rows'].elements_copied == 4
+        # the storage Array's own calls run inside the Array2D operations and are not counted twice
+        assert set(stats.operations) == {'resize_rows', '__getitem__'}
+
+    def test_linked_list_operations_are_timed_only(self):
+        class ListBackedLinkedList(LinkedList):
+            def __init__(self):
+                self._items = []
+
+            def append(self, item):
+                self._items.append(item)
+
+            def prepend(self, item):
+                self._items.insert(0, item)
+
+            def pop_front(self):
+                return self._items.pop(0)
+
+            def __contains__(self, item):
+                return item in self._items
+
+        linked_list = ListBackedLinkedList()
+        stats = enable(linked_list)
+        for item in ['a', 'b']:
+            linked_list.append(item)
+        linked_list.prepend('z')
+        assert linked_list.pop_front() == 'z'
+        assert 'b' in linked_list
+        assert stats.operations['append'].calls == 2
+        assert stats.operations['prepend'].calls == 1
+        assert stats.operations['pop_front'].calls == 1
+        assert stats.operations['__contains__'].calls == 1
+        assert stats.operations['append'].seconds > 0
+        assert stats.allocations == 0
+        assert stats.elements_copied == 0
+        disable(linked_list)
+        assert type(linked_list) is ListBackedLinkedList
+
+    def test_failing_calls_are_still_counted(self):
+        # LinkedList is not implemented yet in this tree: its calls raise, but are counted and timed
+        linked_list = object.__new__(LinkedList)
+        stats = enable(linked_list)
+        with pytest.raises(NotImplementedError):
+            linked_list.prepend('a')
+        assert stats.operations['prepend'].calls == 1
+        disable(linked_list)
+        assert type(linked_list) is LinkedList
@@ -0,0 +1,124 @@
+from datastructures.array import Array
+from datastructures.array_file import HEADER_SIZE, read_header
+from datastructures.mapped_array import MappedArray
+import numpy as np
+import os
+import pytest
+
+
+class TestMappedArray:
+    @pytest.fixture
+    def path(self, tmp_path) -> str:
+        return str(tmp_path / 'array.bin')
+
+    def test_create_with_size_and_default(self, path):
+        array = MappedArray(path, size=4, default_item_value=7, dtype='int16')
+        assert list(array) == [7, 7, 7, 7]
+        assert os.path.getsize(path) == HEADER_SIZE + 4 * 2
+
+    def test_object_dtype_not_supported(self, path):
+        with pytest.raises(TypeError):
+            MappedArray(path, dtype=object)
+
+    def test_invalid_mode(self, path):
+        with pytest.raises(ValueError):
+            MappedArray(path, mode='a')
+
+    def test_append_grows_file_geometrically(self, path):
+        array = MappedArray(path, dtype='int64')
+        for i in range(5):
+            array.append(i)
+        assert array.capacity == 8
+        assert os.path.getsize(path) == HEADER_SIZE + 8 * 8
+        assert list(array) == [0, 1, 2, 3, 4]
+
+    def test_header_tracks_size_and_capacity(self, path):
+        array = MappedArray(path, dtype='float32')
+        array.extend([1.0, 2.0, 3.0])
+        array.flush()
+        header = read_header(path)
+        assert header.size == 3
+        assert header.capacity == array.capacity
+        assert header.dtype == np.float32
+
+    def test_reopen(self, path):
+        with MappedArray(path, dtype='uint8', default_item_value=9) as array:
+            array.extend([1, 2, 3])
+            del array[0]
+        reopened = MappedArray.open(path)
+        assert list(reopened) == [2, 3]
+        assert reopened.dtype == np.uint8
+        reopened.resize(3)
+        assert reopened[2] == 9
+
+    def test_reopen_is_lazy(self, path):
+        MappedArray(path, size=1000, dtype='float64').close()
+        reopened = MappedArray.open(path)
+        assert isinstance(reopened._items, np.memmap)
+        assert len(reopened) == 1000
+
+    def test_read_only(self, path):
+        MappedArray(path, size=2, dtype='int32').close()
+        array = MappedArray.open(path, mode='r')
+        with pytest.raises(ValueError):
+            array[0] = 1
+        with pytest.raises(ValueError):
+            array.append(1)
+
+    def test_open_rejects_other_files(self, path):
+        with open(path, 'wb') as file:
+            file.write(b'not an array file' * 10)
+        with pytest.raises(ValueError):
+            MappedArray.open(path)
+
+    def test_shrink_to_fit_truncates_file(self, path):
+        array = MappedArray(path, dtype='int32')
+        array.reserve(100)
+        array.append(1)
+        array.shrink_to_fit()
+        assert os.path.getsize(path) == HEADER_SIZE + 4
+
+    def test_clear(self, path):
+        array = MappedArray(path, size=10, dtype='int32')
+        array.clear()
+        array.append(5)
+        assert list(array) == [5]
+        array.close()
+        assert list(MappedArray.open(path)) == [5]
+
+    def test_equal_to_in_memory_array(self, path):
+        array = MappedArray(path, dtype='int64')
+        array.extend(range(10))
+        assert array == Array.from_list(list(range(10)), dtype='int64')
+        assert 9 in array
+        assert list(array[::3]) == [0, 3, 6, 9]
+
+    def test_pickle_reopens_file(self, path):
+        import pickle
+        array = MappedArray(path, dtype='int32')
+        array.extend([1, 2, 3])
+        restored = pickle.loads(pickle.dumps(array))
+        assert isinstance(restored, MappedArray)
+        assert restored.path == path
+        assert list(restored) == [1, 2, 3]
+
+    def test_deepcopy_is_in_memory(self, path):
+        import copy
+        array = MappedArray(path, dtype='int32')
+        array.extend([1, 2])
+        copied = copy.deepcopy(array)
+        copied[0] = 100
+        assert type(copied) is Array
+        assert array[0] == 1
+
+    def test_snapshot_is_in_memory(self, path):
+        array = MappedArray(path, dtype='int32')
+        array.extend([1, 2])
+        frozen = array.snapshot()
+        array[0] = 100
+        assert type(frozen) is Array
+        assert list(frozen) == [1, 2]
+
+    def test_saved_array_loads_as_mapped_array(self, path):
+        Array.from_list([1, 2, 3], dtype='int64').save(path)
+        assert list(MappedArray.open(path)) == [1, 2, 3]
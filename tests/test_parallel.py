@@ -0,0 +1,34 @@
+from datastructures.parallel import chunk_bounds, parallel_map, parallel_reduce
+import numpy as np
+import operator
+import pytest
+
+
+def _wrong_length(chunk):
+    return chunk[:1]
+
+
+class TestParallel:
+    def test_chunk_bounds_cover_range(self):
+        bounds = chunk_bounds(10, 4)
+        assert bounds[0][0] == 0 and bounds[-1][1] == 10
+        assert all(stop == start for (_, stop), (start, _) in zip(bounds, bounds[1:]))
+
+    def test_chunk_bounds_more_workers_than_items(self):
+        assert chunk_bounds(2, 8) == [(0, 1), (1, 2)]
+        assert chunk_bounds(0, 4) == []
+
+    def test_map_wrong_length(self):
+        with pytest.raises(ValueError):
+            parallel_map(np.arange(10, dtype=np.int64), _wrong_length, workers=2)
+        with pytest.raises(ValueError):
+            parallel_map(np.array(['a', 'b', 'c'], dtype=object), _wrong_length, workers=2)
+
+    def test_map_leaves_input_unchanged(self):
+        values = np.arange(5, dtype=np.float64)
+        parallel_map(values, np.negative, workers=2)
+        assert list(values) == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_reduce_python_function(self):
+        assert parallel_reduce(np.arange(10, dtype=np.int64), operator.mul, 1, workers=3) == 0
+        assert parallel_reduce(np.arange(1, 6, dtype=np.int64), operator.mul, 1, workers=3) == 120
@@ -0,0 +1,212 @@
+from datastructures.array import Array
+from datastructures.ring_array import RingArray
+import numpy
+import pytest
+import threading
+import time
+
+
+class TestRingArray:
+    #testing constructor
+    def test_constructor(self):
+        window = RingArray(4, dtype='float32')
+        assert len(window) == 0
+        assert window.capacity == 4
+        assert window.dtype == numpy.float32
+        assert not window.full
+
+    def test_constructor_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            RingArray(0)
+        with pytest.raises(ValueError):
+            RingArray(3, policy='drop')
+        with pytest.raises(TypeError):
+            RingArray(3, dtype='complex64')
+
+    #testing push and pop
+    def test_push_back_pop_front_fifo(self):
+        window = RingArray(3)
+        for word in ['a', 'b', 'c']:
+            window.push_back(word)
+        assert window.full
+        assert [window.pop_front() for _ in range(3)] == ['a', 'b', 'c']
+        assert len(window) == 0
+
+    def test_push_front_pop_back(self):
+        window = RingArray(3)
+        window.push_front(1)
+        window.push_front(2)
+        window.push_back(3)
+        assert list(window) == [2, 1, 3]
+        assert window.pop_back() == 3
+        assert window.pop_front() == 2
+        assert list(window) == [1]
+
+    def test_pop_empty(self):
+        window = RingArray(2)
+        with pytest.raises(IndexError):
+            window.pop_front()
+        with pytest.raises(IndexError):
+            window.pop_back()
+
+    def test_pop_resets_slot_to_default(self):
+        window = RingArray(2, default_item_value='empty')
+        window.push_back('a')
+        window.pop_front()
+        assert list(window._items) == ['empty', 'empty']
+
+    #testing overwrite policy
+    def test_overwrite_evicts_oldest(self):
+        window = RingArray(3, dtype='int64')
+        for i in range(10):
+            window.push_back(i)
+        assert list(window) == [7, 8, 9]
+
+    def test_push_front_overwrites_back(self):
+        window = RingArray(2)
+        for word in ['a', 'b', 'c']:
+            window.push_front(word)
+        assert list(window) == ['c', 'b']
+
+    #testing block policy
+    def test_block_times_out(self):
+        window = RingArray(1, policy='block')
+        window.push_back('a')
+        with pytest.raises(TimeoutError):
+            window.push_back('b', timeout=0.01)
+        assert list(window) == ['a']
+
+    def test_block_waits_for_pop(self):
+        window = RingArray(1, policy='block')
+        window.push_back('a')
+        pusher = threading.Thread(target=window.push_back, args=('b',))
+        pusher.start()
+        assert window.pop_front() == 'a'
+        pusher.join(timeout=5)
+        assert not pusher.is_alive()
+        assert list(window) == ['b']
+
+    #testing segments
+    def test_segments_contiguous(self):
+        window = RingArray(4, dtype='int64')
+        window.push_back(1)
+        window.push_back(2)
+        segments = window.segments()
+        assert len(segments) == 1
+        assert list(segments[0]) == [1, 2]
+
+    def test_segments_wrapped_are_views(self):
+        window = RingArray(4, dtype='int64')
+        for i in range(6):
+            window.push_back(i)
+        first, second = window.segments()
+        assert list(first) == [2, 3] and list(second) == [4, 5]
+        assert numpy.shares_memory(first, window._items)
+        window[0] = 20
+        assert first[0] == 20
+
+    def test_segments_empty(self):
+        assert RingArray(3).segments() == ()
+
+    #testing getitem and setitem
+    def test_getitem_wrapped(self):
+        window = RingArray(3)
+        for i in range(5):
+            window.push_back(i)
+        assert [window[i] for i in range(3)] == [2, 3, 4]
+        with pytest.raises(IndexError):
+            window[3]
+        with pytest.raises(IndexError):
+            window[-1]
+
+    def test_setitem(self):
+        window = RingArray(2)
+        window.push_back('a')
+        window[0] = 'z'
+        assert window[0] == 'z'
+        with pytest.raises(IndexError):
+            window[1] = 'b'
+
+    def test_concurrent_reads_during_push_and_pop(self):
+        window = RingArray(4, default_item_value=-1, dtype='int64', policy='block')
+        count = 2000
+        errors = []
+        done = threading.Event()
+
+        def produce():
+            for i in range(count):
+                window.push_back(i)
+
+        def consume():
+            for _ in range(count):
+                while True:
+                    try:
+                        window.pop_front()
+                        break
+                    except IndexError:
+                        time.sleep(0)
+            done.set()
+
+        def read():
+            # a pop resets its slot to -1; a read must never see that or go backwards
+            last = -1
+            while not done.is_set():
+                try:
+                    front = window[0]
+                except IndexError:
+                    time.sleep(0)
+                    continue
+                if front == -1 or front < last:
+                    errors.append((last, front))
+                last = front
+                for item in window:
+                    if item == -1:
+                        errors.append(('iter', item))
+
+        threads = [threading.Thread(target=produce), threading.Thread(target=consume),
+                   threading.Thread(target=read), threading.Thread(target=read)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        assert errors == []
+        assert len(window) == 0
+
+    #testing iteration, membership and equality
+    def test_reversed(self):
+        window = RingArray(3)
+        for i in range(4):
+            window.push_back(i)
+        assert list(reversed(window)) == [3, 2, 1]
+
+    def test_contains(self):
+        window = RingArray(2)
+        for word in ['a', 'b', 'c']:
+            window.push_back(word)
+        assert 'c' in window
+        assert 'a' not in window
+
+    def test_equality(self):
+        window = RingArray(3)
+        for i in range(5):
+            window.push_back(i)
+        assert window == Array.from_list([2, 3, 4])
+        assert window != Array.from_list([2, 3])
+        with pytest.raises(TypeError):
+            window == [2, 3, 4]
+
+    #testing clear and numpy conversion
+    def test_clear(self):
+        window = RingArray(2)
+        window.push_back('a')
+        window.clear()
+        assert len(window) == 0
+        window.push_back('b')
+        assert list(window) == ['b']
+
+    def test_asarray(self):
+        window = RingArray(3, dtype='float64')
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            window.push_back(value)
+        assert numpy.array_equal(numpy.asarray(window), [2.0, 3.0, 4.0])
+        assert numpy.asarray(RingArray(2, dtype='int8')).dtype == numpy.int8
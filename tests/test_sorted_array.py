@@ -0,0 +1,117 @@
+from datastructures.array import ArrayView
+from datastructures.sorted_array import SortedArray
+import numpy
+import pytest
+
+
+class TestSortedArray:
+    #testing constructor
+    def test_constructor_sorts(self):
+        array = SortedArray(['c', 'a', 'b'])
+        assert list(array) == ['a', 'b', 'c']
+
+    def test_constructor_typed(self):
+        array = SortedArray(range(5, 0, -1), dtype='int32')
+        assert array.dtype == numpy.int32
+        assert list(array) == [1, 2, 3, 4, 5]
+
+    def test_constructor_strings_with_trailing_nul(self):
+        items = ['a\x00', 'b', 'a']
+        array = SortedArray(items)
+        assert list(array) == sorted(items)
+        array.update(['a\x00\x00', ''])
+        assert list(array) == sorted(items + ['a\x00\x00', ''])
+
+    def test_constructor_incomparable(self):
+        with pytest.raises(TypeError):
+            SortedArray([1, 'a'])
+
+    #testing add
+    def test_add_keeps_order(self):
+        array = SortedArray(dtype='int64')
+        for value in [5, 1, 4, 1, 3]:
+            array.add(value)
+        assert list(array) == [1, 1, 3, 4, 5]
+
+    def test_add_equal_items_after_existing(self):
+        array = SortedArray()
+        array.add((1, 'a'))
+        array.add((1, 'a'))
+        array.add((0, 'z'))
+        assert list(array) == [(0, 'z'), (1, 'a'), (1, 'a')]
+
+    #testing update
+    def test_update_merges_batch(self):
+        array = SortedArray([10, 20, 30], dtype='int64')
+        array.update([35, 5, 20, 15])
+        assert list(array) == [5, 10, 15, 20, 20, 30, 35]
+
+    def test_update_empty_batch(self):
+        array = SortedArray([1, 2])
+        array.update([])
+        assert list(array) == [1, 2]
+
+    def test_update_into_empty(self):
+        array = SortedArray()
+        array.update(iter(['b', 'a']))
+        assert list(array) == ['a', 'b']
+
+    #testing contains, index and count
+    def test_contains(self):
+        array = SortedArray(['apple', 'fig', 'pear'])
+        assert 'fig' in array
+        assert 'kiwi' not in array
+        assert 3 not in array
+        assert array.__does_not_contain__('kiwi')
+
+    def test_index(self):
+        array = SortedArray([3, 1, 2, 2])
+        assert array.index(2) == 1
+        with pytest.raises(ValueError):
+            array.index(7)
+
+    def test_count(self):
+        array = SortedArray([2, 1, 2, 2], dtype='int64')
+        assert array.count(2) == 3
+        assert array.count(9) == 0
+
+    #testing range
+    def test_range_is_view(self):
+        array = SortedArray([9, 1, 5, 3, 7], dtype='int64')
+        view = array.range(3, 7)
+        assert isinstance(view, ArrayView)
+        assert list(view) == [3, 5]
+        assert numpy.shares_memory(numpy.asarray(view), numpy.asarray(array))
+
+    def test_range_empty(self):
+        array = SortedArray([1, 2, 3])
+        assert list(array.range(5, 9)) == []
+        assert list(array.range(3, 1)) == []
+
+    #testing delete and remove
+    def test_remove(self):
+        array = SortedArray(['a', 'b', 'b'])
+        array.remove('b')
+        assert list(array) == ['a', 'b']
+        with pytest.raises(ValueError):
+            array.remove('z')
+
+    def test_delitem(self):
+        array = SortedArray([3, 1, 2])
+        del array[0]
+        assert list(array) == [2, 3]
+
+    #testing equality and iteration
+    def test_equality(self):
+        assert SortedArray([2, 1]) == SortedArray([1, 2])
+        assert SortedArray([1]) != SortedArray([1, 2])
+        with pytest.raises(TypeError):
+            SortedArray([1]) == [1]
+
+    def test_reversed(self):
+        assert list(reversed(SortedArray([2, 3, 1]))) == [3, 2, 1]
+
+    def test_clear(self):
+        array = SortedArray([1, 2])
+        array.clear()
+        assert len(array) == 0
@@ -0,0 +1,172 @@
+from datastructures.array import Array
+from datastructures.sparse_array import SparseArray
+import numpy
+import pytest
+
+
+class TestSparseArray:
+    #testing constructor
+    def test_constructor_is_sparse(self):
+        vector = SparseArray(size=10_000_000, dtype='float64')
+        assert len(vector) == 10_000_000
+        assert vector.is_sparse
+        assert vector.populated == 0
+        assert vector[9_999_999] == 0.0
+
+    def test_constructor_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            SparseArray(size=-1)
+        with pytest.raises(ValueError):
+            SparseArray(density_threshold=0)
+        with pytest.raises(TypeError):
+            SparseArray(dtype='complex64')
+
+    #testing getitem and setitem
+    def test_setitem_stores_only_non_default(self):
+        vector = SparseArray(size=100, default_item_value=0)
+        vector[10] = 5
+        vector[20] = 0
+        assert vector._entries == {10: 5}
+        vector[10] = 0
+        assert vector.populated == 0
+        assert vector._entries == {}
+
+    def test_setitem_typed_cast(self):
+        vector = SparseArray(size=10, dtype='int8')
+        vector[1] = 3.0
+        assert vector[1] == 3
+        assert isinstance(vector[1], numpy.int8)
+
+    def test_index_out_of_bounds(self):
+        vector = SparseArray(size=3)
+        with pytest.raises(IndexError):
+            vector[3]
+        with pytest.raises(IndexError):
+            vector[-1] = 1
+
+    #testing dense and sparse switching
+    def test_switches_to_dense_and_back(self):
+        vector = SparseArray(size=100, default_item_value=0, density_threshold=0.1)
+        for index in range(11):
+            vector[index] = 1
+        assert not vector.is_sparse
+        assert vector.populated == 11
+        for index in range(6):
+            vector[index] = 0
+        assert not vector.is_sparse
+        vector[6] = 0
+        assert vector.is_sparse
+        assert list(vector.items()) == [(7, 1), (8, 1), (9, 1), (10, 1)]
+
+    def test_density(self):
+        vector = SparseArray(size=4)
+        vector[0] = 'x'
+        assert vector.density == 0.25
+        assert SparseArray().density == 0.0
+
+    #testing append, resize and delete
+    def test_append(self):
+        vector = SparseArray(size=2)
+        vector.append('x')
+        vector.append(None)
+        assert list(vector) == [None, None, 'x', None]
+        assert vector.populated == 1
+
+    def test_resize_grow_is_free_when_sparse(self):
+        vector = SparseArray(size=2, default_item_value=0)
+        vector[1] = 5
+        vector.resize(1_000_000)
+        assert vector.is_sparse
+        assert vector[1] == 5 and vector[999_999] == 0
+
+    def test_resize_with_non_default_fill(self):
+        vector = SparseArray(size=2, default_item_value=0)
+        vector.resize(4, default_value=7)
+        assert list(vector) == [0, 0, 7, 7]
+        assert vector.populated == 2
+
+    def test_resize_truncates(self):
+        vector = SparseArray(size=10)
+        vector[8] = 'x'
+        vector[1] = 'y'
+        vector.resize(5)
+        assert vector.populated == 1
+        assert list(vector.items()) == [(1, 'y')]
+        with pytest.raises(ValueError):
+            vector.resize(-1)
+
+    def test_delete_shifts_populated_items(self):
+        vector = SparseArray(size=1000, default_item_value=0)
+        vector[500] = 1
+        del vector[0]
+        assert len(vector) == 999
+        assert list(vector.items()) == [(499, 1)]
+        with pytest.raises(IndexError):
+            del vector[999]
+
+    #testing iteration and membership
+    def test_iteration(self):
+        vector = SparseArray(size=5, default_item_value='-')
+        vector[1] = 'a'
+        vector[3] = 'b'
+        assert list(vector) == ['-', 'a', '-', 'b', '-']
+        assert list(reversed(vector)) == ['-', 'b', '-', 'a', '-']
+
+    def test_contains(self):
+        vector = SparseArray(size=3)
+        vector[0] = 'a'
+        assert 'a' in vector
+        assert None in vector
+        assert 'b' not in vector
+        vector[1] = vector[2] = 'c'
+        assert None not in vector
+
+    #testing equality
+    def test_equality_sparse(self):
+        first, second = SparseArray(size=10**6), SparseArray(size=10**6)
+        first[10] = second[10] = 'x'
+        assert first == second
+        second[11] = 'y'
+        assert first != second
+
+    def test_equality_mixed_storage_and_array(self):
+        sparse = SparseArray(size=3, default_item_value=0, density_threshold=1.0)
+        dense = SparseArray(size=3, default_item_value=0, density_threshold=0.1)
+        sparse[1] = dense[1] = 2
+        assert sparse.is_sparse and not dense.is_sparse
+        assert sparse == dense
+        assert sparse == Array.from_list([0, 2, 0])
+        with pytest.raises(TypeError):
+            sparse == [0, 2, 0]
+
+    #testing conversion
+    def test_to_array_and_asarray(self):
+        vector = SparseArray(size=100, dtype='float32')
+        vector[2] = 1.5
+        assert vector.is_sparse
+        assert list(vector.to_array())[:4] == [0.0, 0.0, 1.5, 0.0]
+        assert numpy.asarray(vector).dtype == numpy.float32
+        with pytest.raises(ValueError):
+            numpy.asarray(vector, copy=False)
+
+    def test_clear(self):
+        vector = SparseArray(size=4)
+        vector[0] = 1
+        vector.clear()
+        assert len(vector) == 0 and vector.populated == 0
+
+    #testing conversion from Array
+    def test_from_array(self):
+        array = Array(size=10_000, default_item_value=-1, dtype='int64')
+        array[5] = 3
+        vector = SparseArray.from_array(array)
+        assert vector.is_sparse
+        assert vector.populated == 1
+        assert vector == array
+        assert vector.dtype == numpy.int64
+
+    def test_from_array_dense(self):
+        array = Array.from_list([1, 2, 0, 4])
+        vector = SparseArray.from_array(array)
+        assert not vector.is_sparse
+        assert list(vector) == [1, 2, 0, 4]